@@ -12,38 +12,33 @@ ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR
 
 import sys
 import os
-import pandas as pd
-import numpy as np
-from dotenv import load_dotenv
-
-load_dotenv('.env.development')  # take environment variables from .env.run
 
 from rdp_controller import rdp_http_controller
+from rdp_controller.rdp_resilience import CircuitBreakers, RetryPolicy
 
-def convert_pandas(json_data):
-    if not json_data:
-        raise TypeError('Received invalid (None or Empty) JSON data')
+# The DataFrame helpers live in rdp_controller.rdp_dataframe, they are re-exported here but the module (and with it
+# pandas/numpy) is only imported on first use, so importing app or the controller stays cheap.
+DATAFRAME_EXPORTS = ('CATEGORICAL_NAMES', 'CATEGORICAL_TITLE_SUFFIXES', 'COLUMNAR_META_FILE', 'CONVERT_CELL_BYTES', 'CONVERT_CHUNK_ROWS',
+    'is_categorical', 'build_column', 'concat_column', 'convert_pandas', 'iter_esg_dataframes', 'search_explore_dataframe', 'ric_metadata_dataframe', 'export_columnar',
+    'import_columnar', 'ESG_KEY_COLUMNS', 'join_esg_views')
 
-    try:
-        headers=json_data['headers'] 
-        #Get column headers/titles using lambda
-        titles=map(lambda header:header['title'], headers)
-            
-        dataArray=np.array(json_data['data'])
-        df = pd.DataFrame(data=dataArray,columns=titles)
-
-        return df
-    except Exception as exp:
-        print(f'Error converting JSON to Dataframe exception: {str(exp)}') 
-        raise TypeError('Error converting JSON to Dataframe')
+def __getattr__(name):
+    if name in DATAFRAME_EXPORTS:
+        from rdp_controller import rdp_dataframe
+        return getattr(rdp_dataframe, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 if __name__ == '__main__':
+    from dotenv import load_dotenv
+
+    load_dotenv('.env.development')  # take environment variables from .env.run
+
     username = os.getenv('RDP_USERNAME')
     password = os.getenv('RDP_PASSWORD')
     client_id = os.getenv('RDP_CLIENTID')
 
-    rdp_controller = rdp_http_controller.RDPHTTPController()
+    rdp_controller = rdp_http_controller.RDPHTTPController(retry_policy = RetryPolicy(), circuit_breakers = CircuitBreakers())
 
     base_URL = os.getenv('RDP_BASE_URL')
     auth_endpoint = base_URL + os.getenv('RDP_AUTH_URL')
@@ -65,9 +60,11 @@ if __name__ == '__main__':
         esg_data = rdp_controller.rdp_request_esg(esg_endpoint, access_token, universe)
         if not esg_data:
             print(f'No ESG data for {universe}, exiting application')
+            sys.exit(1)
         
-        esg_df = convert_pandas(esg_data)
-        esg_df = pd.DataFrame(esg_df,columns=['Instrument','Period End Date','ESG Score','ESG Combined Score','ESG Controversies Score'])
+        from rdp_controller.rdp_dataframe import convert_pandas
+
+        esg_df = convert_pandas(esg_data, columns = ['Instrument','Period End Date','ESG Score','ESG Combined Score','ESG Controversies Score'])
         print(esg_df.head())
 
         company_data = None
@@ -77,8 +74,9 @@ if __name__ == '__main__':
             'Select': 'IssuerCommonName,DocumentTitle,RCSExchangeCountryLeaf,IssueISIN,ExchangeName,ExchangeCode,SearchAllCategoryv3,RCSTRBC2012Leaf'
         }
         company_data = rdp_controller.rdp_request_search_explore(search_endpoint, access_token, search_payload)
-        if not company_data:
+        if not company_data or not company_data.get('Hits'):
             print(f'No Meta data for {universe}, exiting application')
+            sys.exit(1)
         print(f'RIC: {universe} Metadata:')
         print('\tIssuerCommonName: {}'.format(company_data['Hits'][0]['IssuerCommonName']))
         print('\tRCSExchangeCountryLeaf: {}'.format(company_data['Hits'][0]['RCSExchangeCountryLeaf']))
@@ -0,0 +1,61 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Per-request latency of RDPHTTPController.rdp_request_esg() with the pooled keep-alive session versus
+# module-level requests.get() (a new connection per call) against a local stub server.
+# Run from the project root: python -m benchmarks.bench_connection_pool [iterations]
+# Note: the stub is plain HTTP on loopback, so it only shows the TCP handshake saving. Against RDP the pooled
+# session also skips the TLS handshake, which is usually the larger part of the saving.
+
+import statistics
+import sys
+import time
+import requests
+
+from benchmarks.stub_server import start_stub_server
+from rdp_controller import rdp_http_controller
+
+def measure(call, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def report(label, timings):
+    timings = sorted(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f'{label:<24} mean {statistics.mean(timings):7.3f} ms   p50 {statistics.median(timings):7.3f} ms   p99 {p99:7.3f} ms')
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server, base_url = start_stub_server()
+    esg_url = f'{base_url}/data/environmental-social-governance/v2/views/scores-full'
+    headers = {'Authorization': 'Bearer benchmark_token'}
+    params = {'universe': 'TEST.RIC'}
+
+    def without_pool():
+        requests.get(esg_url, headers = headers, params = params).json()
+
+    with rdp_http_controller.RDPHTTPController() as controller:
+        def with_pool():
+            controller.session.get(esg_url, headers = headers, params = params).json()
+
+        # warm up both paths once
+        without_pool()
+        with_pool()
+        print(f'{iterations} ESG requests against {base_url}')
+        report('without pool (requests)', measure(without_pool, iterations))
+        report('with pool (controller)', measure(with_pool, iterations))
+
+    server.shutdown()
@@ -0,0 +1,52 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Time and memory of the typed convert_pandas() against the original np.array() based conversion on a
+# synthetic ESG payload. Run from the project root: python -m benchmarks.bench_convert_pandas [rows]
+
+import gc
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+from app import convert_pandas
+from benchmarks.esg_payload import synthetic_esg_payload
+
+# The conversion used before the typed converter: every column ends up as object dtype
+def legacy_convert_pandas(json_data):
+    titles = map(lambda header:header['title'], json_data['headers'])
+    dataArray = np.array(json_data['data'])
+    return pd.DataFrame(data=dataArray,columns=titles)
+
+def measure(label, function):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result_size = df.memory_usage(deep = True).sum()
+    print(f'{label:<36} {elapsed:8.2f} s   peak {peak / 2**20:9.1f} MiB   result {result_size / 2**20:9.1f} MiB')
+    return df
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    payload = synthetic_esg_payload(rows)
+    print(f'convert_pandas on {rows} synthetic ESG rows')
+    columns = ['Instrument', 'Period End Date', 'ESG Score', 'ESG Combined Score', 'ESG Controversies Score']
+    measure('legacy (np.array object)', lambda: legacy_convert_pandas(payload))
+    measure('legacy + column selection', lambda: pd.DataFrame(legacy_convert_pandas(payload), columns = columns))
+    measure('typed convert_pandas', lambda: convert_pandas(payload))
+    measure('typed convert_pandas(columns=...)', lambda: convert_pandas(payload, columns = columns))
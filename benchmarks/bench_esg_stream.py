@@ -0,0 +1,70 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Peak Python memory of rdp_request_esg() + convert_pandas() versus rdp_request_esg_stream() + iter_esg_dataframes()
+# for a large synthetic ESG response served by the local stub server.
+# Run from the project root: python -m benchmarks.bench_esg_stream [rows] [chunk_size]
+
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+
+from app import convert_pandas, iter_esg_dataframes
+from benchmarks.esg_payload import synthetic_esg_payload
+from benchmarks.stub_server import StubHandler, start_stub_server
+from rdp_controller import rdp_http_controller
+
+COLUMNS = ['Instrument', 'Period End Date', 'ESG Score', 'ESG Combined Score', 'ESG Controversies Score']
+
+def measure(label, function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<28} {rows:>9} rows   {elapsed:7.2f} s   peak {peak / 2**20:9.1f} MiB')
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    payload = synthetic_esg_payload(rows)
+
+    class LargeESGHandler(StubHandler):
+        esg_body = json.dumps(payload).encode('utf-8')
+
+    headers = payload['headers']
+    del payload
+    server, base_url = start_stub_server(LargeESGHandler)
+    esg_url = f'{base_url}/data/environmental-social-governance/v2/views/scores-full'
+    print(f'{len(LargeESGHandler.esg_body) / 2**20:.1f} MiB ESG response, {chunk_size} rows per chunk')
+
+    with rdp_http_controller.RDPHTTPController() as controller:
+        def full_response():
+            esg_df = convert_pandas(controller.rdp_request_esg(esg_url, 'benchmark_token', 'ALL'), columns = COLUMNS)
+            return len(esg_df)
+
+        def streamed_response():
+            total = 0
+            with controller.rdp_request_esg_stream(esg_url, 'benchmark_token', 'ALL') as esg_stream:
+                for esg_df in iter_esg_dataframes(esg_stream, chunk_size = chunk_size, headers = headers, columns = COLUMNS):
+                    total += len(esg_df)
+            return total
+
+        measure('response.json()', full_response)
+        measure('streamed chunks', streamed_response)
+
+    server.shutdown()
@@ -0,0 +1,67 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Cold-start cost of the project modules, measured in fresh interpreters with python -X importtime.
+# Reports the cumulative import time of each module (best of the runs), the wall time of 'python -c "import module"'
+# and whether pandas was pulled in. --max-ms fails the run (exit code 1) when the controller core gets slower.
+# Run from the project root: python -m benchmarks.bench_import_time [--runs 5] [--max-ms 400]
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# controller-only users should never pay for pandas/numpy
+CORE_MODULES = ['rdp_controller.rdp_http_controller', 'rdp_controller.rdp_async_http_controller', 'rdp_controller.rdp_token_manager', 'app']
+DATAFRAME_MODULES = ['rdp_controller.rdp_dataframe']
+
+# Import the module in a fresh interpreter, returns (cumulative import microseconds, wall seconds, pandas imported)
+def import_time(module):
+    code = f'import sys, {module}; print("pandas" in sys.modules)'
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd = PROJECT_ROOT, capture_output = True, text = True, check = True)
+    wall = time.perf_counter() - start
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module and parts[2].startswith(' ' + module):
+            cumulative = int(parts[1])
+    return cumulative, wall, result.stdout.strip() == 'True'
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Cold-start import time of the project modules')
+    parser.add_argument('--runs', type = int, default = 5, help = 'fresh interpreters per module (best run reported)')
+    parser.add_argument('--max-ms', type = float, default = None, help = 'fail if a core module import takes longer')
+    args = parser.parse_args()
+
+    failures = []
+    print(f'{"module":<42} {"import":>10} {"process":>10}  pandas')
+    for module in CORE_MODULES + DATAFRAME_MODULES:
+        runs = [import_time(module) for _ in range(args.runs)]
+        cumulative = min(run[0] for run in runs) / 1000
+        wall = min(run[1] for run in runs) * 1000
+        pandas_loaded = any(run[2] for run in runs)
+        print(f'{module:<42} {cumulative:8.1f} ms {wall:8.1f} ms  {"yes" if pandas_loaded else "no"}')
+        if module in CORE_MODULES:
+            if pandas_loaded:
+                failures.append(f'{module} imports pandas')
+            if args.max_ms is not None and cumulative > args.max_ms:
+                failures.append(f'{module} import takes {cumulative:.1f} ms (limit {args.max_ms} ms)')
+
+    for failure in failures:
+        print(f'REGRESSION {failure}')
+    if failures:
+        sys.exit(1)
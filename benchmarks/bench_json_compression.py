@@ -0,0 +1,67 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Bytes on the wire and time of a large ESG response with and without gzip, and the decode time of the response
+# body with requests' response.json() path (bytes -> str -> json) versus the rdp_json backend on the raw bytes.
+# Run from the project root: python -m benchmarks.bench_json_compression [rics] [periods]
+
+import json
+import statistics
+import sys
+import time
+
+from benchmarks.fake_rdp_server import start_fake_rdp_server
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_json
+from rdp_controller.rdp_metrics import RDPMetrics
+
+ESG_PATH = '/data/environmental-social-governance/v2/views/scores-full'
+
+def best_of(function, repeat = 5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings)
+
+if __name__ == '__main__':
+    rics = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    periods = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    universe = ','.join(f'RIC{index:06d}.L' for index in range(rics))
+    print(f'ESG response of {rics} RICs x {periods} periods, JSON backend: {rdp_json.JSON_BACKEND}')
+
+    body = None
+    for compress in (False, True):
+        server, base_url = start_fake_rdp_server(periods = periods, compress = compress)
+        metrics = RDPMetrics()
+        with rdp_http_controller.RDPHTTPController(metrics = metrics, verbose = False) as controller:
+            controller.rdp_request_esg(base_url + ESG_PATH, 'benchmark_token', universe)
+            metrics.reset()
+            fastest, median = best_of(lambda: controller.rdp_request_esg(base_url + ESG_PATH, 'benchmark_token', universe))
+            if body is None:
+                body = controller.session.get(base_url + ESG_PATH, params = {'universe': universe}).content
+        server.shutdown()
+        server.server_close()
+        wire_bytes = metrics.snapshot()['esg']['bytes_received'] // 5
+        label = 'gzip' if compress else 'identity'
+        print(f'{label:<10} {wire_bytes / 2**20:8.2f} MiB on the wire   request + decode best {fastest * 1000:8.1f} ms   median {median * 1000:8.1f} ms')
+
+    print(f'decode of the {len(body) / 2**20:.2f} MiB body')
+    decoders = [
+        ('json.loads(bytes.decode())', lambda: json.loads(body.decode('utf-8'))),
+        ('json.loads(bytes)', lambda: json.loads(body)),
+        (f'rdp_json.loads ({rdp_json.JSON_BACKEND})', lambda: rdp_json.loads(body))
+    ]
+    for label, decoder in decoders:
+        fastest, median = best_of(decoder)
+        print(f'{label:<32} best {fastest * 1000:8.1f} ms   median {median * 1000:8.1f} ms')
@@ -0,0 +1,53 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Memory per row of the decoded ESG rows and Search Explore hits: dict per row versus the raw JSON lists and the
+# slotted EsgScoreRow/SearchHit models. Run from the project root: python -m benchmarks.bench_models [rows]
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.esg_payload import synthetic_esg_payload
+from benchmarks.fake_rdp_server import synthetic_search_hit
+from rdp_controller.rdp_models import EsgScores, SearchHit
+
+# Build time and memory of the objects built by function (the input is allocated before tracing starts)
+def measure(label, rows, function):
+    gc.collect()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<32} {size / rows:8.1f} bytes/row   {size / 2**20:8.1f} MiB   {elapsed:6.2f} s')
+    return result
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    payload = synthetic_esg_payload(rows)
+    titles = [header['title'] for header in payload['headers']]
+    # the row values are shared by every variant, only the per-row containers are measured
+    print(f'{rows} ESG rows of {len(titles)} columns (per-row container overhead, values shared)')
+    measure('list per row (JSON)', rows, lambda: [list(row) for row in payload['data']])
+    measure('dict per row', rows, lambda: [dict(zip(titles, row)) for row in payload['data']])
+    measure('EsgScoreRow (__slots__)', rows, lambda: EsgScores.from_json(payload).rows)
+
+    hits = [synthetic_search_hit(index) for index in range(rows)]
+    print(f'{rows} Search Explore hits of {len(hits[0])} fields')
+    measure('dict per hit (JSON)', rows, lambda: [dict(hit) for hit in hits])
+    measure('SearchHit (__slots__)', rows, lambda: SearchHit.from_json(hits))
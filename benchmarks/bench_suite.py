@@ -0,0 +1,271 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Offline benchmark suite of the RDP client against the local fake RDP server (benchmarks/fake_rdp_server.py).
+# Every scenario reports throughput, p50/p99 latency and peak Python memory (tracemalloc). The results can be saved
+# as a baseline and later runs compared against it, the run fails (exit code 1) when a scenario regresses.
+# Run from the project root:
+#   python -m benchmarks.bench_suite [--scale 0.1] [--only esg_bulk,convert_pandas]
+#   python -m benchmarks.bench_suite --save benchmarks/baseline.json
+#   python -m benchmarks.bench_suite --compare benchmarks/baseline.json [--tolerance 0.25]
+# Baselines are machine specific, compare runs of the same machine only.
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from app import convert_pandas
+from benchmarks.esg_payload import synthetic_esg_payload
+from benchmarks.fake_rdp_server import AUTH_PATH, SEARCH_PATH, start_fake_rdp_server
+from rdp_controller import rdp_http_controller
+from rdp_controller.rdp_async_http_controller import AsyncRDPHTTPController
+from rdp_controller.rdp_metrics import RDPMetrics
+from rdp_controller.rdp_rate_limiter import RDPRateLimiter
+from rdp_controller.rdp_resilience import RetryPolicy
+
+ESG_PATH = '/data/environmental-social-governance/v2/views/scores-full'
+TOKEN = 'benchmark_token'
+
+# Collect the total latency of every HTTP request sent by a controller
+def request_latencies(controller):
+    latencies = []
+    metrics = RDPMetrics()
+    metrics.add_hook(lambda event: latencies.append(event['total']) if event['event'] == 'request' else None)
+    controller.metrics = metrics
+    return latencies
+
+def rics(count):
+    return [f'RIC{index:06d}.L' for index in range(count)]
+
+# Scenarios: context manager of scale yielding (workload, latencies), workload() runs the measured part and returns
+# the number of operations, latencies collects the per-operation latencies in seconds. Server start/shutdown and the
+# test data generation are not measured.
+
+@contextlib.contextmanager
+def fake_rdp_controller(**server_options):
+    server, base_url = start_fake_rdp_server(**server_options)
+    try:
+        yield base_url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+@contextlib.contextmanager
+def scenario_auth(scale):
+    with fake_rdp_controller() as base_url, rdp_http_controller.RDPHTTPController() as controller:
+        count = max(1, int(200 * scale))
+
+        def workload():
+            for _ in range(count):
+                controller.rdp_authentication(base_url + AUTH_PATH, 'user', 'password', 'client_id')
+            return count
+
+        yield workload, request_latencies(controller)
+
+@contextlib.contextmanager
+def scenario_esg_sync(scale):
+    with fake_rdp_controller() as base_url, rdp_http_controller.RDPHTTPController() as controller:
+        universe = rics(max(1, int(500 * scale)))
+
+        def workload():
+            for ric in universe:
+                controller.rdp_request_esg(base_url + ESG_PATH, TOKEN, ric)
+            return len(universe)
+
+        yield workload, request_latencies(controller)
+
+@contextlib.contextmanager
+def scenario_search_sync(scale):
+    with fake_rdp_controller() as base_url, rdp_http_controller.RDPHTTPController() as controller:
+        count = max(1, int(500 * scale))
+
+        def workload():
+            for index in range(count):
+                controller.rdp_request_search_explore(base_url + SEARCH_PATH, TOKEN, {'View': 'Entities', 'Query': f'query {index}', 'Top': 10})
+            return count
+
+        yield workload, request_latencies(controller)
+
+# 20 ms simulated network latency, batches requested concurrently
+@contextlib.contextmanager
+def scenario_esg_bulk(scale):
+    with fake_rdp_controller(latency = 0.02) as base_url, rdp_http_controller.RDPHTTPController(pool_maxsize = 8) as controller:
+        universe = rics(max(50, int(5000 * scale)))
+
+        def workload():
+            return len(controller.rdp_request_esg_bulk(base_url + ESG_PATH, TOKEN, universe, batch_size = 50, max_workers = 8)['universe'])
+
+        yield workload, request_latencies(controller)
+
+# 20 ms simulated network latency, one coroutine per RIC
+@contextlib.contextmanager
+def scenario_esg_async(scale):
+    with fake_rdp_controller(latency = 0.02) as base_url:
+        async_controller = AsyncRDPHTTPController(max_concurrency = 16)
+        universe = rics(max(1, int(500 * scale)))
+
+        async def fetch_all():
+            return await asyncio.gather(*[async_controller.rdp_request_esg(base_url + ESG_PATH, TOKEN, ric) for ric in universe])
+
+        def workload():
+            return len(asyncio.run(fetch_all()))
+
+        try:
+            yield workload, request_latencies(async_controller.controller)
+        finally:
+            async_controller.close()
+
+# 20 ms simulated network latency, Search Explore pages prefetched while the hits are consumed
+@contextlib.contextmanager
+def scenario_search_paging(scale):
+    with fake_rdp_controller(latency = 0.02, search_total = max(100, int(10000 * scale))) as base_url, rdp_http_controller.RDPHTTPController() as controller:
+
+        def workload():
+            return sum(1 for _ in controller.rdp_iter_search_explore(base_url + SEARCH_PATH, TOKEN, {'View': 'Entities', 'Query': 'all'}, prefetch = 4))
+
+        yield workload, request_latencies(controller)
+
+# 10% of the requests throttled (HTTP 429) and 5% failing (HTTP 503), 8 client threads
+@contextlib.contextmanager
+def scenario_esg_throttled(scale):
+    rate_limiter = RDPRateLimiter(rates = {'esg': (500.0, 50)}, base_delay = 0.01, max_delay = 0.1)
+    retry_policy = RetryPolicy(max_attempts = 5, backoff_base = 0.01, backoff_max = 0.1)
+    with fake_rdp_controller(throttle_rate = 0.1, error_rate = 0.05) as base_url, \
+            rdp_http_controller.RDPHTTPController(pool_maxsize = 8, rate_limiter = rate_limiter, throttle_retries = 10, retry_policy = retry_policy) as controller:
+        universe = rics(max(1, int(500 * scale)))
+
+        def workload():
+            with ThreadPoolExecutor(max_workers = 8) as executor:
+                return len(list(executor.map(lambda ric: controller.rdp_request_esg(base_url + ESG_PATH, TOKEN, ric), universe)))
+
+        yield workload, request_latencies(controller)
+
+# ops are converted rows
+@contextlib.contextmanager
+def scenario_convert_pandas(scale):
+    rows = max(1000, int(200000 * scale))
+    payload = synthetic_esg_payload(rows)
+    latencies = []
+
+    def workload():
+        for _ in range(5):
+            start = time.perf_counter()
+            convert_pandas(payload)
+            latencies.append(time.perf_counter() - start)
+        return rows * 5
+
+    yield workload, latencies
+
+SCENARIOS = {
+    'auth': scenario_auth,
+    'esg_sync': scenario_esg_sync,
+    'search_sync': scenario_search_sync,
+    'esg_bulk': scenario_esg_bulk,
+    'esg_async': scenario_esg_async,
+    'search_paging': scenario_search_paging,
+    'esg_throttled': scenario_esg_throttled,
+    'convert_pandas': scenario_convert_pandas
+}
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+# Run one scenario, returns {'ops', 'seconds', 'throughput', 'p50_ms', 'p99_ms', 'peak_mib'}
+# The workload runs twice: timed, then under tracemalloc for the peak memory (tracemalloc slows the allocations down)
+def run_scenario(scenario, scale):
+    with contextlib.redirect_stdout(io.StringIO()):
+        with scenario(scale) as (workload, latencies):
+            gc.collect()
+            start = time.perf_counter()
+            ops = workload()
+            elapsed = time.perf_counter() - start
+        with scenario(scale) as (workload, _):
+            gc.collect()
+            tracemalloc.start()
+            workload()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return {
+        'ops': ops,
+        'seconds': round(elapsed, 4),
+        'throughput': round(ops / elapsed, 2),
+        'p50_ms': round(statistics.median(latencies) * 1000, 3) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+        'peak_mib': round(peak / 2**20, 2)
+    }
+
+# Regressions of results against a baseline, a metric regresses when it is worse by more than tolerance (0.25 = 25%)
+# Returns a list of messages, empty when there is no regression
+def compare_results(baseline, results, tolerance = 0.25):
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if reference['throughput'] and result['throughput'] < reference['throughput'] * (1 - tolerance):
+            regressions.append(f'{name}: throughput {result["throughput"]} ops/s, baseline {reference["throughput"]} ops/s')
+        for metric in ('p99_ms', 'peak_mib'):
+            if reference.get(metric) and result.get(metric) is not None and result[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(f'{name}: {metric} {result[metric]}, baseline {reference[metric]}')
+    return regressions
+
+def report(name, result):
+    p50 = f'{result["p50_ms"]:9.3f}' if result['p50_ms'] is not None else f'{"-":>9}'
+    p99 = f'{result["p99_ms"]:9.3f}' if result['p99_ms'] is not None else f'{"-":>9}'
+    print(f'{name:<16} {result["ops"]:>9} ops {result["seconds"]:8.2f} s {result["throughput"]:12.1f} ops/s   p50 {p50} ms   p99 {p99} ms   peak {result["peak_mib"]:8.1f} MiB')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'RDP client benchmark suite against a local fake RDP server')
+    parser.add_argument('--scale', type = float, default = 1.0, help = 'workload size factor (e.g. 0.1 for a quick run)')
+    parser.add_argument('--only', default = '', help = 'comma separated scenario names')
+    parser.add_argument('--save', help = 'save the results as a baseline JSON file')
+    parser.add_argument('--compare', help = 'baseline JSON file to compare the results with')
+    parser.add_argument('--tolerance', type = float, default = 0.25, help = 'allowed regression ratio against the baseline')
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.only.split(',') if name.strip()] or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(unknown)}')
+
+    print(f'Python {platform.python_version()} on {platform.platform()}, scale {args.scale}')
+    results = {}
+    for name in names:
+        results[name] = run_scenario(SCENARIOS[name], args.scale)
+        report(name, results[name])
+
+    if args.save:
+        with open(args.save, 'w', encoding = 'utf-8') as baseline_file:
+            json.dump({'scale': args.scale, 'python': platform.python_version(), 'results': results}, baseline_file, indent = 2)
+        print(f'Baseline saved to {args.save}')
+
+    if args.compare:
+        with open(args.compare, 'r', encoding = 'utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get('scale') != args.scale:
+            print(f'Warning: baseline scale {baseline.get("scale")} differs from the run scale {args.scale}')
+        regressions = compare_results(baseline['results'], results, args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            sys.exit(1)
+        print(f'No regression against {args.compare}')
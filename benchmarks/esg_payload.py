@@ -0,0 +1,46 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import json
+import os
+import random
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'data')
+GRADES = ['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D+', 'D', 'D-']
+
+def load_esg_fixture():
+    with open(os.path.join(DATA_DIR, 'test_esg_fixture.json'), 'r', encoding = 'utf-8') as fixture:
+        return json.load(fixture)
+
+# Synthetic ESG scores-full payload with the fixture headers, 5 annual periods per instrument
+def synthetic_esg_payload(rows, seed = 0):
+    fixture = load_esg_fixture()
+    generator = random.Random(seed)
+    data = []
+    for index in range(rows):
+        instrument = f'RIC{index // 5:06d}.L'
+        data.append([
+            instrument,
+            f'{2021 - index % 5}-12-31',
+            generator.uniform(0, 100),
+            generator.uniform(0, 100),
+            generator.uniform(0, 100),
+            generator.uniform(0, 100),
+            generator.choice(GRADES),
+            generator.choice(GRADES),
+            generator.choice(GRADES),
+            100,
+            f'Auditor {index % 50}',
+            f'2022-06-{10 + index % 20:02d}T00:00:00'
+        ])
+    universe = [{'Instrument': f'RIC{index:06d}.L'} for index in range((rows + 4) // 5)]
+    return {'links': {'count': rows}, 'universe': universe, 'data': data, 'headers': fixture['headers']}
@@ -0,0 +1,173 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Local stand-in for the RDP Auth, ESG and Search Explore services used by the benchmarks.
+# Responses follow the tests/data fixtures but are generated for any universe (synthetic rows per requested RIC,
+# Search Explore paging over a synthetic result set of search_total hits). Latency, HTTP 503 errors and HTTP 429
+# throttling can be injected to measure the controller under realistic conditions.
+
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.esg_payload import GRADES, load_esg_fixture
+from benchmarks.stub_server import StubHandler
+
+AUTH_PATH = '/auth/oauth2/v1/token'
+ESG_PATH = '/data/environmental-social-governance/v2/views/'
+SEARCH_PATH = '/discovery/search/v1/explore'
+
+INVALID_RIC_ERROR = {'error': {'code': 412, 'description': 'Unable to resolve all requested identifiers.'}}
+
+# Synthetic ESG rows of one RIC, periods annual rows, deterministic per RIC
+def synthetic_esg_rows(ric, periods):
+    generator = random.Random(ric)
+    rows = []
+    for period in range(periods):
+        rows.append([
+            ric,
+            f'{2021 - period}-12-31',
+            generator.uniform(0, 100),
+            generator.uniform(0, 100),
+            generator.uniform(0, 100),
+            generator.uniform(0, 100),
+            generator.choice(GRADES),
+            generator.choice(GRADES),
+            generator.choice(GRADES),
+            100,
+            'Auditor',
+            '2022-06-10T00:00:00'
+        ])
+    return rows
+
+# Synthetic Search Explore hit, the RIC filter 'RIC eq ...' is answered with the requested RICs
+def synthetic_search_hit(index, ric = None):
+    return {
+        'RIC': ric or f'RIC{index:06d}.L',
+        'IssuerCommonName': f'Issuer {index}',
+        'DocumentTitle': f'Issuer {index}, Ordinary Share, Benchmark Exchange',
+        'ExchangeCode': 'BNCH',
+        'IssueISIN': f'XX{index:010d}'
+    }
+
+class FakeRDPHandler(StubHandler):
+    esg_headers = json.dumps(load_esg_fixture()['headers'])
+
+    # Injected latency, errors and throttling, returns True if the request was answered with an error
+    def _inject(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            server.requests += 1
+            draw = server.random.random()
+        if draw < server.throttle_rate:
+            with server.lock:
+                server.throttled += 1
+            self._reply(b'{"error": {"code": 429, "message": "Too many requests"}}', status = 429, headers = {'Retry-After': str(server.retry_after)})
+            return True
+        if draw < server.throttle_rate + server.error_rate:
+            with server.lock:
+                server.errors += 1
+            self._reply(b'{"error": {"code": 503, "message": "Service Unavailable"}}', status = 503)
+            return True
+        return False
+
+    def _reply(self, body, status = 200, headers = None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if self.server.compress and len(body) >= 1024 and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel = 6)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if not url.path.startswith(ESG_PATH):
+            return self._reply(b'{"error": {"code": 404, "message": "Not found"}}', status = 404)
+        if self._inject():
+            return
+        universe = parse_qs(url.query).get('universe', [''])[0]
+        rics = [ric for ric in universe.split(',') if ric]
+        if not rics or any(ric.upper().startswith('INVALID') for ric in rics):
+            return self._reply(json.dumps(INVALID_RIC_ERROR).encode('utf-8'))
+        body = self.server.esg_bodies.get(universe)
+        if body is None:
+            data = [row for ric in rics for row in synthetic_esg_rows(ric, self.server.periods)]
+            body = ('{"links": {"count": %d}, "universe": %s, "data": %s, "headers": %s}' % (
+                len(data), json.dumps([{'Instrument': ric} for ric in rics]), json.dumps(data), self.esg_headers)).encode('utf-8')
+            self.server.esg_bodies[universe] = body
+        self._reply(body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        path = urlsplit(self.path).path
+        if path == AUTH_PATH:
+            if self._inject():
+                return
+            token = {'access_token': 'fake_access_token', 'refresh_token': 'fake_refresh_token', 'expires_in': str(self.server.expires_in),
+                'scope': 'trapi', 'token_type': 'Bearer'}
+            return self._reply(json.dumps(token).encode('utf-8'))
+        if path != SEARCH_PATH:
+            return self._reply(b'{"error": {"code": 404, "message": "Not found"}}', status = 404)
+        if self._inject():
+            return
+        payload = json.loads(body or b'{}')
+        search_filter = payload.get('Filter', '')
+        if search_filter.startswith('RIC eq'):
+            rics = [clause.split("'")[1] for clause in search_filter.split(' or ')]
+            hits = [synthetic_search_hit(index, ric) for index, ric in enumerate(rics)]
+            return self._reply(json.dumps({'Total': len(hits), 'Hits': hits}).encode('utf-8'))
+        top = int(payload.get('Top', 10))
+        skip = int(payload.get('Skip', 0))
+        total = self.server.search_total
+        hits = [synthetic_search_hit(index) for index in range(skip, min(total, skip + top))]
+        self._reply(json.dumps({'Total': total, 'Hits': hits}).encode('utf-8'))
+
+class FakeRDPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # concurrent benchmark clients open many connections at once
+
+# Start the fake RDP server on a random local port in a daemon thread, returns (server, base_url)
+# latency: seconds added to every request, error_rate/throttle_rate: share of requests answered with HTTP 503/429
+# retry_after: Retry-After seconds of the HTTP 429 responses, periods: ESG rows per RIC, search_total: Search Explore hits
+# compress: gzip the responses of clients sending Accept-Encoding: gzip
+# The server counts the requests, errors and throttled responses in server.requests/errors/throttled.
+def start_fake_rdp_server(latency = 0.0, error_rate = 0.0, throttle_rate = 0.0, retry_after = 0, periods = 5, search_total = 1000, expires_in = 600, compress = False, seed = 0):
+    server = FakeRDPServer(('127.0.0.1', 0), FakeRDPHandler)
+    server.latency = latency
+    server.error_rate = error_rate
+    server.throttle_rate = throttle_rate
+    server.retry_after = retry_after
+    server.periods = periods
+    server.search_total = search_total
+    server.expires_in = expires_in
+    server.compress = compress
+    server.esg_bodies = {}  # generated ESG responses by universe, repeated requests skip the generation
+    server.random = random.Random(seed)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.errors = 0
+    server.throttled = 0
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    host, port = server.server_address
+    return server, f'http://{host}:{port}'
@@ -0,0 +1,56 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'data')
+
+def load_fixture(name):
+    with open(os.path.join(DATA_DIR, name), 'rb') as fixture:
+        return json.dumps(json.load(fixture)).encode('utf-8')
+
+# Minimal HTTP/1.1 stub that answers every GET with the ESG fixture and every POST with the Search fixture
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive capable
+    disable_nagle_algorithm = True  # headers and body are written separately, avoid the delayed-ACK stall
+    esg_body = load_fixture('test_esg_fixture.json')
+    search_body = load_fixture('test_search_fixture.json')
+
+    def _reply(self, body):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(self.esg_body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+        self._reply(self.search_body)
+
+    def log_message(self, format, *args):
+        pass
+
+# Start the stub server on a random local port in a daemon thread, returns (server, base_url)
+def start_stub_server(handler = StubHandler):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    host, port = server.server_address
+    return server, f'http://{host}:{port}'
@@ -0,0 +1,225 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.            --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# ESG pipeline runner for large RIC lists
+# usage: python pipeline.py <rics file or - for stdin> <output directory> [--batch-size 50] [--io-workers 8] [--cpu-workers N]
+# The RIC universe is requested in batches over a thread pool (I/O concurrency) that only reads the raw response
+# bodies (RDPHTTPController.rdp_request_esg_raw(), bodies over spill_bytes are passed as spool file paths), each body
+# is decoded, converted to a DataFrame and written as a columnar part in a process pool, so neither the JSON
+# decoding nor pickling decoded rows happens under the GIL of the fetch threads.
+# A batch RDP rejects (HTTP 4xx or an 'error' response) is split in halves until the invalid RICs are isolated.
+# The RICs of a batch are appended to a checkpoint file once its part is written, a restarted run skips the RICs
+# that are already done. RICs that failed (errors.jsonl) are not checkpointed and are requested again on restart.
+# At most io_workers + cpu_workers batches are fetched or converted at a time, so the fetched responses do not pile
+# up in memory while the conversion processes fall behind.
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import requests
+
+from rdp_controller import rdp_http_controller
+from rdp_controller.rdp_http_controller import ESG_BATCH_FATAL_STATUS, ResponseTooLargeError, chunk_universe
+
+CHECKPOINT_FILE = 'checkpoint.txt'
+ERRORS_FILE = 'errors.jsonl'
+PARTS_DIRECTORY = 'parts'
+SPOOL_DIRECTORY = 'spool'
+
+# Read RICs from a file or stdin ('-'), one per line or comma separated, blank lines and # comments ignored
+def read_rics(source):
+    stream = sys.stdin if source == '-' else open(source, 'r', encoding = 'utf-8')
+    try:
+        rics = []
+        for line in stream:
+            line = line.split('#', 1)[0]
+            rics.extend(ric.strip() for ric in line.split(',') if ric.strip())
+        return list(dict.fromkeys(rics))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+# RICs already completed by an earlier run
+def load_checkpoint(output_dir):
+    done = set()
+    try:
+        with open(os.path.join(output_dir, CHECKPOINT_FILE), 'r', encoding = 'utf-8') as checkpoint:
+            for line in checkpoint:
+                done.update(ric for ric in line.strip().split(',') if ric)
+    except FileNotFoundError:
+        pass
+    return done
+
+# Decode one raw batch response (bytes, or the path of a spooled body) and write it as a columnar part
+# (runs in a worker process). Returns (rows, error), error is the RDP 'error' member of a rejected batch.
+def convert_batch(body, part_directory):
+    from rdp_controller.rdp_dataframe import convert_pandas, export_columnar
+    from rdp_controller.rdp_json import loads
+    from rdp_controller.rdp_json_stream import JSONArraySpill
+
+    if isinstance(body, str):  # spooled body, the rows are converted chunk by chunk from the file
+        rows = JSONArraySpill(open(body, 'rb'))
+        try:
+            rows_stream = rows.stream()
+            for _ in rows_stream:
+                rows.length += 1
+            esg_data = {**rows_stream.members, 'data': rows}
+            return _convert_esg_data(esg_data, part_directory, convert_pandas, export_columnar)
+        finally:
+            rows.close()
+            os.remove(body)
+    return _convert_esg_data(loads(body), part_directory, convert_pandas, export_columnar)
+
+def _convert_esg_data(esg_data, part_directory, convert_pandas, export_columnar):
+    if 'error' in esg_data:
+        return 0, esg_data['error']
+    if not esg_data.get('data'):
+        return 0, None
+    esg_df = convert_pandas(esg_data)
+    export_columnar(esg_df, part_directory)
+    return len(esg_df), None
+
+# Run the pipeline, returns a summary {'rics', 'skipped', 'rows', 'errors'}
+# access_token: callable returning a valid Access Token (e.g. RDPTokenManager.get_access_token)
+def run_pipeline(controller, access_token, esg_url, rics, output_dir, batch_size = 50, io_workers = 8, cpu_workers = None, progress_interval = 5.0):
+
+    if not esg_url or not rics or not output_dir:
+        raise TypeError('Received invalid (None or Empty) arguments')
+
+    os.makedirs(os.path.join(output_dir, PARTS_DIRECTORY), exist_ok = True)
+    spool_directory = os.path.join(output_dir, SPOOL_DIRECTORY)
+    os.makedirs(spool_directory, exist_ok = True)
+    done = load_checkpoint(output_dir)
+    remaining = [ric for ric in rics if ric not in done]
+    batches = chunk_universe(remaining, batch_size) if remaining else []
+    summary = {'rics': len(rics), 'skipped': len(rics) - len(remaining), 'rows': 0, 'errors': 0}
+    print(f'ESG pipeline: {len(rics)} RICs, {summary["skipped"]} already done, {len(batches)} batches to fetch')
+
+    # Returns (body, None), or (None, (action, error)) with action 'split' (rejected universe) or 'fail'
+    def fetch(batch):
+        try:
+            return controller.rdp_request_esg_raw(esg_url, access_token(), ','.join(batch), spill_dir = spool_directory), None
+        except ResponseTooLargeError as exp:
+            return None, ('split', str(exp))
+        except requests.exceptions.HTTPError as exp:
+            status = exp.response.status_code if exp.response is not None else None
+            if status in ESG_BATCH_FATAL_STATUS:
+                raise
+            return None, ('fail' if status is None or status >= 500 else 'split', str(exp))
+        except requests.exceptions.RequestException as exp:
+            return None, ('fail', f'ESG data request failure: {exp}')
+
+    cpu_workers = cpu_workers or os.cpu_count() or 1
+    max_in_flight = io_workers + cpu_workers
+    pending = deque(batches)
+    started = time.monotonic()
+    last_report = started
+    completed_rics = 0
+    with ThreadPoolExecutor(max_workers = io_workers) as io_pool, ProcessPoolExecutor(max_workers = cpu_workers) as cpu_pool, \
+            open(os.path.join(output_dir, CHECKPOINT_FILE), 'a', encoding = 'utf-8') as checkpoint, \
+            open(os.path.join(output_dir, ERRORS_FILE), 'a', encoding = 'utf-8') as errors_file:
+
+        def report_errors(batch, error):
+            nonlocal completed_rics
+            for ric in batch:
+                errors_file.write(json.dumps({'ric': ric, 'error': error}) + '\n')
+            errors_file.flush()
+            summary['errors'] += len(batch)
+            completed_rics += len(batch)
+
+        # A rejected batch is split in halves (queued first), a single rejected RIC is reported
+        def reject(batch, error):
+            if len(batch) == 1:
+                report_errors(batch, error)
+            else:
+                middle = len(batch) // 2
+                pending.appendleft(batch[middle:])
+                pending.appendleft(batch[:middle])
+
+        fetching = {}
+        converting = {}
+        while True:
+            while pending and len(fetching) + len(converting) < max_in_flight:
+                batch = pending.popleft()
+                fetching[io_pool.submit(fetch, batch)] = batch
+            if not (fetching or converting):
+                break
+
+            finished, _ = wait(list(fetching) + list(converting), return_when = FIRST_COMPLETED)
+            for future in finished:
+                if future in fetching:
+                    batch = fetching.pop(future)
+                    body, failure = future.result()
+                    if failure is None:
+                        part_name = hashlib.sha1(','.join(batch).encode('utf-8')).hexdigest()[:16]
+                        part_directory = os.path.join(output_dir, PARTS_DIRECTORY, part_name)
+                        converting[cpu_pool.submit(convert_batch, body, part_directory)] = batch
+                    elif failure[0] == 'split':
+                        reject(batch, failure[1])
+                    else:
+                        report_errors(batch, failure[1])
+                else:
+                    batch = converting.pop(future)
+                    rows, error = future.result()
+                    if error is not None:
+                        reject(batch, error)
+                        continue
+                    summary['rows'] += rows
+                    # the RICs are only checkpointed once their part is on disk
+                    checkpoint.write(','.join(batch) + '\n')
+                    checkpoint.flush()
+                    completed_rics += len(batch)
+
+            now = time.monotonic()
+            if now - last_report >= progress_interval or not (pending or fetching or converting):
+                last_report = now
+                rate = completed_rics / max(now - started, 1e-9)
+                print(f'ESG pipeline: {completed_rics}/{len(remaining)} RICs done, {summary["rows"]} rows, {summary["errors"]} errors, {rate:.1f} RICs/s')
+
+    return summary
+
+
+if __name__ == '__main__':
+    from dotenv import load_dotenv
+    from rdp_controller.rdp_resilience import CircuitBreakers, RetryPolicy
+    from rdp_controller.rdp_token_manager import RDPTokenManager
+
+    load_dotenv('.env.development')
+
+    parser = argparse.ArgumentParser(description = 'Fetch RDP ESG data for a RIC list')
+    parser.add_argument('rics', help = 'file with the RICs (one per line or comma separated), - for stdin')
+    parser.add_argument('output', help = 'output directory (columnar parts, checkpoint and errors)')
+    parser.add_argument('--batch-size', type = int, default = 50, help = 'RICs per ESG request')
+    parser.add_argument('--io-workers', type = int, default = 8, help = 'concurrent ESG requests')
+    parser.add_argument('--cpu-workers', type = int, default = None, help = 'conversion processes (default: CPU count)')
+    args = parser.parse_args()
+
+    base_URL = os.getenv('RDP_BASE_URL')
+    auth_endpoint = base_URL + os.getenv('RDP_AUTH_URL')
+    esg_endpoint = base_URL + os.getenv('RDP_ESG_URL')
+
+    try:
+        rics = read_rics(args.rics)
+        controller = rdp_http_controller.RDPHTTPController(pool_maxsize = args.io_workers, retry_policy = RetryPolicy(), circuit_breakers = CircuitBreakers())
+        with RDPTokenManager(controller, auth_endpoint, os.getenv('RDP_USERNAME'), os.getenv('RDP_PASSWORD'), os.getenv('RDP_CLIENTID')) as token_manager:
+            summary = run_pipeline(controller, token_manager.get_access_token, esg_endpoint, rics, args.output,
+                batch_size = args.batch_size, io_workers = args.io_workers, cpu_workers = args.cpu_workers)
+        print(f'ESG pipeline finished: {summary}')
+    except Exception as exp:
+        print(f'Caught exception: {str(exp)}')
+        sys.exit(1)
@@ -0,0 +1,107 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from rdp_controller.rdp_http_controller import ESG_VIEWS, RDPHTTPController, chunk_universe, esg_view_url, merge_esg_responses
+from rdp_controller.rdp_single_flight import AsyncSingleFlight
+
+# Asyncio variant of the RDPHTTPController.
+# The coroutines run the blocking RDPHTTPController methods on a bounded worker pool that shares one pooled
+# keep-alive session, so thousands of RICs can be awaited from a single event loop (e.g. with asyncio.gather)
+# while at most max_concurrency HTTP requests are in flight. Because the same code path is used, the coroutines
+# raise exactly the same exceptions as the sync controller (TypeError, requests.exceptions.HTTPError).
+class AsyncRDPHTTPController():
+
+    # Constructor Method
+    # max_concurrency: maximum number of concurrent HTTP requests (also the connection pool size per host)
+    # session/controller: optionally share an existing requests.Session or RDPHTTPController
+    # coalesce: concurrent identical ESG/Search Explore coroutines share one upstream call (single-flight)
+    def __init__(self, max_concurrency = 10, session = None, controller = None, coalesce = False):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        self.max_concurrency = max_concurrency
+        if controller is None:
+            controller = RDPHTTPController(session = session, pool_maxsize = max_concurrency, pool_block = True)
+            self._owns_controller = True
+        else:
+            self._owns_controller = False
+        self.controller = controller
+        self._executor = ThreadPoolExecutor(max_workers = max_concurrency, thread_name_prefix = 'rdp-async')
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+
+    #for testing only
+    def get_scope(self):
+        return self.controller.get_scope()
+
+    # Run a blocking controller method on the worker pool
+    async def _run(self, method, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args))
+
+    # Coroutine version of RDPHTTPController.rdp_authentication()
+    async def rdp_authentication(self, auth_url, username, password, client_id, old_refresh_token = None):
+        return await self._run(self.controller.rdp_authentication, auth_url, username, password, client_id, old_refresh_token)
+
+    # Coroutine version of RDPHTTPController.rdp_request_esg()
+    async def rdp_request_esg(self, esg_url, access_token, universe, typed = False, start = None, end = None, periods = None):
+        if self.single_flight is not None and esg_url and access_token and universe:
+            flight_key = ('esg', esg_url, access_token, universe, typed, start, end, periods)
+            return await self.single_flight.do(flight_key, lambda: self._run(self.controller.rdp_request_esg, esg_url, access_token, universe, typed, start, end, periods))
+        return await self._run(self.controller.rdp_request_esg, esg_url, access_token, universe, typed, start, end, periods)
+
+    # Coroutine version of RDPHTTPController.rdp_request_esg_bulk(), the batches share the controller worker pool
+    async def rdp_request_esg_bulk(self, esg_url, access_token, universe, batch_size = 50, start = None, end = None, periods = None):
+
+        if not esg_url or not access_token or not universe:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        batches = chunk_universe(universe, batch_size)
+        batch_results = await asyncio.gather(*[self._run(self.controller._request_esg_batch, esg_url, access_token, batch, start, end, periods) for batch in batches])
+        return merge_esg_responses(batch_results)
+
+    # Coroutine version of RDPHTTPController.rdp_request_esg_views(), the views are requested concurrently
+    async def rdp_request_esg_views(self, esg_url, access_token, universe, views = ESG_VIEWS):
+
+        if not esg_url or not access_token or not universe or not views:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        views = list(dict.fromkeys(views))
+        responses = await asyncio.gather(*[self.rdp_request_esg(esg_view_url(esg_url, view), access_token, universe) for view in views])
+        return dict(zip(views, responses))
+
+    # Coroutine version of RDPHTTPController.rdp_request_search_explore()
+    async def rdp_request_search_explore(self, search_url, access_token, payload, typed = False):
+        if self.single_flight is not None and search_url and access_token and payload:
+            flight_key = ('search', search_url, access_token, json.dumps(payload, sort_keys = True), typed)
+            return await self.single_flight.do(flight_key, lambda: self._run(self.controller.rdp_request_search_explore, search_url, access_token, payload, typed))
+        return await self._run(self.controller.rdp_request_search_explore, search_url, access_token, payload, typed)
+
+    # Shut down the worker pool and release the pooled connections (blocks until the running requests finish)
+    def close(self):
+        self._executor.shutdown(wait = True)
+        if self._owns_controller:
+            self.controller.close()
+
+    # Coroutine version of close(), waits for the running requests on a separate thread so the event loop keeps running
+    async def aclose(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
@@ -0,0 +1,264 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.            --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# DataFrame conversion layer of the RDP responses (pandas/numpy), kept out of the HTTP client core so that
+# controller-only users do not pay the pandas/numpy import time.
+
+import os
+import json
+import uuid
+import pandas as pd
+import numpy as np
+from pandas.api.types import union_categoricals
+
+# String columns built as categoricals by the header alone (so every response and chunk of a view has the same
+# dtypes): the instrument column (repeated for every period) and the score grade columns ('... Score Grade')
+CATEGORICAL_NAMES = ('instrument',)
+CATEGORICAL_TITLE_SUFFIXES = ('Grade',)
+
+# Whether a string column is built as a categorical, categorical: optional titles overriding the header rule
+def is_categorical(header, categorical = None):
+    if categorical is not None:
+        return header.get('title') in categorical
+    return header.get('name') in CATEGORICAL_NAMES or str(header.get('title', '')).endswith(CATEGORICAL_TITLE_SUFFIXES)
+
+# Build one typed column from the RDP header metadata ('number', 'date', 'datetime', 'string')
+def build_column(header, values, categorical = None):
+    column_type = header.get('type')
+    if column_type == 'number':
+        try:
+            return np.array(values, dtype = np.float64)
+        except (TypeError, ValueError):
+            return pd.to_numeric(pd.Series(values, dtype = object), errors = 'coerce').to_numpy(dtype = np.float64)
+    if column_type in ('date', 'datetime'):
+        return pd.to_datetime(pd.Series(values, dtype = object), errors = 'coerce', format = 'ISO8601').to_numpy()
+    if column_type == 'string' and is_categorical(header, categorical):
+        return pd.Categorical(values)
+    return np.array(values, dtype = object)
+
+# Estimated bytes per cell of the conversion (transposed row pointer plus the typed value), used for memory_budget
+CONVERT_CELL_BYTES = 16
+
+# Rows per chunk when converting spilled rows (JSONArraySpill) without a memory_budget
+CONVERT_CHUNK_ROWS = 100000
+
+# Join the per-chunk arrays of one column built by build_column(), categorical chunks are unioned (sorted categories
+# like one build_column() call over all the values)
+def concat_column(header, chunks, categorical = None):
+    if not chunks:
+        return build_column(header, [], categorical)
+    if isinstance(chunks[0], pd.Categorical):
+        return union_categoricals(chunks, sort_categories = True)
+    return np.concatenate(chunks)
+
+# Convert the RDP headers/data JSON to a DataFrame, each column is built straight into a typed array
+# (float64 scores, datetime64 dates, categorical grades) based on the 'headers' metadata.
+# columns: optional list of column titles to build, other columns are never materialised
+# categorical: optional titles of the string columns to build as categoricals (default: see is_categorical())
+# memory_budget: optional bytes for the intermediate row-to-column copies, larger payloads are converted in row
+# chunks that fit the budget and joined per column instead of transposing all rows at once
+# Spilled responses (the 'data' rows are a JSONArraySpill) are always converted chunk by chunk from their file.
+def convert_pandas(json_data, columns = None, memory_budget = None, categorical = None):
+    if not json_data:
+        raise TypeError('Received invalid (None or Empty) JSON data')
+
+    try:
+        headers = json_data['headers']
+        rows = json_data['data']
+        #Get column headers/titles
+        titles = [header['title'] for header in headers]
+        selected = list(range(len(headers))) if columns is None else [titles.index(title) for title in columns]
+        spilled = hasattr(rows, 'chunks')
+
+        chunk_rows = CONVERT_CHUNK_ROWS if spilled else len(rows)
+        if memory_budget is not None and selected:
+            chunk_rows = max(1, memory_budget // (len(selected) * CONVERT_CELL_BYTES))
+
+        if not spilled and chunk_rows >= len(rows):
+            if columns is None:
+                column_values = list(zip(*rows)) if rows else [()] * len(headers)
+            else:
+                column_values = [[row[index] for row in rows] for index in selected]
+            data = {titles[index]: build_column(headers[index], values, categorical) for index, values in zip(selected, column_values)}
+        else:
+            row_chunks = rows.chunks(chunk_rows) if spilled else (rows[start:start + chunk_rows] for start in range(0, len(rows), chunk_rows))
+            column_chunks = {index: [] for index in selected}
+            for chunk in row_chunks:
+                for index in selected:
+                    column_chunks[index].append(build_column(headers[index], [row[index] for row in chunk], categorical))
+            data = {titles[index]: concat_column(headers[index], column_chunks.pop(index), categorical) for index in selected}
+
+        return pd.DataFrame(data, columns = [titles[index] for index in selected])
+    except Exception as exp:
+        print(f'Error converting JSON to Dataframe exception: {str(exp)}') 
+        raise TypeError('Error converting JSON to Dataframe')
+
+# Convert a streamed ESG response (RDPHTTPController.rdp_request_esg_stream()) to DataFrames of up to chunk_size rows
+# RDP may send 'headers' after 'data', pass the headers (e.g. from an earlier response) to keep memory bounded,
+# otherwise the rows are held back until the headers have been parsed.
+def iter_esg_dataframes(esg_stream, chunk_size = 100000, headers = None, columns = None, categorical = None):
+    if esg_stream is None:
+        raise TypeError('Received invalid (None or Empty) ESG stream')
+
+    pending = []
+    for rows in esg_stream.chunks(chunk_size):
+        chunk_headers = headers or esg_stream.members.get('headers')
+        if chunk_headers is None:
+            pending.append(rows)
+            continue
+        for pending_rows in pending:
+            yield convert_pandas({'headers': chunk_headers, 'data': pending_rows}, columns = columns, categorical = categorical)
+        pending = []
+        yield convert_pandas({'headers': chunk_headers, 'data': rows}, columns = columns, categorical = categorical)
+
+    if pending:
+        chunk_headers = headers or esg_stream.members.get('headers')
+        if chunk_headers is None:
+            raise TypeError('Error converting JSON to Dataframe: ESG stream has no headers')
+        for pending_rows in pending:
+            yield convert_pandas({'headers': chunk_headers, 'data': pending_rows}, columns = columns, categorical = categorical)
+
+# Collect Search Explore hits (e.g. from RDPHTTPController.rdp_iter_search_explore()) straight into a columnar
+# DataFrame, columns: the field names to keep (list or the 'Select' string), by default the fields of the first hit
+def search_explore_dataframe(hits, columns = None):
+    if hits is None:
+        raise TypeError('Received invalid (None or Empty) Search Explore hits')
+    if isinstance(columns, str):
+        columns = [column.strip() for column in columns.split(',')]
+
+    data = None
+    for hit in hits:
+        if data is None:
+            columns = list(columns) if columns else list(hit.keys())
+            data = {column: [] for column in columns}
+        for column in columns:
+            data[column].append(hit.get(column))
+
+    if data is None:
+        return pd.DataFrame(columns = columns or [])
+    return pd.DataFrame(data, columns = columns)
+
+# Convert the {ric: hit} result of RDPHTTPController.rdp_resolve_rics() to a RIC-indexed DataFrame
+def ric_metadata_dataframe(metadata, columns = None):
+    if metadata is None:
+        raise TypeError('Received invalid (None or Empty) RIC metadata')
+
+    df = search_explore_dataframe(metadata.values(), columns = columns)
+    df.index = pd.Index(list(metadata.keys()), name = 'RIC')
+    return df.drop(columns = 'RIC', errors = 'ignore')
+
+# Columns identifying an ESG row, the views of rdp_request_esg_views() are aligned on them
+ESG_KEY_COLUMNS = ('Instrument', 'Period End Date')
+
+# Join several ESG views ({view: esg_data} of RDPHTTPController.rdp_request_esg_views()) into one wide DataFrame
+# aligned on (Instrument, Period End Date), or on Instrument only for a view without periods.
+# A column already returned by an earlier view is taken from that view. columns: optional {view: [titles]} selection
+# how: 'outer' (default, keep the rows of every view) or 'inner' (only the rows present in all views)
+def join_esg_views(views_data, columns = None, how = 'outer'):
+    if not views_data:
+        raise TypeError('Received invalid (None or Empty) ESG views')
+
+    joined = None
+    seen = set()
+    for view, esg_data in views_data.items():
+        titles = [header['title'] for header in esg_data.get('headers', [])]
+        keys = [key for key in ESG_KEY_COLUMNS if key in titles]
+        if not keys:
+            raise TypeError(f'ESG view {view} has no Instrument column')
+        selected = [title for title in (columns or {}).get(view, titles) if title not in keys and title not in seen]
+        seen.update(selected)
+        frame = convert_pandas(esg_data, columns = keys + selected)
+        # plain object keys, categoricals with different categories per view do not merge cleanly
+        frame['Instrument'] = frame['Instrument'].astype(object)
+        if joined is None:
+            joined = frame
+        else:  # a view without periods is merged on Instrument only and broadcast over the periods
+            joined = joined.merge(frame, on = [key for key in ESG_KEY_COLUMNS if key in joined.columns and key in frame.columns], how = how)
+
+    keys = [key for key in ESG_KEY_COLUMNS if key in joined.columns]
+    return joined[keys + [title for title in joined.columns if title not in keys]].reset_index(drop = True)
+
+COLUMNAR_META_FILE = 'columns.json'
+
+# Export a convert_pandas() DataFrame to a columnar directory: one .npy file per column plus a columns.json index.
+# float/int/datetime columns are saved as they are, string and categorical columns as integer codes (with the
+# categories in columns.json) so that every column can be memory-mapped by import_columnar().
+# Re-exporting into the same directory never rewrites a file that readers may have memory-mapped: every export
+# writes new column files (named by an export version), columns.json is swapped in atomically and the column
+# files of the earlier exports are removed afterwards (open memory maps keep their data).
+def export_columnar(df, directory):
+    if df is None:
+        raise TypeError('Received invalid (None or Empty) DataFrame')
+
+    os.makedirs(directory, exist_ok = True)
+    version = uuid.uuid4().hex[:12]
+    meta = {'rows': len(df), 'version': version, 'columns': []}
+    for position, title in enumerate(df.columns):
+        column = df[title]
+        file_name = f'column_{version}_{position:04d}.npy'
+        entry = {'title': title, 'file': file_name}
+        is_array = (pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype)) or pd.api.types.is_datetime64_dtype(column.dtype)
+        if is_array:
+            np.save(os.path.join(directory, file_name), column.to_numpy(), allow_pickle = False)
+            entry['kind'] = 'array'
+        else:
+            categorical = column.astype('category') if not isinstance(column.dtype, pd.CategoricalDtype) else column
+            np.save(os.path.join(directory, file_name), categorical.cat.codes.to_numpy(), allow_pickle = False)
+            entry['kind'] = 'category'
+            entry['categories'] = [str(category) for category in categorical.cat.categories]
+        meta['columns'].append(entry)
+
+    # written last and renamed into place, a directory without columns.json is an incomplete export
+    meta_path = os.path.join(directory, COLUMNAR_META_FILE)
+    with open(f'{meta_path}.{version}.tmp', 'w', encoding = 'utf-8') as meta_file:
+        json.dump(meta, meta_file)
+    os.replace(f'{meta_path}.{version}.tmp', meta_path)
+
+    current = {entry['file'] for entry in meta['columns']}
+    for file_name in os.listdir(directory):
+        if file_name.startswith('column_') and file_name.endswith('.npy') and file_name not in current:
+            try:
+                os.remove(os.path.join(directory, file_name))
+            except OSError:  # still mapped on platforms that refuse it, removed by the next export
+                pass
+
+# Open a columnar directory written by export_columnar() as a DataFrame backed by memory-mapped column files,
+# only the requested columns are opened and the pages are shared between processes by the OS page cache.
+# mmap_mode: 'r' (read-only, default), 'c' (copy-on-write) or None to load the columns in memory
+def import_columnar(directory, columns = None, mmap_mode = 'r'):
+    try:
+        return _import_columnar(directory, columns, mmap_mode)
+    except FileNotFoundError:  # a concurrent export replaced columns.json and removed its files, read the new one
+        return _import_columnar(directory, columns, mmap_mode)
+
+def _import_columnar(directory, columns, mmap_mode):
+    try:
+        with open(os.path.join(directory, COLUMNAR_META_FILE), 'r', encoding = 'utf-8') as meta_file:
+            meta = json.load(meta_file)
+    except (OSError, ValueError) as exp:
+        print(f'Error reading columnar ESG data: {str(exp)}')
+        raise TypeError('Error reading columnar ESG data')
+
+    entries = {entry['title']: entry for entry in meta['columns']}
+    titles = list(columns) if columns is not None else list(entries)
+    unknown = [title for title in titles if title not in entries]
+    if unknown:
+        raise TypeError(f'Unknown columnar ESG columns: {unknown}')
+
+    data = {}
+    for title in titles:
+        entry = entries[title]
+        values = np.load(os.path.join(directory, entry['file']), mmap_mode = mmap_mode, allow_pickle = False)
+        if entry['kind'] == 'category':
+            values = pd.Categorical.from_codes(values, entry['categories'])
+        data[title] = values
+    return pd.DataFrame(data, columns = titles, copy = False)
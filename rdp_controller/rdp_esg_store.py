@@ -0,0 +1,245 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from rdp_controller.rdp_http_controller import chunk_universe
+
+# Local SQLite store of the latest ESG row per (instrument, period end date)
+# Each row is kept with its last update timestamp (the 'datetime' column of the ESG headers), and every
+# instrument has a high-water mark (latest update seen) and the time it was last synced. sync_esg() uses both to
+# fetch only the instruments that are new or due (see stale_instruments()), and merges rows that are newer than the
+# stored ones.
+class ESGStore():
+
+    def __init__(self, path):
+        if not path:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread = False)
+        with self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS esg_headers (id INTEGER PRIMARY KEY CHECK (id = 1), headers TEXT)')
+            self._db.execute('CREATE TABLE IF NOT EXISTS esg_rows (instrument TEXT, period_end TEXT, last_update TEXT, row TEXT, PRIMARY KEY (instrument, period_end))')
+            self._db.execute('CREATE TABLE IF NOT EXISTS esg_sync (instrument TEXT PRIMARY KEY, high_water_mark TEXT, last_synced REAL)')
+            # fiscal years already requested per instrument (also the years RDP returned no row for) and when
+            self._db.execute('CREATE TABLE IF NOT EXISTS esg_periods (instrument TEXT, period INTEGER, marked_at REAL, PRIMARY KEY (instrument, period))')
+            if 'marked_at' not in [column[1] for column in self._db.execute('PRAGMA table_info(esg_periods)')]:
+                self._db.execute('ALTER TABLE esg_periods ADD COLUMN marked_at REAL')
+
+    # Instruments of rics that are not in the store or are due for a refresh. The refresh interval of an instrument
+    # backs off with the time since its high-water mark (latest ESG update seen): backoff * (now - high_water_mark),
+    # at least max_age and at most max_interval seconds. Instruments RDP keeps updating are synced every max_age,
+    # instruments whose scores have not changed for months only every max_interval. backoff = 0 refreshes every max_age.
+    def stale_instruments(self, rics, max_age, backoff = 0.0, max_interval = None):
+        rics = list(dict.fromkeys(rics))
+        now = time.time()
+        with self._lock:
+            synced = {instrument: (high_water_mark, last_synced) for instrument, high_water_mark, last_synced in
+                self._db.execute('SELECT instrument, high_water_mark, last_synced FROM esg_sync')}
+
+        stale = []
+        for ric in rics:
+            if ric not in synced:
+                stale.append(ric)
+                continue
+            high_water_mark, last_synced = synced[ric]
+            interval = max_age
+            changed_at = self._timestamp(high_water_mark)
+            if backoff and changed_at is not None:
+                interval = max(interval, backoff * (now - changed_at))
+                if max_interval is not None:
+                    interval = min(interval, max(max_interval, max_age))
+            if now - last_synced >= interval:
+                stale.append(ric)
+        return stale
+
+    # Fiscal years held for each of rics, the years of the stored rows plus the years marked by mark_periods()
+    # max_age: seconds a marked year without rows stays covered when it is not before the latest stored period of
+    # the instrument (its scores may not be published yet), None keeps every mark. Marked years before the latest
+    # stored period are history RDP has no scores for and stay covered.
+    def covered_periods(self, rics, max_age = None):
+        covered = {}
+        limit = time.time() - max_age if max_age is not None else None
+        with self._lock:
+            for ric in dict.fromkeys(rics):
+                years = {int(period_end[:4]) for (period_end,) in self._db.execute('SELECT period_end FROM esg_rows WHERE instrument = ?', (ric,))}
+                latest = max(years, default = None)
+                for period, marked_at in self._db.execute('SELECT period, marked_at FROM esg_periods WHERE instrument = ?', (ric,)):
+                    if limit is None or (latest is not None and period < latest) or (marked_at or 0) > limit:
+                        years.add(period)
+                covered[ric] = years
+        return covered
+
+    # Mark the fiscal years start..end of rics as requested now
+    def mark_periods(self, rics, start, end):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany('INSERT OR REPLACE INTO esg_periods (instrument, period, marked_at) VALUES (?, ?, ?)',
+                [(ric, year, now) for ric in dict.fromkeys(rics) for year in range(start, end + 1)])
+
+    def high_water_mark(self, ric):
+        with self._lock:
+            row = self._db.execute('SELECT high_water_mark FROM esg_sync WHERE instrument = ?', (ric,)).fetchone()
+        return row[0] if row else None
+
+    def headers(self):
+        with self._lock:
+            row = self._db.execute('SELECT headers FROM esg_headers WHERE id = 1').fetchone()
+        return json.loads(row[0]) if row else None
+
+    # Merge an ESG response (headers/data), rows only replace stored rows with an older last update
+    # synced_rics: instruments to mark as synced now (also the requested instruments that returned no row)
+    # Returns the number of inserted or updated rows
+    def merge(self, esg_data, synced_rics = ()):
+        headers = esg_data.get('headers') or []
+        rows = esg_data.get('data') or []
+        instrument_index, period_index, update_index = self._key_columns(headers)
+
+        changed = 0
+        now = time.time()
+        with self._lock, self._db:
+            if headers:
+                self._db.execute('INSERT OR REPLACE INTO esg_headers (id, headers) VALUES (1, ?)', (json.dumps(headers),))
+            for row in rows:
+                last_update = row[update_index] if update_index is not None else None
+                cursor = self._db.execute(
+                    'INSERT INTO esg_rows (instrument, period_end, last_update, row) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT (instrument, period_end) DO UPDATE SET last_update = excluded.last_update, row = excluded.row '
+                    'WHERE esg_rows.last_update IS NULL OR excluded.last_update > esg_rows.last_update',
+                    (row[instrument_index], row[period_index], last_update, json.dumps(row)))
+                changed += cursor.rowcount
+            for ric in set(synced_rics) | {row[instrument_index] for row in rows}:
+                self._db.execute(
+                    'INSERT INTO esg_sync (instrument, high_water_mark, last_synced) '
+                    'VALUES (?, (SELECT MAX(last_update) FROM esg_rows WHERE instrument = ?), ?) '
+                    'ON CONFLICT (instrument) DO UPDATE SET high_water_mark = excluded.high_water_mark, last_synced = excluded.last_synced',
+                    (ric, ric, now))
+        return changed
+
+    # Stored rows as an ESG response (headers/data) for convert_pandas(), rics: optional instrument filter
+    # start/end: optional fiscal year window of the periods
+    def to_response(self, rics = None, start = None, end = None):
+        window = ' AND CAST(substr(period_end, 1, 4) AS INTEGER) BETWEEN ? AND ?'
+        window_args = (start if start is not None else -9999, end if end is not None else 9999)
+        with self._lock:
+            if rics is None:
+                cursor = self._db.execute('SELECT row FROM esg_rows WHERE 1' + window + ' ORDER BY instrument, period_end DESC', window_args)
+                rows = [json.loads(row) for (row,) in cursor]
+            else:
+                rows = []
+                for ric in dict.fromkeys(rics):
+                    cursor = self._db.execute('SELECT row FROM esg_rows WHERE instrument = ?' + window + ' ORDER BY period_end DESC', (ric,) + window_args)
+                    rows.extend(json.loads(row) for (row,) in cursor)
+        return {'headers': self.headers() or [], 'data': rows}
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # POSIX time of an ESG 'datetime' value (naive values are UTC), None if it is missing or invalid
+    @staticmethod
+    def _timestamp(value):
+        try:
+            moment = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo = timezone.utc)
+        return moment.timestamp()
+
+    # Indexes of the instrument, period end date and last update (the 'datetime' column) columns
+    @staticmethod
+    def _key_columns(headers):
+        instrument_index = period_index = update_index = None
+        for index, header in enumerate(headers):
+            if header.get('name') == 'instrument' or header.get('title') == 'Instrument':
+                instrument_index = index
+            elif header.get('name') == 'periodenddate' or header.get('title') == 'Period End Date':
+                period_index = index
+            elif header.get('type') == 'datetime':
+                update_index = index
+        if headers and (instrument_index is None or period_index is None):
+            raise TypeError('ESG headers have no Instrument/Period End Date columns')
+        return instrument_index, period_index, update_index
+
+# Incremental ESG sync: only the instruments of rics that are new or due are requested
+# (with RDPHTTPController.rdp_request_esg_bulk()) and merged into the store. Instruments are due after max_age
+# seconds, backed off by the time since their last ESG update (see ESGStore.stale_instruments()), so a nightly run
+# skips the instruments whose scores have not changed for a while until max_interval has passed.
+# Returns a summary {'requested', 'skipped', 'changed_rows', 'errors'}
+def sync_esg(controller, store, esg_url, access_token, rics, max_age = 24 * 60 * 60, batch_size = 50, max_workers = 4,
+        backoff = 0.1, max_interval = 7 * 24 * 60 * 60):
+
+    if not esg_url or not access_token or not rics:
+        raise TypeError('Received invalid (None or Empty) arguments')
+
+    rics = [ric for batch in chunk_universe(rics, batch_size) for ric in batch]
+    stale = store.stale_instruments(rics, max_age, backoff = backoff, max_interval = max_interval)
+    summary = {'requested': len(stale), 'skipped': len(rics) - len(stale), 'changed_rows': 0, 'errors': {}}
+    if not stale:
+        return summary
+
+    esg_data = controller.rdp_request_esg_bulk(esg_url, access_token, stale, batch_size = batch_size, max_workers = max_workers)
+    errors = esg_data.get('errors', {})
+    summary['changed_rows'] = store.merge(esg_data, synced_rics = [ric for ric in stale if ric not in errors])
+    summary['errors'] = errors
+    return summary
+
+# Plan the ESG requests of the fiscal year window start..end: the years the store already covers are left out,
+# RICs missing the same years are grouped and each group is requested with the smallest start/end window holding
+# its missing years. Years RDP returned no row for are requested again after max_age (see ESGStore.covered_periods()).
+# Returns a list of (rics, start, end) requests.
+def plan_esg_window(store, rics, start, end, max_age = None):
+    if end < start:
+        raise ValueError('end must not be before start')
+
+    covered = store.covered_periods(rics, max_age = max_age)
+    groups = {}
+    for ric in dict.fromkeys(rics):
+        missing = [year for year in range(start, end + 1) if year not in covered.get(ric, ())]
+        if missing:
+            groups.setdefault((missing[0], missing[-1]), []).append(ric)
+    return [(group, first, last) for (first, last), group in groups.items()]
+
+# History window sync: the planned requests (plan_esg_window()) are sent with start/end so RDP only returns the
+# missing periods, the rows are merged into the store. Read the window back with store.to_response(rics, start, end).
+# Recent years RDP returned no row for (e.g. not published yet) are requested again once max_age seconds passed.
+# Returns a summary {'requests', 'requested', 'skipped', 'changed_rows', 'errors'}
+def sync_esg_window(controller, store, esg_url, access_token, rics, start, end, batch_size = 50, max_workers = 4, max_age = 24 * 60 * 60):
+
+    if not esg_url or not access_token or not rics or start is None or end is None:
+        raise TypeError('Received invalid (None or Empty) arguments')
+
+    rics = [ric for batch in chunk_universe(rics, batch_size) for ric in batch]
+    plan = plan_esg_window(store, rics, start, end, max_age = max_age)
+    requested = sum(len(group) for group, _, _ in plan)
+    summary = {'requests': len(plan), 'requested': requested, 'skipped': len(rics) - requested, 'changed_rows': 0, 'errors': {}}
+
+    for group, first, last in plan:
+        esg_data = controller.rdp_request_esg_bulk(esg_url, access_token, group, batch_size = batch_size, max_workers = max_workers, start = first, end = last)
+        errors = esg_data.get('errors', {})
+        synced = [ric for ric in group if ric not in errors]
+        summary['changed_rows'] += store.merge(esg_data, synced_rics = synced)
+        store.mark_periods(synced, first, last)
+        summary['errors'].update(errors)
+    return summary
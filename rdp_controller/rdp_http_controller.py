@@ -12,15 +12,399 @@ ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR
 
 import requests
 import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
+from rdp_controller.rdp_json import DECODE_ERRORS, dumps, loads
+from rdp_controller.rdp_json_stream import JSONArrayChain, JSONArraySpill, JSONArrayStream
+from rdp_controller.rdp_metrics import TimedHTTPAdapter, connection_timings, reset_connection_timings
+from rdp_controller.rdp_models import AuthToken, EsgScores, SearchResult
+from rdp_controller.rdp_resilience import CircuitOpenError
+from rdp_controller.rdp_response_cache import RDPResponseCache
+from rdp_controller.rdp_single_flight import SingleFlight
+
+# Content codings the session accepts: gzip and deflate, plus br/zstd when urllib3 has the decoder (brotli/zstandard installed)
+ACCEPT_ENCODING = ', '.join(make_headers(accept_encoding = True)['accept-encoding'].split(','))
+
+# Raised when a response exceeds the max_response_bytes or max_rows guard of the controller
+class ResponseTooLargeError(requests.exceptions.RequestException):
+    pass
+
+# Bytes read from the socket at a time by the size-guarded reader
+READ_SIZE = 65536
+
+# HTTP status codes that affect the whole request (credentials, rate limit), a smaller universe will not fix them
+ESG_BATCH_FATAL_STATUS = (401, 403, 429)
+
+# Split an iterable of RICs (or a comma separated string) into comma-joined universe batches, duplicates removed
+def chunk_universe(universe, batch_size):
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1')
+    if isinstance(universe, str):
+        universe = universe.split(',')
+    rics = list(dict.fromkeys(ric.strip() for ric in universe if ric and ric.strip()))
+    return [rics[index:index + batch_size] for index in range(0, len(rics), batch_size)]
+
+# ESG views fetched by rdp_request_esg_views() by default
+ESG_VIEWS = ('scores-full', 'basic', 'measures-full')
+
+# ESG query parameters: the universe and the optional history window, passed through to RDP so the periods are
+# filtered on the server. start/end: first and last period (fiscal year, or relative to the latest period such
+# as -4 and 0), periods: number of periods
+def esg_params(universe, start = None, end = None, periods = None):
+    params = {'universe': universe}
+    for name, value in (('start', start), ('end', end), ('periods', periods)):
+        if value is not None:
+            params[name] = value
+    return params
+
+# URL of an ESG view, esg_url is any view URL (e.g. .../views/scores-full) or the .../views base URL
+def esg_view_url(esg_url, view):
+    base, separator, _ = esg_url.rstrip('/').rpartition('/views/')
+    if not separator:
+        base = esg_url.rstrip('/')
+        if base.endswith('/views'):
+            base = base[:-len('/views')]
+    return f'{base}/views/{view}'
+
+# Search Explore returns at most 100 hits per request
+SEARCH_MAX_TOP = 100
+
+# Build a Search Explore filter matching any of the RICs, e.g. "RIC eq 'A.L' or RIC eq 'B.L'"
+def ric_filter(rics):
+    return ' or '.join('RIC eq \'{}\''.format(ric.replace("'", "''")) for ric in rics)
+
+# Split RICs into batches whose Search Explore filter stays within batch_size RICs and max_filter_length characters
+def chunk_ric_filters(rics, batch_size, max_filter_length):
+    batches = []
+    batch = []
+    length = 0
+    for ric in rics:
+        clause_length = len(ric_filter([ric])) + (4 if batch else 0)  # ' or '
+        if batch and (len(batch) >= batch_size or length + clause_length > max_filter_length):
+            batches.append(batch)
+            batch = []
+            length = 0
+            clause_length -= 4
+        batch.append(ric)
+        length += clause_length
+    if batch:
+        batches.append(batch)
+    return batches
+
+# Stitch the ESG responses of several universe batches into one response
+# batch_results: list of (responses, errors) tuples in batch order
+# Spilled batch rows (JSONArraySpill) stay in their files, the data is then a JSONArrayChain of the batches
+def merge_esg_responses(batch_results):
+    merged = {'headers': [], 'data': [], 'universe': [], 'errors': {}}
+    parts = []
+    for responses, errors in batch_results:
+        for response in responses:
+            if not merged['headers']:
+                merged['headers'] = response.get('headers', [])
+            rows = response.get('data', [])
+            if isinstance(rows, JSONArraySpill):
+                parts.extend([merged['data'], rows] if merged['data'] else [rows])
+                merged['data'] = []
+            else:
+                merged['data'].extend(rows)
+            merged['universe'].extend(response.get('universe', []))
+        merged['errors'].update(errors)
+    if parts:
+        merged['data'] = JSONArrayChain(parts + [merged['data']] if merged['data'] else parts)
+    merged['links'] = {'count': len(merged['data'])}
+    return merged
+
+# One controller instance can be shared by any number of worker threads: the configuration (scope, client secret)
+# is read-only, each thread sends its requests through its own requests.Session while all sessions share one
+# thread-safe urllib3 connection pool, and the shared helpers (cache, single-flight, rate limiter, circuit
+# breakers, metrics) lock their own state. Token state lives in RDPTokenManager, which is also thread-safe.
 class RDPHTTPController():
 
     # Constructor Method
-    def __init__(self):
-        self.scope = 'trapi'
-        self.client_secret = ''
-        pass
-    
+    # The controller owns a keep-alive requests.Session backed by a urllib3 connection pool, so consecutive calls
+    # to the same RDP host reuse the TCP/TLS connection instead of doing a new handshake for every request.
+    # Pass your own session to share a pool between controllers (the controller will not close it for you, and
+    # every thread uses that same session).
+    # scope/client_secret: RDP Auth Service scope and client secret (read-only once the controller is created)
+    # cache: optional RDPResponseCache for the ESG and Search Explore responses
+    # coalesce: concurrent identical ESG/Search Explore requests share one upstream call (single-flight)
+    # rate_limiter: optional RDPRateLimiter shared by all threads, throttle_retries: HTTP 429 retries per request
+    # retry_policy: optional RetryPolicy, circuit_breakers: optional CircuitBreakers (one breaker per endpoint)
+    # timeout: (connect, read) timeouts in seconds for every request
+    # metrics: optional RDPMetrics collecting per-endpoint timers, byte counts, status and retry/cache counters
+    # verbose: print the status messages (set False to keep the prints off the hot path)
+    # max_response_bytes/max_rows: ESG and Search Explore responses larger than this (decoded body bytes, ESG 'data'
+    # rows or Search 'Hits') raise ResponseTooLargeError, rdp_request_esg_bulk() splits such batches further
+    # spill_bytes: response bodies larger than this are spooled to a temporary file, the response keeps all its
+    # members but its 'data'/'Hits' rows are a JSONArraySpill that parses them from the file in chunks on each
+    # iteration (convert_pandas() converts it chunk by chunk). Such responses are not cached.
+    def __init__(self, session = None, pool_connections = 10, pool_maxsize = 10, pool_block = False, max_retries = 0, backoff_factor = 0.3, cache = None, coalesce = False,
+            rate_limiter = None, throttle_retries = 3, retry_policy = None, circuit_breakers = None, timeout = (3.05, 30), metrics = None, verbose = True,
+            scope = 'trapi', client_secret = '', max_response_bytes = None, max_rows = None, spill_bytes = None):
+        self._scope = scope
+        self._client_secret = client_secret
+        self._thread_sessions = threading.local()
+        if session is None:
+            self._adapter = self._create_adapter(pool_connections, pool_maxsize, pool_block, max_retries, backoff_factor)
+            self._shared_session = None
+            self._owns_session = True
+        else:
+            self._adapter = None
+            self._shared_session = session
+            self._owns_session = False
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.rate_limiter = rate_limiter
+        self.throttle_retries = throttle_retries
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+        self.timeout = timeout
+        self.metrics = metrics
+        self.verbose = verbose
+        self.max_response_bytes = max_response_bytes
+        self.max_rows = max_rows
+        self.spill_bytes = spill_bytes
+        # per-RIC metadata of rdp_resolve_rics()
+        self.metadata_cache = cache if cache is not None else RDPResponseCache(maxsize = 100000)
+
+    @property
+    def scope(self):
+        return self._scope
+
+    @property
+    def client_secret(self):
+        return self._client_secret
+
+    # requests.Session of the calling thread (the supplied session if there is one)
+    @property
+    def session(self):
+        if self._shared_session is not None:
+            return self._shared_session
+        session = getattr(self._thread_sessions, 'session', None)
+        if session is None:
+            session = self._create_session(self._adapter)
+            self._thread_sessions.session = session
+        return session
+
+    # Create the pooled adapter shared by the thread sessions, the urllib3 pool is thread-safe
+    # pool_connections: number of per-host pools to cache, pool_maxsize: connections kept alive per host
+    # pool_block: wait for a free connection instead of opening throwaway ones when the pool is exhausted
+    @staticmethod
+    def _create_adapter(pool_connections, pool_maxsize, pool_block, max_retries, backoff_factor):
+        retry = Retry(
+            total = max_retries,
+            backoff_factor = backoff_factor,
+            status_forcelist = (500, 502, 503, 504),
+            allowed_methods = frozenset(['GET']),
+            raise_on_status = False
+        )
+        return TimedHTTPAdapter(pool_connections = pool_connections, pool_maxsize = pool_maxsize, max_retries = retry, pool_block = pool_block)
+
+    # Create a keep-alive session on the shared pooled adapter
+    @staticmethod
+    def _create_session(adapter):
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': ACCEPT_ENCODING})
+        return session
+
+    # Release the pooled connections (only if the session was created by this controller)
+    # The thread sessions hold no connections of their own, closing the shared adapter closes the pool.
+    def close(self):
+        if self._owns_session:
+            self._adapter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Print a status message unless the controller is quiet
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+
+    # Decode the (already decompressed) response body once with the fastest available JSON backend
+    @staticmethod
+    def _json(response):
+        try:
+            return loads(response.content)
+        except DECODE_ERRORS as exp:
+            raise requests.exceptions.JSONDecodeError(str(exp), response.text, 0)
+
+    # Whether the ESG/Search Explore bodies go through the size-guarded reader
+    def _guarded(self):
+        return self.max_response_bytes is not None or self.max_rows is not None or self.spill_bytes is not None
+
+    # Read a response body (requested with stream = True) within max_response_bytes, returns (buffer, spill_file):
+    # the body bytes, or (None, file) with the body written to a file from open_spill_file() once it passed spill_bytes
+    def _read_body(self, response, open_spill_file = tempfile.TemporaryFile):
+        # Content-Length is the size on the wire, it only matches the decoded size without Content-Encoding
+        content_length = response.headers.get('Content-Length')
+        identity = response.headers.get('Content-Encoding', 'identity').lower() == 'identity'
+        if self.max_response_bytes is not None and identity and content_length and content_length.isdigit() and int(content_length) > self.max_response_bytes:
+            response.close()
+            raise ResponseTooLargeError(f'Response of {content_length} bytes exceeds max_response_bytes {self.max_response_bytes}', response = response)
+
+        buffer = bytearray()
+        spill_file = None
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size = READ_SIZE):
+                size += len(chunk)
+                if self.max_response_bytes is not None and size > self.max_response_bytes:
+                    response.close()
+                    raise ResponseTooLargeError(f'Response exceeds max_response_bytes {self.max_response_bytes}', response = response)
+                if spill_file is None and self.spill_bytes is not None and size > self.spill_bytes:
+                    spill_file = open_spill_file()
+                    spill_file.write(buffer)
+                    buffer = None
+                if spill_file is not None:
+                    spill_file.write(chunk)
+                else:
+                    buffer += chunk
+        except Exception:
+            if spill_file is not None:
+                spill_file.close()
+            raise
+        return buffer, spill_file
+
+    # Read and decode a response body (requested with stream = True) within the size guards, returns (data, spilled)
+    # key: the large array member ('data' or 'Hits') left in the temporary file once the body is spilled
+    def _read_guarded_json(self, response, key):
+        buffer, spill_file = self._read_body(response)
+        try:
+            if spill_file is None:
+                try:
+                    data = loads(bytes(buffer))
+                except DECODE_ERRORS as exp:
+                    raise requests.exceptions.JSONDecodeError(str(exp), buffer.decode('utf-8', 'replace'), 0)
+                rows = data.get(key) if isinstance(data, dict) else None
+                self._check_rows(len(rows) if isinstance(rows, list) else 0, response)
+                return data, False
+
+            # One pass over the file counts the rows (enforcing max_rows) and decodes the other members
+            spilled_rows = JSONArraySpill(spill_file, key = key, encoding = response.encoding or 'utf-8', read_size = READ_SIZE)
+            rows_stream = spilled_rows.stream()
+            for _ in rows_stream:
+                spilled_rows.length += 1
+                self._check_rows(spilled_rows.length, response)
+            members = dict(rows_stream.members)
+            if key in members or 'error' in members:  # no rows array to keep in the file
+                spill_file.close()
+                return members, True
+            return {**members, key: spilled_rows}, True
+        except Exception:
+            if spill_file is not None:
+                spill_file.close()
+            raise
+
+    # Enforce max_rows on the number of rows of the response array member
+    def _check_rows(self, rows, response):
+        if self.max_rows is not None and rows > self.max_rows:
+            raise ResponseTooLargeError(f'Response exceeds max_rows {self.max_rows}', response = response)
+
+    # Record one request attempt in the metrics collector
+    def _record(self, endpoint, method, started, response = None, status = None):
+        connect, tls = connection_timings()
+        total = time.perf_counter() - started
+        bytes_sent = 0
+        bytes_received = 0
+        ttfb = total
+        if response is not None:
+            status = response.status_code
+            if response.elapsed:
+                ttfb = response.elapsed.total_seconds()
+            body = response.request.body if response.request is not None else None
+            bytes_sent = len(body) if body else 0
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit():
+                bytes_received = int(content_length)
+            elif response._content_consumed and response._content:
+                bytes_received = len(response._content)
+        self.metrics.record_request(endpoint, method, status, connect = connect, tls = tls, ttfb = ttfb, total = total,
+            bytes_sent = bytes_sent, bytes_received = bytes_received)
+
+    # Send an HTTP request of the endpoint ('auth', 'esg' or 'search') through the resilience layer:
+    # circuit breaker, rate limiter, connect/read timeouts, retry policy for connection errors and HTTP 5xx, and
+    # HTTP 429 retries after the Retry-After delay. The last response is returned to the caller for status checks.
+    def _send(self, endpoint, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        breaker = self.circuit_breakers.get(endpoint) if self.circuit_breakers is not None else None
+        attempt = 1
+        throttled = 0
+        while True:
+            if breaker is not None:
+                try:
+                    breaker.before_request()
+                except CircuitOpenError:
+                    if self.metrics is not None:
+                        self.metrics.increment(endpoint, 'circuit_open')
+                    raise
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+
+            if self.metrics is not None:
+                reset_connection_timings()
+                started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as exp:
+                if self.metrics is not None:
+                    self._record(endpoint, method, started, status = exp.__class__.__name__)
+                if breaker is not None:
+                    breaker.record_failure()
+                if self.retry_policy is None or not self.retry_policy.should_retry_exception(endpoint, exp, attempt):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                if self.metrics is not None:
+                    self.metrics.increment(endpoint, 'retry')
+                self._log(f'RDP APIs: {endpoint} request failure ({exp.__class__.__name__}), retry in {delay:.1f} seconds')
+                attempt += 1
+                time.sleep(delay)
+                continue
+
+            if self.metrics is not None:
+                self._record(endpoint, method, started, response)
+
+            if response.status_code >= 500:
+                if breaker is not None:
+                    breaker.record_failure()
+                if self.retry_policy is None or not self.retry_policy.should_retry_status(endpoint, response.status_code, attempt):
+                    return response
+                delay = self.retry_policy.delay(attempt)
+                if self.metrics is not None:
+                    self.metrics.increment(endpoint, 'retry')
+                self._log(f'RDP APIs: {endpoint} request failure (HTTP {response.status_code}), retry in {delay:.1f} seconds')
+                attempt += 1
+                response.close()
+                time.sleep(delay)
+                continue
+
+            if breaker is not None:
+                breaker.record_success()
+            if response.status_code != 429 or self.rate_limiter is None:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_success(endpoint)
+                return response
+            delay = self.rate_limiter.on_throttled(endpoint, response.headers.get('Retry-After'))
+            if throttled >= self.throttle_retries:
+                return response
+            throttled += 1
+            if self.metrics is not None:
+                self.metrics.increment(endpoint, 'throttled')
+            self._log(f'RDP APIs: {endpoint} request throttled (HTTP 429), retry in {delay:.1f} seconds')
+            response.close()
+
     #for testing only
     def get_scope(self):
         return self.scope
@@ -41,75 +425,377 @@ class RDPHTTPController():
 
         # Send HTTP Request
         try:
-            response = requests.post(auth_url, 
+            response = self._send('auth', 'POST', auth_url, 
                 headers = {'Content-Type':'application/x-www-form-urlencoded'}, 
                 data = payload, 
                 auth = (client_id, self.client_secret)
                 )
         except requests.exceptions.RequestException as exp:
-            print(f'Caught exception: {exp}')
-            return None, None, None
+            self._log(f'Caught exception: {exp}')
+            raise
 
         if response.status_code == 200:  # HTTP Status 'OK'
-            print('Authentication success')
-            access_token = response.json()['access_token']
-            refresh_token = response.json()['refresh_token']
-            expires_in = int(response.json()['expires_in'])
+            self._log('Authentication success')
+            token = AuthToken.from_json(self._json(response))
+            access_token = token.access_token
+            refresh_token = token.refresh_token
+            expires_in = token.expires_in
         if response.status_code != 200:
-            print(f'RDP authentication failure: {response.status_code} {response.reason}')
-            print(f'Text: {response.text}')
+            self._log(f'RDP authentication failure: {response.status_code} {response.reason}')
+            self._log(f'Text: {response.text}')
             raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status_code} - {response.text} ', response = response )
     
         return access_token, refresh_token, expires_in
     
     # Send HTTP Get request to the RDP ESG Service
-    def rdp_request_esg(self, esg_url, access_token, universe):
+    # typed: return an EsgScores model (rows as compact EsgScoreRow objects) instead of the response dict
+    # start/end/periods: optional history window, see esg_params()
+    def rdp_request_esg(self, esg_url, access_token, universe, typed = False, start = None, end = None, periods = None):
+
+        esg_data = self._request_esg(esg_url, access_token, universe, start, end, periods)
+        return EsgScores.from_json(esg_data) if typed else esg_data
+
+    def _request_esg(self, esg_url, access_token, universe, start = None, end = None, periods = None):
 
         if not esg_url or not access_token or not universe:
             raise TypeError('Received invalid (None or Empty) arguments')
 
-        payload = {'universe': universe}
+        payload = esg_params(universe, start, end, periods)
+        if self.cache is not None:
+            cache_key = self.cache.make_key(esg_url, payload)
+            esg_data = self.cache.get('esg', cache_key)
+            if self.metrics is not None:
+                self.metrics.increment('esg', 'cache_miss' if esg_data is None else 'cache_hit')
+            if esg_data is not None:
+                return esg_data
+
+        if self.single_flight is not None:
+            flight_key = ('esg', esg_url, access_token, universe, start, end, periods)
+            return self.single_flight.do(flight_key, lambda: self._send_esg_request(esg_url, access_token, payload))
+        return self._send_esg_request(esg_url, access_token, payload)
+
+    # Send the ESG HTTP request, the successful response is added to the cache
+    def _send_esg_request(self, esg_url, access_token, payload):
+
         # Request data for ESG Score Full Service
         try:
-            response = requests.get(esg_url, headers={'Authorization': f'Bearer {access_token}'}, params = payload)
+            response = self._send('esg', 'GET', esg_url, headers={'Authorization': f'Bearer {access_token}'}, params = payload, stream = self._guarded())
         except requests.exceptions.RequestException as exp:
-            print(f'Caught exception: {exp}')
-            return None
+            self._log(f'Caught exception: {exp}')
+            raise
 
         if response.status_code == 200:  # HTTP Status 'OK'
-            print('Receive ESG Data from RDP APIs')
+            self._log('Receive ESG Data from RDP APIs')
             #print(response.json())
         else:
-            print(f'RDP APIs: ESG data request failure: {response.status_code} {response.reason}')
-            print(f'Text: {response.text}')
+            self._log(f'RDP APIs: ESG data request failure: {response.status_code} {response.reason}')
+            self._log(f'Text: {response.text}')
+            raise requests.exceptions.HTTPError(f'ESG data request failure: {response.status_code} - {response.text} ', response = response )
+
+        spilled = False
+        if self._guarded():
+            esg_data, spilled = self._read_guarded_json(response, 'data')
+        else:
+            esg_data = self._json(response)
+        if self.cache is not None and not spilled and 'error' not in esg_data:
+            self.cache.put('esg', self.cache.make_key(esg_url, payload), esg_data, response.headers)
+        return esg_data
+
+    # Send HTTP Get request to the RDP ESG Service and return the undecoded response body, for callers that decode it
+    # somewhere else (e.g. a worker process). A body over spill_bytes is written to a file in spill_dir (default: the
+    # system temporary directory) and that path is returned instead of the bytes, the caller removes the file.
+    # max_response_bytes applies (max_rows needs the decoded rows), the body is neither cached nor coalesced.
+    def rdp_request_esg_raw(self, esg_url, access_token, universe, start = None, end = None, periods = None, spill_dir = None):
+
+        if not esg_url or not access_token or not universe:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        payload = esg_params(universe, start, end, periods)
+        try:
+            response = self._send('esg', 'GET', esg_url, headers={'Authorization': f'Bearer {access_token}'}, params = payload, stream = True)
+        except requests.exceptions.RequestException as exp:
+            self._log(f'Caught exception: {exp}')
+            raise
+
+        if response.status_code != 200:
+            self._log(f'RDP APIs: ESG data request failure: {response.status_code} {response.reason}')
             raise requests.exceptions.HTTPError(f'ESG data request failure: {response.status_code} - {response.text} ', response = response )
 
-        return response.json()
+        spill_paths = []
+        def open_spill_file():
+            spill_file = tempfile.NamedTemporaryFile(dir = spill_dir, prefix = 'esg_', suffix = '.json', delete = False)
+            spill_paths.append(spill_file.name)
+            return spill_file
+        try:
+            buffer, spill_file = self._read_body(response, open_spill_file)
+        except Exception:
+            for path in spill_paths:
+                os.remove(path)
+            raise
+        if spill_file is None:
+            return bytes(buffer)
+        spill_file.close()
+        return spill_file.name
+
+    # Send HTTP Get request to the RDP ESG Service and parse the 'data' rows incrementally from the response stream
+    # Returns a JSONArrayStream: iterate it for rows or call chunks(size) for lists of rows, the other members
+    # (headers, universe, error) are in .members once parsed. The large 'messages' block is skipped.
+    # read_size: bytes read from the socket at a time
+    def rdp_request_esg_stream(self, esg_url, access_token, universe, read_size = 65536, start = None, end = None, periods = None):
+
+        if not esg_url or not access_token or not universe:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        payload = esg_params(universe, start, end, periods)
+        try:
+            response = self._send('esg', 'GET', esg_url, headers={'Authorization': f'Bearer {access_token}'}, params = payload, stream = True)
+        except requests.exceptions.RequestException as exp:
+            self._log(f'Caught exception: {exp}')
+            raise
+
+        if response.status_code == 200:  # HTTP Status 'OK'
+            self._log('Receive ESG Data stream from RDP APIs')
+        else:
+            self._log(f'RDP APIs: ESG data request failure: {response.status_code} {response.reason}')
+            self._log(f'Text: {response.text}')
+            raise requests.exceptions.HTTPError(f'ESG data request failure: {response.status_code} - {response.text} ', response = response )
+
+        return JSONArrayStream(response.iter_content(chunk_size = read_size), key = 'data', skip_keys = ('messages',),
+            encoding = response.encoding or 'utf-8', on_close = response.close)
+
+    # Request several ESG views of the same universe concurrently over the shared connection pool
+    # esg_url: URL of any ESG view (e.g. RDP_ESG_URL .../views/scores-full), returns {view: esg_data} in views order.
+    # Join the views with rdp_dataframe.join_esg_views() to get one wide DataFrame.
+    def rdp_request_esg_views(self, esg_url, access_token, universe, views = ESG_VIEWS, max_workers = None):
+
+        if not esg_url or not access_token or not universe or not views:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        views = list(dict.fromkeys(views))
+        with ThreadPoolExecutor(max_workers = max_workers or len(views)) as executor:
+            responses = list(executor.map(lambda view: self.rdp_request_esg(esg_view_url(esg_url, view), access_token, universe), views))
+        return dict(zip(views, responses))
+
+    # Request the ESG data of every RIC separately on a thread pool sharing this controller, returns the responses
+    # in rics order. access_token: the Access Token or a callable returning a valid one (e.g.
+    # RDPTokenManager.get_access_token), return_exceptions: return the exception of a failed RIC in its place
+    # instead of raising the first failure. start/end/periods: optional history window, see esg_params()
+    def map_esg(self, esg_url, access_token, rics, max_workers = 8, return_exceptions = False, start = None, end = None, periods = None):
+
+        if not esg_url or not access_token or not rics:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        return self._map(lambda ric: self.rdp_request_esg(esg_url, self._access_token(access_token), ric, start = start, end = end, periods = periods),
+            rics, max_workers, return_exceptions)
+
+    # Send every Search Explore payload on a thread pool sharing this controller, returns the responses in payloads order
+    # access_token and return_exceptions: see map_esg()
+    def map_search(self, search_url, access_token, payloads, max_workers = 8, return_exceptions = False):
+
+        if not search_url or not access_token or not payloads:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        return self._map(lambda payload: self.rdp_request_search_explore(search_url, self._access_token(access_token), payload),
+            payloads, max_workers, return_exceptions)
+
+    @staticmethod
+    def _access_token(access_token):
+        return access_token() if callable(access_token) else access_token
+
+    @staticmethod
+    def _map(function, items, max_workers, return_exceptions):
+        def call(item):
+            try:
+                return function(item)
+            except Exception as exp:
+                if not return_exceptions:
+                    raise
+                return exp
+
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            return list(executor.map(call, items))
+
+    # Request ESG data for a large universe: the RICs are split into comma-joined batches of batch_size which are
+    # requested concurrently, the headers/data/universe blocks are stitched into one combined response.
+    # Per-RIC failures are returned in the 'errors' dict ({ric: error}) instead of failing the whole universe.
+    # Only a rejected universe (HTTP 4xx or an 'error' response) is split to isolate the invalid RICs, every RIC of a
+    # batch that failed with HTTP 5xx or a connection problem is reported with that error.
+    # start/end/periods: optional history window of every batch, see esg_params()
+    def rdp_request_esg_bulk(self, esg_url, access_token, universe, batch_size = 50, max_workers = 4, start = None, end = None, periods = None):
+
+        if not esg_url or not access_token or not universe:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        batches = chunk_universe(universe, batch_size)
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            batch_results = list(executor.map(lambda batch: self._request_esg_batch(esg_url, access_token, batch, start, end, periods), batches))
+
+        return merge_esg_responses(batch_results)
+
+    # Request one universe batch, returns (responses, errors)
+    # If RDP rejects the batch (e.g. 'Unable to resolve all requested identifiers.'), the batch is bisected
+    # until the failing RICs are isolated so the valid RICs of the batch are still returned.
+    def _request_esg_batch(self, esg_url, access_token, batch, start = None, end = None, periods = None):
+        error = None
+        try:
+            response = self.rdp_request_esg(esg_url, access_token, ','.join(batch), start = start, end = end, periods = periods)
+        except ResponseTooLargeError as exp:  # a smaller universe fits, bisect like a rejected batch
+            response = None
+            error = str(exp)
+        except requests.exceptions.HTTPError as exp:
+            status = exp.response.status_code if exp.response is not None else None
+            if status in ESG_BATCH_FATAL_STATUS:
+                raise
+            if status is None or status >= 500:  # RDP side failure, splitting the batch only multiplies the requests
+                return [], {ric: str(exp) for ric in batch}
+            response = None
+            error = str(exp)
+        except requests.exceptions.RequestException as exp:  # Connection problem, splitting the batch will not help
+            return [], {ric: f'ESG data request failure: {exp}' for ric in batch}
+
+        if response is not None and 'error' not in response:
+            return [response], {}
+        if error is None:
+            error = response['error']
+        if len(batch) == 1:
+            return [], {batch[0]: error}
+
+        middle = len(batch) // 2
+        left_responses, left_errors = self._request_esg_batch(esg_url, access_token, batch[:middle], start, end, periods)
+        right_responses, right_errors = self._request_esg_batch(esg_url, access_token, batch[middle:], start, end, periods)
+        return left_responses + right_responses, {**left_errors, **right_errors}
 
     # Send HTTP Post request to the RDP Search Explore Service
-    def rdp_request_search_explore(self, search_url, access_token, payload):
+    # typed: return a SearchResult model (hits as compact SearchHit objects) instead of the response dict
+    def rdp_request_search_explore(self, search_url, access_token, payload, typed = False):
+
+        search_data = self._request_search_explore(search_url, access_token, payload)
+        return SearchResult.from_json(search_data) if typed else search_data
+
+    def _request_search_explore(self, search_url, access_token, payload):
 
         if not search_url or not access_token or not payload:
             raise TypeError('Received invalid (None or Empty) arguments')
 
+        if self.cache is not None:
+            cache_key = self.cache.make_key(search_url, payload)
+            search_data = self.cache.get('search', cache_key)
+            if self.metrics is not None:
+                self.metrics.increment('search', 'cache_miss' if search_data is None else 'cache_hit')
+            if search_data is not None:
+                return search_data
+
+        if self.single_flight is not None:
+            flight_key = ('search', search_url, access_token, json.dumps(payload, sort_keys = True))
+            return self.single_flight.do(flight_key, lambda: self._send_search_explore_request(search_url, access_token, payload))
+        return self._send_search_explore_request(search_url, access_token, payload)
+
+    # Send the Search Explore HTTP request, the successful response is added to the cache
+    def _send_search_explore_request(self, search_url, access_token, payload):
+
         headers = {
             'Accept': 'application/json',
             'Authorization': f'Bearer {access_token}'
         }
 
         try:
-            response = requests.post(search_url, headers = headers, data = json.dumps(payload))
+            response = self._send('search', 'POST', search_url, headers = headers, data = dumps(payload), stream = self._guarded())
         except requests.exceptions.RequestException as exp:
-            print(f'Caught exception: {exp}')
-            return None
+            self._log(f'Caught exception: {exp}')
+            raise
         
         if response.status_code == 200:  # HTTP Status 'OK'
-            print('Receive Search Explore Data from RDP APIs')
+            self._log('Receive Search Explore Data from RDP APIs')
             #print(response.json())
         else:
-            print(f'RDP APIs: Search Explore request failure: {response.status_code} {response.reason}')
-            print(f'Text: {response.text}')
+            self._log(f'RDP APIs: Search Explore request failure: {response.status_code} {response.reason}')
+            self._log(f'Text: {response.text}')
             raise requests.exceptions.HTTPError(f'Search Explore request failure: {response.status_code} - {response.text} ', response = response )
 
-        return response.json()
+        spilled = False
+        if self._guarded():
+            search_data, spilled = self._read_guarded_json(response, 'Hits')
+        else:
+            search_data = self._json(response)
+        if self.cache is not None and not spilled:
+            self.cache.put('search', self.cache.make_key(search_url, payload), search_data, response.headers)
+        return search_data
+
+    # Iterate over all Search Explore hits of a query, paging with Top/Skip up to the returned 'Total'
+    # The next prefetch pages are requested concurrently while the current page is consumed, hits are yielded
+    # in query order. page_size: hits per page (Search Explore allows at most 100), max_hits: optional limit
+    def rdp_iter_search_explore(self, search_url, access_token, payload, page_size = 100, prefetch = 4, max_hits = None):
+
+        if not search_url or not access_token or not payload:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        if page_size < 1 or prefetch < 1:
+            raise ValueError('page_size and prefetch must be at least 1')
+
+        start = int(payload.get('Skip', 0))
+        first_page = self.rdp_request_search_explore(search_url, access_token, {**payload, 'Top': page_size, 'Skip': start})
+        end = int(first_page.get('Total', 0))
+        if max_hits is not None:
+            end = min(end, start + max_hits)
+
+        hits = first_page.get('Hits', [])[:max(0, end - start)]
+        yield from hits
+
+        executor = ThreadPoolExecutor(max_workers = prefetch)
+        pending = deque()
+        try:
+            for skip in range(start + page_size, end, page_size):
+                pending.append((skip, executor.submit(self.rdp_request_search_explore, search_url, access_token, {**payload, 'Top': page_size, 'Skip': skip})))
+                if len(pending) >= prefetch:
+                    yield from self._page_hits(pending.popleft(), end)
+            while pending:
+                yield from self._page_hits(pending.popleft(), end)
+        finally:
+            executor.shutdown(wait = False, cancel_futures = True)
+
+    @staticmethod
+    def _page_hits(page, end):
+        skip, future = page
+        return future.result().get('Hits', [])[:end - skip]
+
+    # Resolve the Search Explore metadata of many RICs: RICs are packed into one 'RIC eq ... or RIC eq ...' filter
+    # per batch (up to batch_size RICs and max_filter_length characters), the batches are requested concurrently.
+    # Returns {ric: hit} with the select fields (the first hit of each RIC), RICs that Search Explore does not know
+    # are left out.
+    # Resolved RICs are cached (in the controller cache if there is one) so repeated lookups are served locally.
+    def rdp_resolve_rics(self, search_url, access_token, rics, select, view = 'Entities', batch_size = 50, max_filter_length = 4000, max_workers = 4):
+
+        if not search_url or not access_token or not rics or not select:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        if not 1 <= batch_size <= SEARCH_MAX_TOP:
+            raise ValueError(f'batch_size must be between 1 and {SEARCH_MAX_TOP}')
+
+        fields = [field.strip() for field in select.split(',')] if isinstance(select, str) else list(select)
+        if 'RIC' not in fields:
+            fields.append('RIC')
+        select = ','.join(fields)
+        cache = self.metadata_cache
+
+        resolved = {}
+        missing = []
+        for ric in dict.fromkeys(ric.strip() for ric in ([rics] if isinstance(rics, str) else rics) if ric and ric.strip()):
+            hit = cache.get('search', cache.make_key('ric_metadata', [view, select, ric]))
+            if hit is not None:
+                resolved[ric] = hit
+            else:
+                missing.append(ric)
+
+        def resolve_batch(batch):
+            payload = {'View': view, 'Filter': ric_filter(batch), 'Select': select, 'Top': SEARCH_MAX_TOP}
+            return self.rdp_request_search_explore(search_url, access_token, payload).get('Hits', [])
 
+        batches = chunk_ric_filters(missing, batch_size, max_filter_length)
+        requested = set(missing)
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            for hits in executor.map(resolve_batch, batches):
+                for hit in hits:
+                    ric = hit.get('RIC')
+                    if ric in resolved or ric not in requested:
+                        continue
+                    resolved[ric] = hit
+                    cache.put('search', cache.make_key('ric_metadata', [view, select, ric]), hit)
+        return resolved
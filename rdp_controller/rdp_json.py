@@ -0,0 +1,60 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+# JSON backend of the RDP controller: orjson or msgspec when installed, the standard json module otherwise.
+# loads() accepts the raw response bytes so the body is decoded once without building an intermediate str,
+# dumps() returns UTF-8 bytes ready to be sent as a request body.
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+    DECODE_ERRORS = (ValueError,)  # orjson.JSONDecodeError is a json.JSONDecodeError
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+
+elif msgspec is not None:
+    JSON_BACKEND = 'msgspec'
+    DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+    _decoder = msgspec.json.Decoder()
+    _encoder = msgspec.json.Encoder()
+
+    def loads(data):
+        return _decoder.decode(data)
+
+    def dumps(obj):
+        return _encoder.encode(obj)
+
+else:
+    JSON_BACKEND = 'json'
+    DECODE_ERRORS = (ValueError,)
+
+    def loads(data):
+        return json.loads(data)
+
+    def dumps(obj):
+        return json.dumps(obj, separators = (',', ':')).encode('utf-8')
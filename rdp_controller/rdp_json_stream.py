@@ -0,0 +1,283 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import codecs
+import json
+import re
+import threading
+
+WHITESPACE = ' \t\n\r'
+DELIMITERS = ',]}' + WHITESPACE
+STRUCTURE_PATTERN = re.compile(r'["\[\]{}]')
+STRING_END_PATTERN = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+# Incremental parser for a top-level JSON object with one large array member, e.g. the RDP ESG 'data' rows.
+# The items of the array are decoded one by one from an iterable of bytes chunks (such as
+# response.iter_content()), so memory is bounded by the chunk size rather than by the response size.
+# The other top-level members (headers, universe, ...) are decoded as usual and available in .members once the
+# parser has passed them, members listed in skip_keys are scanned over without being decoded.
+class JSONArrayStream():
+
+    def __init__(self, chunks, key = 'data', skip_keys = (), encoding = 'utf-8', on_close = None):
+        self.key = key
+        self.skip_keys = set(skip_keys)
+        self.members = {}
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._on_close = on_close
+        self._items = self._parse()
+
+    def __iter__(self):
+        return self._items
+
+    def __next__(self):
+        return next(self._items)
+
+    # Yield the array items in lists of up to size items
+    def chunks(self, size):
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        chunk = []
+        for item in self._items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    # Parse the rest of the stream (decoding the remaining members) without keeping the array items
+    def drain(self):
+        for _ in self._items:
+            pass
+        return self.members
+
+    def close(self):
+        self._items.close()
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Read more text into the buffer, read_size bytes chunks are read until at least min_chars are available
+    # Returns False only when the stream ended without adding any text (text read before the end still counts)
+    def _fill(self, min_chars = 1):
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        start = len(self._buffer)
+        target = start + min_chars
+        while len(self._buffer) < target:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._buffer += self._decoder.decode(b'', final = True)
+                self._eof = True
+                return len(self._buffer) > start
+            self._buffer += self._decoder.decode(chunk)
+        return True
+
+    # Return the next non whitespace character without consuming it (None at the end of the stream)
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, character):
+        if self._peek() != character:
+            raise ValueError(f'Invalid JSON stream: expected {character!r} at offset {self._pos}')
+        self._pos += 1
+
+    # Decode the next JSON value, reading more of the stream while it is incomplete. The needed amount is doubled
+    # each time so large values are not re-decoded once per chunk.
+    def _decode_value(self):
+        self._peek()
+        needed = 1
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+                # a number is only complete when followed by a delimiter, it may continue in the next chunk
+                number_complete = end < len(self._buffer) and self._buffer[end] in DELIMITERS
+                if self._eof or number_complete or not isinstance(value, (int, float)) or isinstance(value, bool):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            needed = max(needed * 2, len(self._buffer) - self._pos)
+            self._fill(needed)
+
+    # Scan over the next JSON value without decoding it
+    def _skip_value(self):
+        if self._peek() not in '[{"':
+            self._decode_value()
+            return
+        depth = 0
+        while True:
+            match = STRUCTURE_PATTERN.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise ValueError('Invalid JSON stream: unexpected end of data')
+                continue
+            self._pos = match.end()
+            character = match.group()
+            if character == '"':
+                self._skip_string()
+            elif character in '[{':
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0:
+                return
+
+    # Move past the end of the string whose opening quote was just consumed
+    def _skip_string(self):
+        while True:
+            match = STRING_END_PATTERN.match(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return
+            if not self._fill(len(self._buffer) - self._pos + 1):
+                raise ValueError('Invalid JSON stream: unterminated string')
+
+    def _parse(self):
+        try:
+            self._expect('{')
+            while True:
+                character = self._peek()
+                if character == '}' or character is None:
+                    return
+                if character == ',':
+                    self._pos += 1
+                    continue
+                key = self._decode_value()
+                self._expect(':')
+                if key == self.key and self._peek() == '[':
+                    self._pos += 1
+                    yield from self._parse_array()
+                elif key in self.skip_keys:
+                    self._skip_value()
+                else:
+                    self.members[key] = self._decode_value()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+    def _parse_array(self):
+        while True:
+            character = self._peek()
+            if character == ']':
+                self._pos += 1
+                return
+            if character is None:
+                raise ValueError('Invalid JSON stream: unexpected end of data')
+            if character == ',':
+                self._pos += 1
+                continue
+            yield self._decode_value()
+
+# Rows of a JSON array member whose response body was spooled to a file (RDPHTTPController spill_bytes).
+# It stands in for the rows list of the response: len() is known, and every iteration (or chunks(size)) parses the
+# rows again from the file with a JSONArrayStream, so only one chunk of rows is in memory at a time. Iterations
+# in several threads each keep their own file offset. The file is removed by close() or when the object is freed.
+class JSONArraySpill():
+
+    def __init__(self, spill_file, key = 'data', length = 0, encoding = 'utf-8', read_size = 65536):
+        self.key = key
+        self.length = length
+        self.encoding = encoding
+        self.read_size = read_size
+        self._file = spill_file
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.stream())
+
+    # Yield the rows in lists of up to size rows
+    def chunks(self, size):
+        return self.stream().chunks(size)
+
+    # A new JSONArrayStream over the whole spooled body (its .members are the other response members)
+    def stream(self):
+        return JSONArrayStream(self._read_chunks(), key = self.key, encoding = self.encoding)
+
+    def close(self):
+        self._file.close()
+
+    def __repr__(self):
+        return f'JSONArraySpill(key={self.key!r}, length={self.length})'
+
+    def _read_chunks(self):
+        offset = 0
+        while True:
+            with self._lock:
+                self._file.seek(offset)
+                chunk = self._file.read(self.read_size)
+            if not chunk:
+                return
+            offset += len(chunk)
+            yield chunk
+
+# Rows of several responses joined without reading them into one list, e.g. the batches of a bulk ESG request where
+# some batches were spilled (JSONArraySpill) and others are in-memory lists. len(), iteration and chunks(size) run
+# over the parts in order.
+class JSONArrayChain():
+
+    def __init__(self, parts):
+        self.parts = list(parts)
+
+    def __len__(self):
+        return sum(len(part) for part in self.parts)
+
+    def __iter__(self):
+        for part in self.parts:
+            yield from part
+
+    # Yield the rows in lists of up to size rows, spilled parts are read chunk by chunk from their files
+    def chunks(self, size):
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        chunk = []
+        for part in self.parts:
+            part_chunks = part.chunks(size) if hasattr(part, 'chunks') else (part[start:start + size] for start in range(0, len(part), size))
+            for rows in part_chunks:
+                for row in rows:
+                    chunk.append(row)
+                    if len(chunk) >= size:
+                        yield chunk
+                        chunk = []
+        if chunk:
+            yield chunk
+
+    def close(self):
+        for part in self.parts:
+            if hasattr(part, 'close'):
+                part.close()
+
+    def __repr__(self):
+        return f'JSONArrayChain(parts={len(self.parts)}, length={len(self)})'
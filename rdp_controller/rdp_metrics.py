@@ -0,0 +1,201 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Request phases timed by the RDPHTTPController
+#   connect: DNS lookup and TCP connect (0 when a pooled keep-alive connection is reused)
+#   tls: TLS handshake (https only, 0 when a pooled connection is reused)
+#   ttfb: time to the response headers (requests' response.elapsed)
+#   total: whole request including the body download and any connection setup
+PHASES = ('connect', 'tls', 'ttfb', 'total')
+
+# Upper bounds (seconds) of the request duration histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Connection setup timings of the current thread, filled by the timed urllib3 connections below
+_connection_timings = threading.local()
+
+# Reset the connection setup timings of the current thread before sending a request
+def reset_connection_timings():
+    _connection_timings.connect = 0.0
+    _connection_timings.tls = 0.0
+
+# Connection setup timings of the last request of the current thread, returns (connect, tls)
+def connection_timings():
+    return getattr(_connection_timings, 'connect', 0.0), getattr(_connection_timings, 'tls', 0.0)
+
+# urllib3 connection mixin timing the TCP connect (_new_conn, includes DNS) and the TLS handshake (rest of connect)
+class _TimedConnectionMixin():
+
+    def _new_conn(self):
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _connection_timings.connect = getattr(_connection_timings, 'connect', 0.0) + time.perf_counter() - started
+
+    def connect(self):
+        started = time.perf_counter()
+        connect_before = getattr(_connection_timings, 'connect', 0.0)
+        try:
+            super().connect()
+        finally:
+            elapsed = time.perf_counter() - started
+            new_conn = getattr(_connection_timings, 'connect', 0.0) - connect_before
+            _connection_timings.tls = getattr(_connection_timings, 'tls', 0.0) + max(0.0, elapsed - new_conn)
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+# HTTPAdapter whose pooled connections record the connect and TLS handshake timings
+class TimedHTTPAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+
+# Thread-safe collector of the RDPHTTPController request metrics
+# Per endpoint ('auth', 'esg', 'search'): request counts by HTTP status, phase timers, a request duration histogram,
+# bytes sent/received and event counters (retry, throttled, circuit_open, cache_hit, cache_miss).
+# Hooks are called with every event dict, e.g. to forward the measurements to OpenTelemetry or a log.
+class RDPMetrics():
+
+    def __init__(self, buckets = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._hooks = []
+        self._endpoints = {}
+
+    # Register a callable receiving every event dict: {'event': 'request', 'endpoint', 'method', 'status', 'connect',
+    # 'tls', 'ttfb', 'total', 'bytes_sent', 'bytes_received'} or {'event': <counter name>, 'endpoint', 'value'}
+    def add_hook(self, hook):
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        self._hooks.remove(hook)
+
+    def _endpoint(self, endpoint):
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = {
+                'requests': {},
+                'timers': {phase: {'count': 0, 'sum': 0.0, 'max': 0.0} for phase in PHASES},
+                'histogram': [0] * len(self.buckets),
+                'bytes_sent': 0,
+                'bytes_received': 0,
+                'counters': {}
+            }
+            self._endpoints[endpoint] = stats
+        return stats
+
+    def _emit(self, event):
+        for hook in list(self._hooks):
+            try:
+                hook(event)
+            except Exception as exp:
+                print(f'Metrics hook failure: {exp}')
+
+    # Record one HTTP request attempt, status is the HTTP status code or the exception class name
+    def record_request(self, endpoint, method, status, connect = 0.0, tls = 0.0, ttfb = 0.0, total = 0.0, bytes_sent = 0, bytes_received = 0):
+        timings = {'connect': connect, 'tls': tls, 'ttfb': ttfb, 'total': total}
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats['requests'][status] = stats['requests'].get(status, 0) + 1
+            for phase, value in timings.items():
+                timer = stats['timers'][phase]
+                timer['count'] += 1
+                timer['sum'] += value
+                timer['max'] = max(timer['max'], value)
+            for index, bound in enumerate(self.buckets):
+                if total <= bound:
+                    stats['histogram'][index] += 1
+                    break
+            stats['bytes_sent'] += bytes_sent
+            stats['bytes_received'] += bytes_received
+        if self._hooks:
+            self._emit({'event': 'request', 'endpoint': endpoint, 'method': method, 'status': status, **timings,
+                'bytes_sent': bytes_sent, 'bytes_received': bytes_received})
+
+    # Increment an event counter of the endpoint
+    def increment(self, endpoint, name, value = 1):
+        with self._lock:
+            counters = self._endpoint(endpoint)['counters']
+            counters[name] = counters.get(name, 0) + value
+        if self._hooks:
+            self._emit({'event': name, 'endpoint': endpoint, 'value': value})
+
+    # Copy of the collected metrics: {endpoint: {'requests', 'timers', 'histogram', 'bytes_sent', 'bytes_received', 'counters'}}
+    def snapshot(self):
+        with self._lock:
+            return {endpoint: {
+                'requests': dict(stats['requests']),
+                'timers': {phase: dict(timer) for phase, timer in stats['timers'].items()},
+                'histogram': list(stats['histogram']),
+                'bytes_sent': stats['bytes_sent'],
+                'bytes_received': stats['bytes_received'],
+                'counters': dict(stats['counters'])
+            } for endpoint, stats in self._endpoints.items()}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    # Render the metrics in the Prometheus text exposition format
+    def to_prometheus(self, prefix = 'rdp'):
+        snapshot = self.snapshot()
+        lines = [f'# TYPE {prefix}_requests_total counter']
+        for endpoint, stats in snapshot.items():
+            for status, count in stats['requests'].items():
+                lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+        lines.append(f'# TYPE {prefix}_request_duration_seconds histogram')
+        for endpoint, stats in snapshot.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, stats['histogram']):
+                cumulative += count
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+            total = stats['timers']['total']
+            lines.append(f'{prefix}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {total["count"]}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {total["sum"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{endpoint="{endpoint}"}} {total["count"]}')
+
+        lines.append(f'# TYPE {prefix}_request_phase_seconds summary')
+        for endpoint, stats in snapshot.items():
+            for phase, timer in stats['timers'].items():
+                lines.append(f'{prefix}_request_phase_seconds_sum{{endpoint="{endpoint}",phase="{phase}"}} {timer["sum"]}')
+                lines.append(f'{prefix}_request_phase_seconds_count{{endpoint="{endpoint}",phase="{phase}"}} {timer["count"]}')
+
+        lines.append(f'# TYPE {prefix}_bytes_total counter')
+        for endpoint, stats in snapshot.items():
+            lines.append(f'{prefix}_bytes_total{{endpoint="{endpoint}",direction="sent"}} {stats["bytes_sent"]}')
+            lines.append(f'{prefix}_bytes_total{{endpoint="{endpoint}",direction="received"}} {stats["bytes_received"]}')
+
+        lines.append(f'# TYPE {prefix}_events_total counter')
+        for endpoint, stats in snapshot.items():
+            for name, count in stats['counters'].items():
+                lines.append(f'{prefix}_events_total{{endpoint="{endpoint}",event="{name}"}} {count}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,206 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+# Typed, compact models of the RDP responses.
+# A dict per Search Explore hit or ESG row costs several hundred bytes, the models below store the values in
+# __slots__ (no per-instance __dict__) and are validated once when the response is decoded. The row classes are
+# generated per field set (ESG view headers, Search Explore Select fields) and cached, the values can be read
+# as attributes (row.esg_score, hit.IssuerCommonName) or by the original key (row['ESG Score'], hit['RIC']).
+
+import keyword
+import re
+import threading
+
+from rdp_controller.rdp_json_stream import JSONArraySpill
+
+# Python identifier for a header title or field name, e.g. 'Period End Date' -> 'period_end_date'
+def field_name(key, lower = True):
+    name = re.sub(r'\W+', '_', str(key)).strip('_')
+    if lower:
+        name = name.lower()
+    if not name or name[0].isdigit() or keyword.iskeyword(name) or name == 'self':
+        name = f'f_{name}'
+    return name
+
+# Base of the generated row models, _keys are the original keys and _fields the attribute names (same order)
+class RDPModel():
+    __slots__ = ()
+    _keys = ()
+    _fields = ()
+    _index = {}
+
+    # Value by original key, attribute name or position
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return getattr(self, self._fields[key])
+        field = self._index.get(key)
+        if field is None:
+            raise KeyError(key)
+        return getattr(self, field)
+
+    def get(self, key, default = None):
+        try:
+            value = self[key]
+        except (KeyError, IndexError):
+            return default
+        return default if value is None else value
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        values = ', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)
+        return f'{type(self).__name__}({values})'
+
+    # Plain dict with the original keys, fields without a value are left out
+    def to_dict(self):
+        return {key: getattr(self, field) for key, field in zip(self._keys, self._fields) if getattr(self, field) is not None}
+
+_model_types = {}
+_model_types_lock = threading.Lock()
+
+# Row model class of base for the given original keys, generated once per (base, keys)
+def model_type(base, keys, lower = True):
+    keys = tuple(keys)
+    with _model_types_lock:
+        cls = _model_types.get((base, keys))
+        if cls is None:
+            fields = []
+            for key in keys:
+                name = field_name(key, lower)
+                while name in fields:
+                    name = f'{name}_'
+                fields.append(name)
+            index = {**dict(zip(fields, fields)), **dict(zip(keys, fields))}
+            # generated positional __init__ (like collections.namedtuple), much faster than a setattr loop
+            namespace = {}
+            arguments = ''.join(f', {field} = None' for field in fields)
+            assignments = ''.join(f'\n    self.{field} = {field}' for field in fields) or '\n    pass'
+            exec(f'def __init__(self{arguments}):{assignments}', namespace)
+            cls = type(base.__name__, (base,), {'__slots__': tuple(fields), '__init__': namespace['__init__'], '_keys': keys, '_fields': tuple(fields), '_index': index})
+            _model_types[(base, keys)] = cls
+        return cls
+
+# RDP Auth Service token response
+class AuthToken():
+    __slots__ = ('access_token', 'refresh_token', 'expires_in', 'scope', 'token_type')
+
+    def __init__(self, access_token, refresh_token, expires_in, scope = None, token_type = None):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_in = expires_in
+        self.scope = scope
+        self.token_type = token_type
+
+    def __repr__(self):
+        return f'AuthToken(expires_in={self.expires_in!r}, scope={self.scope!r}, token_type={self.token_type!r})'  # tokens are not printed
+
+    @classmethod
+    def from_json(cls, data):
+        if not isinstance(data, dict):
+            raise ValueError('Invalid RDP authentication response: not a JSON object')
+        for key in ('access_token', 'refresh_token', 'expires_in'):
+            if not data.get(key):
+                raise ValueError(f'Invalid RDP authentication response: missing {key}')
+        try:
+            expires_in = int(data['expires_in'])
+        except (TypeError, ValueError):
+            raise ValueError(f'Invalid RDP authentication response: expires_in {data["expires_in"]!r} is not a number')
+        return cls(data['access_token'], data['refresh_token'], expires_in, data.get('scope'), data.get('token_type'))
+
+# One Search Explore hit, the attributes are the returned field names (e.g. hit.IssuerCommonName)
+class SearchHit(RDPModel):
+    __slots__ = ()
+
+    # Decode a list of hits into one generated SearchHit class (the union of the returned fields, missing fields are None)
+    @classmethod
+    def from_json(cls, hits):
+        if not isinstance(hits, (list, JSONArraySpill)):
+            raise ValueError('Invalid Search Explore response: Hits is not a list')
+        keys = {}
+        for hit in hits:
+            if not isinstance(hit, dict):
+                raise ValueError('Invalid Search Explore response: hit is not a JSON object')
+            keys.update(dict.fromkeys(hit))
+        hit_type = model_type(cls, keys, lower = False)
+        return [hit_type(*[hit.get(key) for key in hit_type._keys]) for hit in hits]
+
+# Search Explore response
+class SearchResult():
+    __slots__ = ('total', 'hits')
+
+    def __init__(self, total, hits):
+        self.total = total
+        self.hits = hits
+
+    def __len__(self):
+        return len(self.hits)
+
+    def __iter__(self):
+        return iter(self.hits)
+
+    @classmethod
+    def from_json(cls, data):
+        if not isinstance(data, dict):
+            raise ValueError('Invalid Search Explore response: not a JSON object')
+        try:
+            total = int(data.get('Total', 0))
+        except (TypeError, ValueError):
+            raise ValueError(f'Invalid Search Explore response: Total {data.get("Total")!r} is not a number')
+        return cls(total, SearchHit.from_json(data.get('Hits', [])))
+
+# One ESG row, the attributes are the snake_case header titles (e.g. row.instrument, row.period_end_date, row.esg_score)
+class EsgScoreRow(RDPModel):
+    __slots__ = ()
+
+# ESG view response, rows are EsgScoreRow of the view headers
+class EsgScores():
+    __slots__ = ('headers', 'rows', 'universe')
+
+    def __init__(self, headers, rows, universe):
+        self.headers = headers
+        self.rows = rows
+        self.universe = universe
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    @classmethod
+    def from_json(cls, data):
+        if not isinstance(data, dict):
+            raise ValueError('Invalid ESG response: not a JSON object')
+        if 'error' in data:
+            raise ValueError(f'ESG data error: {data["error"]}')
+        headers = data.get('headers')
+        if not headers:
+            raise ValueError('Invalid ESG response: missing headers')
+        row_type = model_type(EsgScoreRow, [header.get('title') or header['name'] for header in headers])
+        width = len(headers)
+        rows = []
+        for row in data.get('data', []):
+            if len(row) != width:
+                raise ValueError(f'Invalid ESG response: row of {len(row)} values for {width} headers')
+            rows.append(row_type(*row))
+        return cls(headers, rows, data.get('universe', []))
@@ -0,0 +1,138 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# Default budget per endpoint: (requests per second, burst size)
+DEFAULT_RATES = {
+    'auth': (1.0, 5),
+    'esg': (5.0, 10),
+    'search': (10.0, 20)
+}
+
+# Parse a Retry-After header (delay in seconds or HTTP date), returns seconds or None
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+# Thread-safe token bucket, acquire() blocks until a token is available
+class TokenBucket():
+
+    def __init__(self, rate, capacity):
+        if rate <= 0 or capacity < 1:
+            raise ValueError('rate must be positive and capacity at least 1')
+        self.rate = float(rate)
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    # Change the rate, drain=True drops the accumulated burst
+    def set_rate(self, rate, drain = False):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            if drain:
+                self._tokens = min(self._tokens, 0.0)
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Client-side rate limiter shared by every thread (and every AsyncRDPHTTPController coroutine) of a controller
+# Each endpoint has its own token bucket. On HTTP 429 the endpoint is paused for Retry-After (or an exponential
+# backoff with jitter when the header is missing) and its rate is cut by backoff_factor, each success then raises
+# the rate again by recovery_step requests per second up to the configured budget (AIMD).
+class RDPRateLimiter():
+
+    # Constructor Method
+    # rates: {endpoint: (requests per second, burst)} overriding DEFAULT_RATES
+    def __init__(self, rates = None, backoff_factor = 0.5, recovery_step = 0.1, min_rate = 0.1, base_delay = 1.0, max_delay = 60.0):
+        self.max_rates = {**DEFAULT_RATES, **(rates or {})}
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.min_rate = min_rate
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._blocked_until = {}
+        self._throttled = {}  # consecutive 429 per endpoint
+        self.throttle_count = 0
+
+    def _bucket(self, endpoint):
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                rate, burst = self.max_rates.get(endpoint, DEFAULT_RATES['esg'])
+                bucket = self._buckets[endpoint] = TokenBucket(rate, burst)
+            return bucket
+
+    # Current rate (requests per second) of an endpoint
+    def rate(self, endpoint):
+        return self._bucket(endpoint).rate
+
+    # Block until a request to the endpoint is allowed
+    def acquire(self, endpoint):
+        while True:
+            with self._lock:
+                wait = self._blocked_until.get(endpoint, 0) - time.monotonic()
+            if wait <= 0:
+                break
+            time.sleep(wait)
+        self._bucket(endpoint).acquire()
+
+    # The endpoint answered HTTP 429, returns the pause in seconds
+    def on_throttled(self, endpoint, retry_after = None):
+        bucket = self._bucket(endpoint)
+        with self._lock:
+            self.throttle_count += 1
+            throttled = self._throttled.get(endpoint, 0) + 1
+            self._throttled[endpoint] = throttled
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = min(self.max_delay, self.base_delay * 2 ** (throttled - 1))
+            # jitter so the waiting threads do not come back at the same instant
+            delay = delay + random.uniform(0, delay * 0.5 if delay else self.base_delay * 0.1)
+            self._blocked_until[endpoint] = max(self._blocked_until.get(endpoint, 0), time.monotonic() + delay)
+        bucket.set_rate(max(self.min_rate, bucket.rate * self.backoff_factor), drain = True)
+        return delay
+
+    # The endpoint answered a request without throttling, recover the rate
+    def on_success(self, endpoint):
+        bucket = self._bucket(endpoint)
+        with self._lock:
+            self._throttled[endpoint] = 0
+        max_rate = self.max_rates.get(endpoint, DEFAULT_RATES['esg'])[0]
+        if bucket.rate < max_rate:
+            bucket.set_rate(min(max_rate, bucket.rate + self.recovery_step))
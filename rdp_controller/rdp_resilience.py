@@ -0,0 +1,118 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import random
+import threading
+import time
+import requests
+
+# Raised without sending the request while the circuit breaker of the endpoint is open
+class CircuitOpenError(requests.exceptions.RequestException):
+    pass
+
+# Retry policy of the RDPHTTPController
+# Connect errors, read errors and HTTP 5xx are retried with exponential backoff and full jitter. Only idempotent
+# endpoints (ESG GET, Search Explore which is a read-only POST) are retried once the request may have reached
+# RDP, the other endpoints (the Auth token POST) are only retried when the connection could not be opened.
+class RetryPolicy():
+
+    def __init__(self, max_attempts = 3, backoff_base = 0.5, backoff_max = 10.0, retry_status = (500, 502, 503, 504), idempotent_endpoints = ('esg', 'search')):
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_status = frozenset(retry_status)
+        self.idempotent_endpoints = frozenset(idempotent_endpoints)
+
+    # Delay before the given retry (1 for the first retry)
+    def delay(self, retry):
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (retry - 1)))
+
+    def should_retry_status(self, endpoint, status_code, attempt):
+        return attempt < self.max_attempts and status_code in self.retry_status and endpoint in self.idempotent_endpoints
+
+    def should_retry_exception(self, endpoint, exp, attempt):
+        if attempt >= self.max_attempts or isinstance(exp, CircuitOpenError):
+            return False
+        if isinstance(exp, requests.exceptions.ConnectTimeout):
+            return True  # the request was never sent
+        if endpoint not in self.idempotent_endpoints:
+            return False
+        return isinstance(exp, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError))
+
+# Circuit breaker of one endpoint
+# closed: requests flow, open after failure_threshold consecutive failures: requests fail fast with
+# CircuitOpenError, half-open after reset_timeout seconds: one trial request decides between closed and open.
+class CircuitBreaker():
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, name, failure_threshold = 5, reset_timeout = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    # Raise CircuitOpenError unless a request may be sent now
+    def before_request(self):
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if time.monotonic() - self._opened_at >= self.reset_timeout and not self._trial_running:
+                self._state = self.HALF_OPEN
+                self._trial_running = True
+                return
+            raise CircuitOpenError(f'RDP {self.name} circuit breaker is open, failing fast')
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+# One circuit breaker per endpoint, created on first use
+class CircuitBreakers():
+
+    def __init__(self, failure_threshold = 5, reset_timeout = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._breakers = {}
+
+    def get(self, endpoint):
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(endpoint, self.failure_threshold, self.reset_timeout)
+            return breaker
@@ -0,0 +1,132 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+from rdp_controller.rdp_json import dumps, loads
+
+# Default time to live (seconds) per endpoint: ESG scores change at most daily, Search Explore metadata is static
+DEFAULT_TTL = {
+    'esg': 24 * 60 * 60,
+    'search': 7 * 24 * 60 * 60
+}
+MAX_AGE_PATTERN = re.compile(r'max-age\s*=\s*(\d+)')
+
+# Opt-in response cache for the RDPHTTPController
+# Two tiers: an in-memory LRU of decoded responses and an optional SQLite file shared between runs/processes.
+# Entries are keyed on (url, universe/payload), expire after the endpoint TTL and follow the response
+# Cache-Control (no-store, no-cache, max-age) and Expires headers. Cached objects are shared between callers,
+# treat them as read-only.
+class RDPResponseCache():
+
+    # Constructor Method
+    # maxsize: number of responses kept in memory, ttl: {endpoint: seconds} overriding DEFAULT_TTL
+    # sqlite_path: optional on-disk tier
+    def __init__(self, maxsize = 256, ttl = None, sqlite_path = None):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._stats = {'hits': 0, 'misses': 0, 'memory_hits': 0, 'disk_hits': 0, 'evictions': 0}
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(str(sqlite_path), check_same_thread = False, isolation_level = None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS rdp_cache (key TEXT PRIMARY KEY, endpoint TEXT, expires_at REAL, value TEXT)')
+
+    # Build the cache key of a request, the Access Token is not part of the key
+    @staticmethod
+    def make_key(url, payload):
+        return json.dumps([url, payload], sort_keys = True, separators = (',', ':'))
+
+    # Return the cached response or None
+    def get(self, endpoint, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    self._stats['memory_hits'] += 1
+                    return entry[1]
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute('SELECT expires_at, value FROM rdp_cache WHERE key = ?', (key,)).fetchone()
+                if row is not None and row[0] > now:
+                    value = loads(row[1])
+                    self._store(key, row[0], value)
+                    self._stats['hits'] += 1
+                    self._stats['disk_hits'] += 1
+                    return value
+
+            self._stats['misses'] += 1
+            return None
+
+    # Cache a response, response_headers (optional) are checked for HTTP cache directives
+    def put(self, endpoint, key, value, response_headers = None):
+        ttl = self._response_ttl(endpoint, response_headers or {})
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._store(key, expires_at, value)
+            if self._db is not None:
+                self._db.execute('INSERT OR REPLACE INTO rdp_cache (key, endpoint, expires_at, value) VALUES (?, ?, ?, ?)',
+                    (key, endpoint, expires_at, dumps(value)))
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM rdp_cache')
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _store(self, key, expires_at, value):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last = False)
+            self._stats['evictions'] += 1
+
+    # TTL of a response: the endpoint TTL unless the server sends Cache-Control/Expires directives
+    def _response_ttl(self, endpoint, response_headers):
+        cache_control = response_headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control or 'no-cache' in cache_control:
+            return 0
+        max_age = MAX_AGE_PATTERN.search(cache_control)
+        if max_age:
+            return int(max_age.group(1)) - int(response_headers.get('Age', 0) or 0)
+        expires = response_headers.get('Expires')
+        if expires:
+            try:
+                return parsedate_to_datetime(expires).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return 0  # invalid Expires means already expired
+        return self.ttl.get(endpoint, 0)
@@ -0,0 +1,85 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import asyncio
+import threading
+
+# Request coalescing (single-flight): while a call for a key is in flight, other callers with the same key wait
+# for it and receive its result or its exception instead of sending an identical upstream request.
+# Nothing is kept once the call completes, a later call for the same key is sent again.
+
+class _Call():
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+# Thread version, used by the RDPHTTPController
+class SingleFlight():
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0  # number of callers that shared another caller's request
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as exp:
+            call.error = exp
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+# Coroutine version, used by the AsyncRDPHTTPController so waiting callers do not hold a worker thread
+# The shared call runs as its own task that every caller (the first one included) awaits through asyncio.shield(),
+# so a cancelled caller stops waiting without cancelling the call of the others.
+class AsyncSingleFlight():
+
+    def __init__(self):
+        self._calls = {}
+        self.coalesced = 0
+
+    async def do(self, key, coroutine_function):
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(coroutine_function())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
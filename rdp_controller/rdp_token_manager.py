@@ -0,0 +1,168 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import threading
+import time
+import requests
+
+from rdp_controller.rdp_token_store import MemoryTokenStore
+
+# Token manager built on RDPHTTPController.rdp_authentication()
+# It caches the current Access Token and renews it with the Refresh Token grant on a background timer before
+# expires_in runs out, so data requests only read the cached token in steady state. Concurrent callers that find
+# the token expired share a single refresh, and a rejected Refresh Token falls back to the Password grant.
+# Pass a FileTokenStore to share the token between the worker processes of one host: a process first reuses a
+# valid token from the store and only the process holding the store lock logs in or refreshes.
+class RDPTokenManager():
+
+    # Constructor Method
+    # refresh_margin: fraction of expires_in left when the background refresh runs (0.2 = refresh at 80% of the lifetime)
+    # retry_interval: seconds to wait before retrying a failed background refresh
+    # store: token store shared with other managers (MemoryTokenStore, FileTokenStore), private to this manager by default
+    def __init__(self, controller, auth_url, username, password, client_id, refresh_margin = 0.2, retry_interval = 5, auto_refresh = True, store = None):
+        if not auth_url or not username or not password or not client_id:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        if not 0 <= refresh_margin < 1:
+            raise ValueError('refresh_margin must be between 0 and 1')
+
+        self.controller = controller
+        self.auth_url = auth_url
+        self.username = username
+        self.password = password
+        self.client_id = client_id
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.auto_refresh = auto_refresh
+        self.store = store if store is not None else MemoryTokenStore()
+
+        self._lock = threading.Lock()  # guards the token state
+        self._refresh_lock = threading.Lock()  # only one refresh runs at a time
+        self._access_token = None
+        self._refresh_token = None
+        self._expires_at = 0.0
+        self._timer = None
+        self._stopped = False
+
+    # Log in with the Password grant and start the background refresh
+    def start(self):
+        self._stopped = False
+        self._renew(None)
+        return self
+
+    # Return a valid Access Token, only blocks when there is no valid token (first call or refresh fell behind)
+    def get_access_token(self):
+        with self._lock:
+            access_token = self._access_token
+            if access_token and time.time() < self._expires_at:
+                return access_token
+        self._renew(access_token)
+        with self._lock:
+            return self._access_token
+
+    # Force a renewal, e.g. after a data request received HTTP 401 with the given token
+    def invalidate(self, access_token):
+        self._renew(access_token, force = True)
+
+    # Seconds until the cached token expires (0 if there is no token)
+    def expires_in(self):
+        with self._lock:
+            return max(0.0, self._expires_at - time.time())
+
+    # Stop the background refresh
+    def stop(self):
+        self._stopped = True
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # Renew the token unless another caller (or another process sharing the store) already replaced stale_token
+    # while we waited for the lock
+    def _renew(self, stale_token, force = False):
+        with self._refresh_lock:
+            with self._lock:
+                token_replaced = self._access_token is not None and self._access_token != stale_token
+                if token_replaced and (force or time.time() < self._expires_at):
+                    return
+                refresh_token = self._refresh_token
+
+            with self.store.lock():
+                shared_token = self.store.load()
+                if shared_token and shared_token['access_token'] != stale_token and time.time() < shared_token['expires_at']:
+                    self._use_token(shared_token)
+                    return
+                if shared_token and shared_token.get('refresh_token'):
+                    refresh_token = shared_token['refresh_token']
+
+                access_token, refresh_token, expires_in = self._authenticate(refresh_token)
+                token = {
+                    'access_token': access_token,
+                    'refresh_token': refresh_token,
+                    'expires_at': time.time() + expires_in,
+                    'expires_in': expires_in
+                }
+                self.store.save(token)
+            self._use_token(token)
+
+    # Cache the token and schedule its background refresh
+    def _use_token(self, token):
+        with self._lock:
+            self._access_token = token['access_token']
+            self._refresh_token = token['refresh_token']
+            self._expires_at = token['expires_at']
+        lifetime = token.get('expires_in') or (token['expires_at'] - time.time())
+        self._schedule(token['expires_at'] - time.time() - lifetime * self.refresh_margin)
+
+    # Refresh Token grant first, fall back to the Password grant if there is no Refresh Token or it is rejected
+    def _authenticate(self, refresh_token):
+        if refresh_token is not None:
+            try:
+                access_token, new_refresh_token, expires_in = self.controller.rdp_authentication(
+                    self.auth_url, self.username, self.password, self.client_id, refresh_token)
+                if access_token:
+                    return access_token, new_refresh_token, expires_in
+            except requests.exceptions.HTTPError as exp:
+                print(f'Refresh Token rejected, login with Password grant: {exp}')
+
+        access_token, refresh_token, expires_in = self.controller.rdp_authentication(
+            self.auth_url, self.username, self.password, self.client_id)
+        if not access_token:
+            raise requests.exceptions.RequestException('RDP authentication failure: no response from the RDP Auth Service')
+        return access_token, refresh_token, expires_in
+
+    def _schedule(self, delay):
+        if not self.auto_refresh or self._stopped:
+            return
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(max(0.0, delay), self._background_refresh)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _background_refresh(self):
+        if self._stopped:
+            return
+        with self._lock:
+            access_token = self._access_token
+        try:
+            self._renew(access_token, force = True)
+        except Exception as exp:
+            print(f'Background token refresh failure: {exp}')
+            remaining = self.expires_in()
+            self._schedule(min(self.retry_interval, remaining / 2) if remaining else self.retry_interval)
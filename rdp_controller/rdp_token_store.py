@@ -0,0 +1,119 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Token stores used by the RDPTokenManager to share one Access/Refresh Token pair.
+# A store keeps a dict {'access_token', 'refresh_token', 'expires_at'} where expires_at is a time.time() timestamp,
+# and provides lock() so that only one holder of the store renews the token at a time.
+
+# In-process store (the default), shares the token between the managers of one process
+class MemoryTokenStore():
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._token = None
+
+    def lock(self):
+        return self._lock
+
+    def load(self):
+        return dict(self._token) if self._token else None
+
+    def save(self, token):
+        self._token = dict(token)
+
+    def clear(self):
+        self._token = None
+
+# File store shared by all processes of one host
+# The token is kept in a small JSON file (owner read/write only) replaced atomically on save, lock() takes an
+# exclusive lock on a side file so only one process logs in or refreshes while the others wait and reuse its token.
+class FileTokenStore():
+
+    def __init__(self, path):
+        if not path:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        self.path = os.path.abspath(path)
+        self.lock_path = self.path + '.lock'
+        self._thread_lock = threading.RLock()  # file locks are per process, serialise the threads too
+        self._depth = 0
+        self._lock_file = None
+
+    @contextlib.contextmanager
+    def lock(self):
+        with self._thread_lock:
+            if self._depth == 0:
+                self._lock_file = open(self.lock_path, 'a+b')
+                self._acquire_file_lock(self._lock_file)
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._release_file_lock(self._lock_file)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding = 'utf-8') as token_file:
+                token = json.load(token_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(token, dict) or not token.get('access_token'):
+            return None
+        return token
+
+    def save(self, token):
+        directory = os.path.dirname(self.path)
+        file_descriptor, temp_path = tempfile.mkstemp(dir = directory, prefix = '.rdp_token_')
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding = 'utf-8') as token_file:
+                json.dump(token, token_file)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    def clear(self):
+        with contextlib.suppress(OSError):
+            os.remove(self.path)
+
+    @staticmethod
+    def _acquire_file_lock(lock_file):
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _release_file_lock(lock_file):
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -17,7 +17,7 @@ import os
 sys.path.append('..')
 
 from rdp_controller import rdp_http_controller
-from app import convert_pandas
+from rdp_controller import rdp_async_http_controller
 
 # Supply test environment variables
 @pytest.fixture(scope='class')
@@ -31,9 +31,27 @@ def supply_test_config():
 def supply_test_class():
     return rdp_http_controller.RDPHTTPController()
 
+# Supply test AsyncRDPHTTPController class
+@pytest.fixture(scope='class')
+def supply_test_async_class():
+    async_controller = rdp_async_http_controller.AsyncRDPHTTPController(max_concurrency = 4)
+    yield async_controller
+    async_controller.close()
+
+# Supply a fake RDP server (benchmarks.fake_rdp_server), the options of start_fake_rdp_server() are passed with
+# @pytest.mark.parametrize('supply_test_fake_server', [{...}], indirect = True), returns (server, base_url)
+@pytest.fixture
+def supply_test_fake_server(request):
+    from benchmarks.fake_rdp_server import start_fake_rdp_server
+    server, base_url = start_fake_rdp_server(**getattr(request, 'param', {}))
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
+
 # Supply test main app.py
 @pytest.fixture(scope='class')
 def supply_test_app():
+    from app import convert_pandas  # imported on use, the controller tests do not need pandas
     return convert_pandas
 
 # Supply test static JSON mock messages
@@ -12,8 +12,16 @@ ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR
 
 import pytest
 import requests
+import os
+import subprocess
+import sys
+import tempfile
 import json
 import pandas as pd
+import numpy as np
+
+from app import iter_esg_dataframes, search_explore_dataframe, ric_metadata_dataframe, export_columnar, import_columnar, join_esg_views
+from rdp_controller.rdp_json_stream import JSONArraySpill, JSONArrayStream
 
 @pytest.mark.test_app
 def test_can_convert_json_to_pandas(supply_test_app, shared_datadir ):
@@ -60,5 +68,225 @@ def test_can_convert_json_invalid(supply_test_app):
     
     assert 'Error converting JSON to Dataframe' in str(excinfo.value),'Invalid JSON convert_pandas method call return wrong Exception description'
 
+@pytest.mark.test_app
+def test_convert_json_typed_columns(supply_test_app, shared_datadir):
+    """
+    Test that the convert_pandas function builds typed columns from the headers metadata
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    convert_pandas = supply_test_app
+    result = convert_pandas(mock_esg_data)
+
+    assert result['ESG Score'].dtype == 'float64', 'Number column is not float64'
+    assert pd.api.types.is_datetime64_dtype(result['Period End Date']), 'Date column is not datetime64'
+    assert pd.api.types.is_datetime64_dtype(result['TEST 10 Last Update Date']), 'Datetime column is not datetime64'
+    assert isinstance(result['TEST 6 Score Grade'].dtype, pd.CategoricalDtype), 'Grade column is not categorical'
+    assert result['Period End Date'].iloc[0] == pd.Timestamp('2021-12-31')
+
+    # The dtypes come from the headers, not from the number of unique values
+    categoricals = [title for title in result.columns if isinstance(result[title].dtype, pd.CategoricalDtype)]
+    assert categoricals == ['Instrument', 'TEST 6 Score Grade', 'TEST 7 Score Grade', 'TEST 8 Score Grade'], 'Wrong categorical columns'
+    assert result['ESG Report Auditor Name'].dtype == object, 'Free text column is categorical'
+    repeated = convert_pandas({**mock_esg_data, 'data': mock_esg_data['data'] * 200})
+    assert (repeated.dtypes == result.dtypes).all(), 'Column dtypes depend on the payload size'
+
+    result = convert_pandas(mock_esg_data, categorical = ['ESG Report Auditor Name'])
+    assert isinstance(result['ESG Report Auditor Name'].dtype, pd.CategoricalDtype) and result['Instrument'].dtype == object, 'categorical does not override the header rule'
+
+@pytest.mark.test_app
+def test_convert_json_column_projection(supply_test_app, shared_datadir):
+    """
+    Test that the convert_pandas function only builds the requested columns
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    convert_pandas = supply_test_app
+    result = convert_pandas(mock_esg_data, columns = ['Instrument', 'ESG Score'])
+
+    assert list(result.columns) == ['Instrument', 'ESG Score'], 'convert_pandas() returns wrong projected columns'
+    assert len(result) == len(mock_esg_data['data'])
+
+    with pytest.raises(TypeError) as excinfo:
+        convert_pandas(mock_esg_data, columns = ['Unknown Column'])
+    assert 'Error converting JSON to Dataframe' in str(excinfo.value), 'Unknown column returns wrong Exception description'
+
+@pytest.mark.test_app
+def test_convert_json_memory_budget(supply_test_app, shared_datadir):
+    """
+    Test that the convert_pandas function builds the same DataFrame in row chunks under a memory_budget
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    # One instrument per row, so categories differ between the chunks
+    mock_esg_data['data'] = [[f'RIC{index}.L'] + row[1:] for index, row in enumerate(mock_esg_data['data'] * 20)]
+
+    convert_pandas = supply_test_app
+    expected = convert_pandas(mock_esg_data)
+    # Budget for about three rows per chunk
+    result = convert_pandas(mock_esg_data, memory_budget = 3 * len(mock_esg_data['headers']) * 16)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert isinstance(result['TEST 6 Score Grade'].dtype, pd.CategoricalDtype), 'Chunked grade column is not categorical'
+    assert list(result['Instrument'].cat.categories) == sorted(result['Instrument'].astype(str)), 'Chunked categories are not joined'
+
+    # Spilled rows (JSONArraySpill) are converted chunk by chunk from their file
+    spill_file = tempfile.TemporaryFile()
+    spill_file.write(json.dumps(mock_esg_data).encode('utf-8'))
+    spilled = {'headers': mock_esg_data['headers'], 'data': JSONArraySpill(spill_file, length = len(mock_esg_data['data']), read_size = 64)}
+    pd.testing.assert_frame_equal(convert_pandas(spilled, memory_budget = 7 * len(mock_esg_data['headers']) * 16), expected)
+    pd.testing.assert_frame_equal(convert_pandas(spilled), expected)
+    spilled['data'].close()
+
+@pytest.mark.test_app
+@pytest.mark.test_stream
+def test_convert_esg_stream_to_dataframes(shared_datadir):
+    """
+    Test that a streamed ESG response is converted to DataFrame chunks
+    """
+    raw = (shared_datadir / 'test_esg_fixture.json').read_bytes()
+    mock_esg_data = json.loads(raw)
+
+    # The fixture sends 'headers' after 'data', the rows are held back until the headers are parsed
+    esg_stream = JSONArrayStream([raw[index:index + 64] for index in range(0, len(raw), 64)])
+    frames = list(iter_esg_dataframes(esg_stream, chunk_size = 2, columns = ['Instrument', 'ESG Score']))
+    assert [len(frame) for frame in frames] == [2, 2, 1], 'iter_esg_dataframes() returns wrong chunks'
+    assert list(frames[0].columns) == ['Instrument', 'ESG Score']
+
+    # With known headers every chunk is converted as soon as it is parsed
+    esg_stream = JSONArrayStream([raw])
+    frames = list(iter_esg_dataframes(esg_stream, chunk_size = 3, headers = mock_esg_data['headers']))
+    assert sum(len(frame) for frame in frames) == len(mock_esg_data['data'])
+    assert frames[0]['ESG Score'].dtype == 'float64'
+
+@pytest.mark.test_app
+def test_search_explore_dataframe(shared_datadir):
+    """
+    Test that Search Explore hits are collected into a columnar DataFrame
+    """
+    mock_search_data = json.loads((shared_datadir / 'test_search_fixture.json').read_text())
+    hits = mock_search_data['Hits'] * 3 + [{'IssuerCommonName': 'Partial Hit'}]
+
+    result = search_explore_dataframe(iter(hits), columns = 'IssuerCommonName, IssueISIN')
+
+    assert list(result.columns) == ['IssuerCommonName', 'IssueISIN'], 'search_explore_dataframe() returns wrong columns'
+    assert len(result) == 4
+    assert result['IssueISIN'].iloc[3] is None, 'Missing fields are not filled with None'
+    assert search_explore_dataframe([]).empty
+
+@pytest.mark.test_app
+def test_ric_metadata_dataframe():
+    """
+    Test that resolved RIC metadata is converted to a RIC-indexed DataFrame
+    """
+    metadata = {
+        'A.L': {'RIC': 'A.L', 'IssuerCommonName': 'A Name', 'IssueISIN': 'ISINA'},
+        'B.L': {'RIC': 'B.L', 'IssuerCommonName': 'B Name', 'IssueISIN': 'ISINB'}
+    }
+    result = ric_metadata_dataframe(metadata)
+
+    assert result.index.name == 'RIC'
+    assert list(result.columns) == ['IssuerCommonName', 'IssueISIN'], 'ric_metadata_dataframe() returns wrong columns'
+    assert result.loc['B.L', 'IssueISIN'] == 'ISINB'
+
+@pytest.mark.test_app
+def test_columnar_export_import(supply_test_app, shared_datadir, tmp_path):
+    """
+    Test that a converted ESG DataFrame can be exported to columnar files and memory-mapped back
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    esg_df = supply_test_app(mock_esg_data)
+
+    export_columnar(esg_df, tmp_path / 'esg')
+    result = import_columnar(tmp_path / 'esg')
+    # string columns come back as categoricals
+    pd.testing.assert_frame_equal(result.astype(object), esg_df.astype(object))
+    assert result['ESG Score'].dtype == 'float64'
+    assert pd.api.types.is_datetime64_dtype(result['Period End Date'])
+
+    # Only the selected columns are opened, backed by the memory-mapped files
+    result = import_columnar(tmp_path / 'esg', columns = ['ESG Score', 'ESG Controversies Score'])
+    assert list(result.columns) == ['ESG Score', 'ESG Controversies Score']
+    assert isinstance(result['ESG Score'].to_numpy().base, np.memmap) or isinstance(result['ESG Score'].to_numpy(), np.memmap), 'Column is not memory-mapped'
+
+    with pytest.raises(TypeError):
+        import_columnar(tmp_path / 'esg', columns = ['Unknown Column'])
+
+@pytest.mark.test_app
+def test_columnar_reexport_keeps_mapped_readers(supply_test_app, shared_datadir, tmp_path):
+    """
+    Test that re-exporting a columnar directory does not change the data of a reader opened before it
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    esg_df = supply_test_app(mock_esg_data)
+
+    export_columnar(esg_df, tmp_path / 'esg')
+    reader = import_columnar(tmp_path / 'esg')
+    expected = reader.copy(deep = True)
+
+    # Re-export fewer, changed rows with fewer columns
+    changed = esg_df.iloc[:2, :3].copy()
+    changed['ESG Score'] = -1.0
+    changed['Instrument'] = pd.Categorical(['OTHER.RIC', 'A.RIC'])
+    export_columnar(changed, tmp_path / 'esg')
+
+    pd.testing.assert_frame_equal(reader, expected, check_categorical = False)
+    pd.testing.assert_frame_equal(import_columnar(tmp_path / 'esg').astype(object), changed.astype(object))
+    column_files = [path.name for path in (tmp_path / 'esg').iterdir() if path.suffix == '.npy']
+    assert len(column_files) == 3, 'Re-export leaves the column files of the earlier export behind'
+
+@pytest.mark.test_app
+def test_join_esg_views(shared_datadir):
+    """
+    Test that ESG views are aligned on Instrument and Period End Date into one wide DataFrame
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    headers = mock_esg_data['headers']
+    rows = mock_esg_data['data']
+    basic = {'headers': headers[:3] + [{'name': 'basic', 'title': 'Basic Score', 'type': 'number'}], 'data': [row[:3] + [1.0] for row in rows[:2]]}
+    measures = {'headers': [headers[0], {'name': 'sector', 'title': 'Sector', 'type': 'string'}], 'data': [[rows[0][0], 'Test Sector']]}
+
+    result = join_esg_views({'scores-full': mock_esg_data, 'basic': basic, 'measures-full': measures})
+
+    assert len(result) == len(rows), 'join_esg_views returns wrong number of rows'
+    assert list(result.columns) == [header['title'] for header in headers] + ['Basic Score', 'Sector'], 'join_esg_views returns wrong columns'
+    assert result['Basic Score'].notna().sum() == 2, 'join_esg_views does not align the views on the period'
+    assert (result['Sector'] == 'Test Sector').all(), 'join_esg_views does not broadcast a view without periods'
+
+    inner = join_esg_views({'scores-full': mock_esg_data, 'basic': basic}, columns = {'scores-full': ['ESG Score']}, how = 'inner')
+    assert list(inner.columns) == ['Instrument', 'Period End Date', 'ESG Score', 'Basic Score'] and len(inner) == 2, 'join_esg_views returns wrong inner join'
+
+@pytest.mark.test_app
+def test_join_esg_views_different_instruments(shared_datadir):
+    """
+    Test that an outer join keeps the periods when the views return different instruments
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    headers = mock_esg_data['headers'][:3]
+    scores = {'headers': headers, 'data': [[ric] + row[1:3] for ric in ('X.L', 'Y.L') for row in mock_esg_data['data'][:2]]}
+    measures = {'headers': [headers[0], {'name': 'sector', 'title': 'Sector', 'type': 'string'}], 'data': [['Z.L', 'Sector Z'], ['W.L', 'Sector W']]}
+
+    result = join_esg_views({'scores-full': scores, 'measures-full': measures})
+
+    assert list(result.columns) == [header['title'] for header in headers] + ['Sector'], 'join_esg_views returns wrong columns'
+    assert sorted(result['Instrument']) == ['W.L', 'X.L', 'X.L', 'Y.L', 'Y.L', 'Z.L'], 'join_esg_views drops instruments'
+    assert result['Period End Date'].notna().sum() == 4, 'join_esg_views loses the periods'
+    assert result.loc[result['Instrument'] == 'Z.L', 'Sector'].tolist() == ['Sector Z']
+
+    # a view without periods first, the periods still come second
+    result = join_esg_views({'measures-full': measures, 'scores-full': scores}, how = 'inner')
+    assert result.empty and list(result.columns)[:2] == ['Instrument', 'Period End Date'], 'join_esg_views returns wrong inner join'
+
+@pytest.mark.test_app
+def test_core_import_without_pandas():
+    """
+    Test that importing app and the controllers does not import pandas/numpy until a conversion is used
+    """
+    code = ('import sys, app, rdp_controller.rdp_http_controller, rdp_controller.rdp_async_http_controller;'
+        'assert "pandas" not in sys.modules and "numpy" not in sys.modules;'
+        'app.convert_pandas; assert "pandas" in sys.modules')
+    result = subprocess.run([sys.executable, '-c', code], cwd = os.path.join(os.path.dirname(__file__), '..'), capture_output = True, text = True)
+
+    assert result.returncode == 0, f'Core import pulls in pandas/numpy: {result.stderr}'
+
 if __name__ == '__main__':
     print('This is the test_app.py test file')
\ No newline at end of file
@@ -0,0 +1,66 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+import pytest
+
+from rdp_controller import rdp_http_controller
+from rdp_controller.rdp_rate_limiter import RDPRateLimiter
+from benchmarks.bench_suite import compare_results
+from benchmarks.fake_rdp_server import AUTH_PATH, SEARCH_PATH
+
+ESG_PATH = '/data/environmental-social-governance/v2/views/scores-full'
+
+@pytest.mark.test_benchmark
+@pytest.mark.parametrize('supply_test_fake_server', [{'periods': 3, 'search_total': 250}], indirect = True)
+def test_fake_rdp_server(supply_test_fake_server):
+    """
+    Test that the fake RDP server answers the auth, ESG and Search Explore requests of the controller
+    """
+    server, base_url = supply_test_fake_server
+    with rdp_http_controller.RDPHTTPController(verbose = False) as app:
+        access_token, refresh_token, expires_in = app.rdp_authentication(base_url + AUTH_PATH, 'user', 'password', 'client_id')
+        response = app.rdp_request_esg_bulk(base_url + ESG_PATH, access_token, ['A.L', 'B.L', 'INVALID.L'], batch_size = 3)
+        hits = list(app.rdp_iter_search_explore(base_url + SEARCH_PATH, access_token, {'View': 'Entities', 'Query': 'all'}))
+
+    assert access_token and refresh_token and expires_in == 600, 'Fake RDP server returns wrong token'
+    assert [row[0] for row in response['data']] == ['A.L'] * 3 + ['B.L'] * 3, 'Fake RDP server returns wrong ESG rows'
+    assert list(response['errors']) == ['INVALID.L'], 'Fake RDP server does not reject the invalid RIC'
+    assert len(hits) == 250 and hits[-1]['RIC'] == 'RIC000249.L', 'Fake RDP server returns wrong Search Explore pages'
+
+@pytest.mark.test_benchmark
+@pytest.mark.parametrize('supply_test_fake_server', [{'throttle_rate': 0.5, 'retry_after': 0}], indirect = True)
+def test_fake_rdp_server_throttling(supply_test_fake_server):
+    """
+    Test that the fake RDP server injects HTTP 429 responses which the controller retries
+    """
+    server, base_url = supply_test_fake_server
+    rate_limiter = RDPRateLimiter(rates = {'esg': (1000.0, 100)}, base_delay = 0.001, max_delay = 0.01)
+    with rdp_http_controller.RDPHTTPController(rate_limiter = rate_limiter, throttle_retries = 50, verbose = False) as app:
+        for index in range(10):
+            assert 'data' in app.rdp_request_esg(base_url + ESG_PATH, 'token', f'RIC{index}.L'), 'Throttled request is not retried'
+
+    assert server.throttled > 0 and server.requests == server.throttled + 10, 'Fake RDP server returns wrong throttling counters'
+
+@pytest.mark.test_benchmark
+def test_compare_results():
+    """
+    Test that the benchmark comparison reports throughput, latency and memory regressions only beyond the tolerance
+    """
+    baseline = {'esg_sync': {'throughput': 100.0, 'p99_ms': 10.0, 'peak_mib': 1.0}}
+
+    assert compare_results(baseline, {'esg_sync': {'throughput': 90.0, 'p99_ms': 11.0, 'peak_mib': 1.1}}, 0.25) == []
+    regressions = compare_results(baseline, {'esg_sync': {'throughput': 50.0, 'p99_ms': 20.0, 'peak_mib': 1.0}, 'new': {'throughput': 1.0}}, 0.25)
+    assert len(regressions) == 2 and all(regression.startswith('esg_sync') for regression in regressions), 'Benchmark comparison returns wrong regressions'
+
+if __name__ == '__main__':
+    print('This is the benchmark harness test file')
@@ -0,0 +1,169 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+import pytest
+import json
+import os
+import requests
+
+from app import import_columnar
+from pipeline import read_rics, load_checkpoint, run_pipeline, CHECKPOINT_FILE, ERRORS_FILE, PARTS_DIRECTORY, SPOOL_DIRECTORY
+from rdp_controller import rdp_http_controller
+
+# Mock RDP ESG: one row per requested RIC, the whole request fails if any RIC is invalid
+def mock_esg_universe(requests_mock, esg_endpoint, shared_datadir):
+    valid_response = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    invalid_response = json.loads((shared_datadir / 'test_esg_invalid_fixture.json').read_text())
+
+    def esg_callback(request, context):
+        context.status_code = 200
+        rics = request.qs['universe'][0].upper().split(',')
+        if any(ric.startswith('INVALID') for ric in rics):
+            return invalid_response
+        return {
+            'headers': valid_response['headers'],
+            'data': [[ric] + valid_response['data'][0][1:] for ric in rics],
+            'universe': [{'Instrument': ric} for ric in rics]
+        }
+
+    return requests_mock.get(url= esg_endpoint, json = esg_callback)
+
+@pytest.mark.test_pipeline
+def test_read_rics(tmp_path):
+    """
+    Test that it can read a RIC list with comments, commas and duplicates
+    """
+    rics_file = tmp_path / 'rics.txt'
+    rics_file.write_text('# universe\nA.L, B.L\n\nC.L\nA.L  # duplicate\n')
+
+    assert read_rics(str(rics_file)) == ['A.L', 'B.L', 'C.L'], 'read_rics returns wrong RICs'
+
+@pytest.mark.test_pipeline
+def test_run_pipeline(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock, tmp_path):
+    """
+    Test that the pipeline writes every batch, checkpoints it and reports the invalid RICs
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    mock_esg_universe(requests_mock, esg_endpoint, shared_datadir)
+
+    rics = [f'TEST{index}.RIC' for index in range(10)] + ['INVALID.RIC']
+    summary = run_pipeline(supply_test_class, lambda: access_token, esg_endpoint, rics, str(tmp_path), batch_size = 4, io_workers = 2, cpu_workers = 2)
+
+    assert summary == {'rics': 11, 'skipped': 0, 'rows': 10, 'errors': 1}, 'Pipeline returns wrong summary'
+    assert load_checkpoint(str(tmp_path)) == set(rics[:10]), 'Pipeline does not checkpoint the completed RICs only'
+
+    parts = sorted(os.listdir(tmp_path / PARTS_DIRECTORY))
+    # TEST8..INVALID is rejected and split: TEST8 and TEST9 get their own parts
+    assert len(parts) == 4, 'Pipeline writes wrong number of parts'
+    instruments = set()
+    for part in parts:
+        instruments.update(import_columnar(str(tmp_path / PARTS_DIRECTORY / part))['Instrument'].astype(str))
+    assert instruments == {ric.upper() for ric in rics[:10]}, 'Pipeline parts contain wrong instruments'
+
+    errors = [json.loads(line) for line in (tmp_path / ERRORS_FILE).read_text().splitlines()]
+    assert [error['ric'] for error in errors] == ['INVALID.RIC'], 'Pipeline reports wrong errors'
+
+@pytest.mark.test_pipeline
+def test_run_pipeline_resume(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock, tmp_path):
+    """
+    Test that a restarted pipeline only fetches the RICs missing from the checkpoint
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    esg_mock = mock_esg_universe(requests_mock, esg_endpoint, shared_datadir)
+
+    (tmp_path / CHECKPOINT_FILE).write_text('A.L,B.L\n')
+    summary = run_pipeline(supply_test_class, lambda: access_token, esg_endpoint, ['A.L', 'B.L', 'C.L'], str(tmp_path), batch_size = 4, cpu_workers = 1)
+
+    assert summary['skipped'] == 2 and summary['rows'] == 1, 'Pipeline does not resume from the checkpoint'
+    assert [request.qs['universe'][0] for request in esg_mock.request_history] == ['c.l'], 'Pipeline requests completed RICs again'
+
+    # Nothing left to do on a second restart
+    summary = run_pipeline(supply_test_class, lambda: access_token, esg_endpoint, ['A.L', 'B.L', 'C.L'], str(tmp_path))
+    assert summary['skipped'] == 3 and esg_mock.call_count == 1, 'Pipeline requests completed RICs again'
+
+@pytest.mark.test_pipeline
+def test_run_pipeline_retries_failed_rics(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock, tmp_path):
+    """
+    Test that RICs that failed with a connection error are not checkpointed and are fetched again on restart
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+
+    requests_mock.get(url= esg_endpoint, exc = requests.exceptions.ConnectTimeout)
+    summary = run_pipeline(supply_test_class, lambda: access_token, esg_endpoint, ['A.L', 'B.L'], str(tmp_path), cpu_workers = 1)
+    assert summary['rows'] == 0 and summary['errors'] == 2
+    assert load_checkpoint(str(tmp_path)) == set(), 'Pipeline checkpoints RICs that failed'
+
+    esg_mock = mock_esg_universe(requests_mock, esg_endpoint, shared_datadir)
+    summary = run_pipeline(supply_test_class, lambda: access_token, esg_endpoint, ['A.L', 'B.L'], str(tmp_path), cpu_workers = 1)
+    assert summary['skipped'] == 0 and summary['rows'] == 2, 'Pipeline does not retry the failed RICs'
+    assert esg_mock.call_count == 1 and load_checkpoint(str(tmp_path)) == {'A.L', 'B.L'}
+
+@pytest.mark.test_pipeline
+def test_run_pipeline_backpressure(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock, tmp_path):
+    """
+    Test that at most io_workers + cpu_workers batches are fetched or converted at a time
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    mock_esg_universe(requests_mock, esg_endpoint, shared_datadir)
+    controller = supply_test_class
+    behind = []
+
+    # Every batch is checkpointed when it completes, a fetch may only start once all but the last 2 batches did
+    class CountingController():
+        def rdp_request_esg_raw(self, *args, **kwargs):
+            fetches = len(behind)
+            checkpoint = tmp_path / CHECKPOINT_FILE
+            completed = len(checkpoint.read_text().splitlines()) if checkpoint.exists() else 0
+            behind.append(fetches - completed)
+            return controller.rdp_request_esg_raw(*args, **kwargs)
+
+    rics = [f'TEST{index}.RIC' for index in range(12)]
+    summary = run_pipeline(CountingController(), lambda: access_token, esg_endpoint, rics, str(tmp_path), batch_size = 1, io_workers = 1, cpu_workers = 1)
+
+    assert summary['rows'] == 12
+    assert max(behind) <= 1, 'Pipeline fetches more batches than io_workers + cpu_workers ahead of the conversion'
+
+@pytest.mark.test_pipeline
+def test_run_pipeline_spilled_bodies(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock, tmp_path):
+    """
+    Test that bodies over spill_bytes are passed to the conversion processes as spool files and removed afterwards
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    mock_esg_universe(requests_mock, esg_endpoint, shared_datadir)
+    controller = rdp_http_controller.RDPHTTPController(spill_bytes = 100, verbose = False)
+
+    rics = [f'TEST{index}.RIC' for index in range(6)] + ['INVALID.RIC']
+    summary = run_pipeline(controller, lambda: access_token, esg_endpoint, rics, str(tmp_path), batch_size = 4, io_workers = 2, cpu_workers = 2)
+
+    assert summary == {'rics': 7, 'skipped': 0, 'rows': 6, 'errors': 1}, 'Pipeline with spill_bytes returns wrong summary'
+    assert load_checkpoint(str(tmp_path)) == set(rics[:6])
+    assert os.listdir(tmp_path / SPOOL_DIRECTORY) == [], 'Pipeline leaves spool files behind'
+
+@pytest.mark.empty_case
+@pytest.mark.test_pipeline
+def test_run_pipeline_empty(supply_test_class, tmp_path):
+    """
+    Test that the pipeline rejects an empty RIC list
+    """
+    with pytest.raises(TypeError) as excinfo:
+        run_pipeline(supply_test_class, lambda: 'token', 'https://esg', [], str(tmp_path))
+
+    assert 'Received invalid (None or Empty) arguments' in str(excinfo.value), 'Empty run_pipeline call return wrong Exception description'
+
+if __name__ == '__main__':
+    print('This is the pipeline test file')
@@ -0,0 +1,165 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import requests
+import json
+import asyncio
+import threading
+import time
+
+from rdp_controller import rdp_async_http_controller
+
+
+@pytest.mark.test_valid
+@pytest.mark.test_async
+def test_async_login_rdp_success(supply_test_config, supply_test_async_class, supply_test_mock_json, requests_mock):
+    """
+    Test that the async controller can log in to the RDP Auth Service
+    """
+    auth_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL']
+    app = supply_test_async_class
+
+    requests_mock.post(
+        url= auth_endpoint, 
+        json = supply_test_mock_json['valid_auth_json'], 
+        status_code = 200,
+        headers = {'Content-Type':'application/json'}
+        )
+
+    access_token, refresh_token, expires_in = asyncio.run(app.rdp_authentication(
+        auth_endpoint, supply_test_config['RDP_USERNAME'], supply_test_config['RDP_PASSWORD'], supply_test_config['RDP_CLIENTID']))
+
+    assert access_token == supply_test_mock_json['valid_auth_json']['access_token']
+    assert refresh_token is not None
+    assert expires_in > 0
+
+@pytest.mark.test_valid
+@pytest.mark.test_async
+def test_async_fan_out_esg_search(supply_test_config, supply_test_async_class, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that many ESG and Search Explore requests can be awaited concurrently from one event loop
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    app = supply_test_async_class
+
+    requests_mock.get(url= esg_endpoint, json = json.loads((shared_datadir / 'test_esg_fixture.json').read_text()), status_code = 200)
+    requests_mock.post(url= search_endpoint, json = json.loads((shared_datadir / 'test_search_fixture.json').read_text()), status_code = 200)
+
+    rics = [f'TEST{index}.RIC' for index in range(20)]
+    payload = supply_test_mock_json['search_explore_payload']
+
+    async def fan_out():
+        esg_calls = [app.rdp_request_esg(esg_endpoint, access_token, ric) for ric in rics]
+        search_calls = [app.rdp_request_search_explore(search_endpoint, access_token, {**payload, 'Filter': f'RIC eq \'{ric}\''}) for ric in rics]
+        return await asyncio.gather(*esg_calls, *search_calls)
+
+    results = asyncio.run(fan_out())
+
+    assert len(results) == 2 * len(rics)
+    assert all('data' in result for result in results[:len(rics)]), 'Async ESG request returns wrong data'
+    assert all('Hits' in result for result in results[len(rics):]), 'Async Search Explore request returns wrong data'
+    assert requests_mock.call_count == 2 * len(rics)
+
+@pytest.mark.test_async
+def test_async_request_esg_token_expire(supply_test_config, supply_test_async_class, supply_test_mock_json, requests_mock):
+    """
+    Test that the async controller raises the same HTTPError as the sync controller
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    app = supply_test_async_class
+
+    requests_mock.get(
+        url= esg_endpoint, 
+        json = supply_test_mock_json['token_expire_json'], 
+        status_code = 401,
+        headers = {'Content-Type':'application/json'}
+        )
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        asyncio.run(app.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC'))
+
+    assert '401' in str(excinfo.value), 'Access Token Expire returns wrong HTTP Status Code'
+    assert 'Unauthorized' in str(excinfo.value), 'Access Token Expire returns wrong error message'
+
+@pytest.mark.empty_case
+@pytest.mark.test_async
+def test_async_request_search_explore_none_empty(supply_test_async_class, supply_test_mock_json):
+    """
+    Test that the async Search Explore function can handle none/empty input
+    """
+    app = supply_test_async_class
+
+    with pytest.raises(TypeError) as excinfo:
+        asyncio.run(app.rdp_request_search_explore('', supply_test_mock_json['valid_auth_json']['access_token'], {}))
+
+    assert 'Received invalid (None or Empty) arguments' in str(excinfo.value),'Empty Search explore request returns wrong Exception description'
+
+@pytest.mark.test_valid
+@pytest.mark.test_async
+def test_async_request_esg_bulk(supply_test_config, supply_test_async_class, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the async controller can request ESG data for many RICs in concurrent batches
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    valid_response = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    app = supply_test_async_class
+
+    def esg_callback(request, context):
+        context.status_code = 200
+        rics = request.qs['universe'][0].upper().split(',')
+        return {'headers': valid_response['headers'], 'data': [[ric] for ric in rics], 'universe': [{'Instrument': ric} for ric in rics]}
+
+    requests_mock.get(url= esg_endpoint, json = esg_callback)
+
+    rics = [f'TEST{index}.RIC' for index in range(25)]
+    response = asyncio.run(app.rdp_request_esg_bulk(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], rics, batch_size = 10))
+
+    assert requests_mock.call_count == 3, 'Async bulk ESG request sends wrong number of batches'
+    assert [row[0] for row in response['data']] == [ric.upper() for ric in rics], 'Async bulk ESG request returns wrong data'
+    assert response['errors'] == {}
+
+@pytest.mark.test_async
+def test_async_close_does_not_block_loop():
+    """
+    Test that leaving the async context waits for the running requests without blocking the event loop
+    """
+    release = threading.Event()
+
+    # Controller whose login only returns once the event loop released it
+    class SlowController():
+        def rdp_authentication(self, *args):
+            if not release.wait(5):
+                raise TimeoutError('event loop was blocked')
+            return 'access_token', 'refresh_token', 600
+
+    async def run():
+        app = rdp_async_http_controller.AsyncRDPHTTPController(controller = SlowController())
+        request = asyncio.ensure_future(app.rdp_authentication('auth_url', 'username', 'password', 'client_id'))
+        await asyncio.sleep(0.05)
+
+        async def release_later():
+            await asyncio.sleep(0.05)
+            release.set()
+
+        started = time.monotonic()
+        await asyncio.gather(app.__aexit__(None, None, None), release_later())
+        return await request, time.monotonic() - started
+
+    result, elapsed = asyncio.run(run())
+    assert result == ('access_token', 'refresh_token', 600), 'Running request does not finish on close'
+    assert elapsed < 2, 'Closing the async controller blocks the event loop'
+
+if __name__ == '__main__':
+    print('This is the test_rdp_async_http_controller.py test file')
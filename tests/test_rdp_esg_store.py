@@ -0,0 +1,164 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import copy
+import json
+import time
+from datetime import datetime, timezone
+
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_esg_store
+
+
+@pytest.mark.test_sync
+def test_esg_store_merge(tmp_path, shared_datadir):
+    """
+    Test that the ESG store keeps the latest row per instrument and period
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    with rdp_esg_store.ESGStore(tmp_path / 'esg.db') as store:
+        assert store.merge(mock_esg_data) == 5, 'ESG store does not insert new rows'
+        assert store.merge(mock_esg_data) == 0, 'ESG store replaces rows that did not change'
+        assert store.high_water_mark('TEST.RIC') == '2022-06-23T00:00:00'
+
+        updated = copy.deepcopy(mock_esg_data)
+        updated['data'] = [updated['data'][0]]
+        updated['data'][0][2] = 50.0
+        updated['data'][0][-1] = '2022-07-01T00:00:00'
+        assert store.merge(updated) == 1, 'ESG store does not update a newer row'
+        assert store.high_water_mark('TEST.RIC') == '2022-07-01T00:00:00', 'ESG store does not move the high-water mark'
+
+        stored = store.to_response(['TEST.RIC'])
+        assert stored['headers'] == mock_esg_data['headers']
+        assert len(stored['data']) == 5
+        assert stored['data'][0][2] == 50.0
+
+@pytest.mark.test_sync
+def test_sync_esg_fetches_stale_instruments(tmp_path, supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the incremental sync only requests instruments that are new or stale
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    requested = []
+
+    def esg_callback(request, context):
+        rics = request.qs['universe'][0].upper().split(',')
+        requested.extend(rics)
+        context.status_code = 200
+        return {'headers': mock_esg_data['headers'], 'data': [[ric] + row[1:] for ric in rics for row in mock_esg_data['data']]}
+
+    requests_mock.get(url= esg_endpoint, json = esg_callback)
+    app = rdp_http_controller.RDPHTTPController()
+
+    with rdp_esg_store.ESGStore(tmp_path / 'esg.db') as store:
+        summary = rdp_esg_store.sync_esg(app, store, esg_endpoint, access_token, ['A.L', 'B.L'])
+        assert summary['requested'] == 2 and summary['changed_rows'] == 10
+
+        # Second run: A.L and B.L are fresh, only the new instrument is requested
+        requested.clear()
+        summary = rdp_esg_store.sync_esg(app, store, esg_endpoint, access_token, ['A.L', 'B.L', 'C.L'])
+        assert requested == ['C.L'], 'Incremental sync requests fresh instruments'
+        assert summary['skipped'] == 2
+
+        # Everything is stale with max_age 0 and no backoff, unchanged rows are not rewritten
+        summary = rdp_esg_store.sync_esg(app, store, esg_endpoint, access_token, ['A.L', 'B.L', 'C.L'], max_age = 0, backoff = 0)
+        assert summary['requested'] == 3
+        assert summary['changed_rows'] == 0
+
+@pytest.mark.test_sync
+def test_stale_instruments_backoff(tmp_path, shared_datadir):
+    """
+    Test that the refresh interval backs off with the time since the high-water mark of each instrument
+    """
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    now = time.time()
+    day = 24 * 60 * 60
+    recent = datetime.fromtimestamp(now - 5 * day, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+    rows = [['QUIET.L'] + row[1:] for row in mock_esg_data['data']]
+    rows += [['BUSY.L'] + row[1:-1] + [recent] for row in mock_esg_data['data']]
+
+    with rdp_esg_store.ESGStore(tmp_path / 'esg.db') as store:
+        store.merge({'headers': mock_esg_data['headers'], 'data': rows})
+        # Pretend the last sync ran two days ago
+        store._db.execute('UPDATE esg_sync SET last_synced = ?', (now - 2 * day,))
+
+        # BUSY.L changed 5 days ago (interval max(1 day, 0.5 day)), QUIET.L in 2022 (interval capped at 7 days)
+        stale = store.stale_instruments(['QUIET.L', 'BUSY.L', 'NEW.L'], day, backoff = 0.1, max_interval = 7 * day)
+        assert stale == ['BUSY.L', 'NEW.L'], 'Backoff refreshes unchanged instruments too early'
+        assert store.stale_instruments(['QUIET.L', 'BUSY.L'], day) == ['QUIET.L', 'BUSY.L'], 'No backoff does not refresh by max_age'
+
+        store._db.execute('UPDATE esg_sync SET last_synced = ?', (now - 8 * day,))
+        assert store.stale_instruments(['QUIET.L'], day, backoff = 0.1, max_interval = 7 * day) == ['QUIET.L'], 'Backoff is not capped at max_interval'
+
+@pytest.mark.test_sync
+def test_sync_esg_window_requests_missing_periods(tmp_path, supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the history window sync pushes start/end to RDP and only requests the periods the store is missing
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    requested = []
+
+    # Mock RDP ESG: the fixture periods (2017-2021) of every RIC, filtered by the start/end fiscal years
+    def esg_callback(request, context):
+        rics = request.qs['universe'][0].upper().split(',')
+        start, end = int(request.qs['start'][0]), int(request.qs['end'][0])
+        requested.append((rics, start, end))
+        context.status_code = 200
+        rows = [[ric] + row[1:] for ric in rics for row in mock_esg_data['data'] if start <= int(row[1][:4]) <= end]
+        return {'headers': mock_esg_data['headers'], 'data': rows}
+
+    requests_mock.get(url= esg_endpoint, json = esg_callback)
+    app = rdp_http_controller.RDPHTTPController()
+
+    with rdp_esg_store.ESGStore(tmp_path / 'esg.db') as store:
+        summary = rdp_esg_store.sync_esg_window(app, store, esg_endpoint, access_token, ['A.L', 'B.L'], 2021, 2021)
+        assert requested == [(['A.L', 'B.L'], 2021, 2021)], 'Window sync does not push the window to RDP'
+        assert summary['changed_rows'] == 2
+
+        # A.L and B.L hold 2021, C.L is new: all miss 2019..2022 so one request covers them, 2021 is not rewritten
+        requested.clear()
+        summary = rdp_esg_store.sync_esg_window(app, store, esg_endpoint, access_token, ['A.L', 'B.L', 'C.L'], 2019, 2022)
+        assert requested == [(['A.L', 'B.L', 'C.L'], 2019, 2022)], 'Window sync requests wrong windows'
+        assert summary['requests'] == 1 and summary['changed_rows'] == 7
+
+        # D.L is new, A.L only misses 2018: two requests with the smallest windows
+        requested.clear()
+        summary = rdp_esg_store.sync_esg_window(app, store, esg_endpoint, access_token, ['A.L', 'D.L'], 2018, 2021)
+        assert sorted(requested) == [(['A.L'], 2018, 2018), (['D.L'], 2018, 2021)], 'Window sync requests wrong windows'
+        assert summary['requests'] == 2 and summary['changed_rows'] == 5
+
+        # Everything is covered, including 2022 that RDP returned no row for (within max_age)
+        requested.clear()
+        summary = rdp_esg_store.sync_esg_window(app, store, esg_endpoint, access_token, ['A.L', 'B.L', 'C.L'], 2020, 2022)
+        assert requested == [] and summary['skipped'] == 3, 'Window sync requests covered periods again'
+
+        # Once the mark expired, only the unpublished 2022 is requested again
+        summary = rdp_esg_store.sync_esg_window(app, store, esg_endpoint, access_token, ['A.L', 'B.L', 'C.L'], 2020, 2022, max_age = 0)
+        assert requested == [(['A.L', 'B.L', 'C.L'], 2022, 2022)], 'Window sync never requests an empty recent year again'
+
+        # 2016 is before the latest period of C.L, its empty mark never expires
+        store.mark_periods(['C.L'], 2016, 2016)
+        assert 2016 in store.covered_periods(['C.L'], max_age = 0)['C.L'], 'ESG store expires empty history years'
+
+        stored = store.to_response(['A.L'], start = 2020, end = 2021)
+        assert [row[1] for row in stored['data']] == ['2021-12-31', '2020-12-31'], 'ESG store returns wrong window'
+
+        assert rdp_esg_store.plan_esg_window(store, ['A.L', 'B.L', 'E.L'], 2017, 2021) == [(['A.L'], 2017, 2017), (['B.L'], 2017, 2018), (['E.L'], 2017, 2021)]
+
+if __name__ == '__main__':
+    print('This is the test_rdp_esg_store.py test file')
@@ -13,6 +13,11 @@ ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR
 import pytest
 import requests
 import json
+import os
+
+from rdp_controller import rdp_http_controller
+from rdp_controller.rdp_json_stream import JSONArrayChain, JSONArraySpill
+from rdp_controller.rdp_response_cache import RDPResponseCache
 
 
 @pytest.mark.test_valid
@@ -414,5 +419,459 @@ def test_request_search_explore_none_empty(supply_test_class,supply_test_mock_js
     # Check if the exception message is correct
     assert 'Received invalid (None or Empty) arguments' in str(excinfo.value),'Empty Search explore request returns wrong Exception description'
 
+@pytest.mark.test_session
+def test_controller_pooled_session_config():
+    """
+    Test that the controller creates a keep-alive pooled session with the requested pool and retry settings
+    """
+    with rdp_http_controller.RDPHTTPController(pool_connections = 4, pool_maxsize = 32, max_retries = 3) as app:
+        adapter = app.session.get_adapter('https://api.refinitiv.com')
+        assert adapter._pool_connections == 4, 'Pooled session has wrong number of host pools'
+        assert adapter._pool_maxsize == 32, 'Pooled session has wrong pool size per host'
+        assert adapter.max_retries.total == 3, 'Pooled session has wrong retry setting'
+        assert app.session.headers['Connection'] == 'keep-alive', 'Pooled session does not use keep-alive'
+
+@pytest.mark.test_session
+def test_controller_custom_session(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the controller sends requests through a user supplied session and leaves it open on close()
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    contents = (shared_datadir / 'test_esg_fixture.json').read_text()
+    requests_mock.get(url= esg_endpoint, json = json.loads(contents), status_code = 200)
+
+    session = requests.Session()
+    session.headers.update({'X-Test-Session': 'custom'})
+    closed = []
+    session.close = lambda: closed.append(True)
+    app = rdp_http_controller.RDPHTTPController(session = session)
+    assert app.session is session, 'Controller does not use the supplied session'
+
+    response = app.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+    assert 'data' in response
+    assert requests_mock.last_request.headers['X-Test-Session'] == 'custom', 'Request was not sent through the supplied session'
+
+    app.close()
+    assert not closed, 'Controller closed a session it does not own'
+
+@pytest.mark.test_esg
+def test_chunk_universe():
+    """
+    Test that a RIC list is split into request-sized universe batches without duplicates
+    """
+    batches = rdp_http_controller.chunk_universe(['A.L', 'B.L', ' C.L', 'A.L', '', 'D.L', 'E.L'], 2)
+    assert batches == [['A.L', 'B.L'], ['C.L', 'D.L'], ['E.L']], 'chunk_universe returns wrong batches'
+    assert rdp_http_controller.chunk_universe('A.L,B.L', 5) == [['A.L', 'B.L']], 'chunk_universe cannot split a universe string'
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+def test_request_esg_bulk(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that it can request ESG data for many RICs in batches and isolate the invalid RICs
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    valid_response = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    invalid_response = json.loads((shared_datadir / 'test_esg_invalid_fixture.json').read_text())
+    app = supply_test_class
+
+    # Mock RDP ESG: one row per requested RIC, the whole request fails if any RIC is invalid
+    def esg_callback(request, context):
+        context.status_code = 200
+        rics = request.qs['universe'][0].upper().split(',')
+        if any(ric.startswith('INVALID') for ric in rics):
+            return invalid_response
+        return {
+            'headers': valid_response['headers'],
+            'data': [[ric] + valid_response['data'][0][1:] for ric in rics],
+            'universe': [{'Instrument': ric} for ric in rics]
+        }
+
+    requests_mock.get(url= esg_endpoint, json = esg_callback)
+
+    rics = [f'TEST{index}.RIC' for index in range(10)] + ['INVALID.RIC']
+    response = app.rdp_request_esg_bulk(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], rics, batch_size = 4)
+
+    assert response['headers'] == valid_response['headers'], 'Bulk ESG request returns wrong headers'
+    assert [row[0] for row in response['data']] == [ric.upper() for ric in rics[:10]], 'Bulk ESG request returns wrong data'
+    assert len(response['universe']) == 10, 'Bulk ESG request returns wrong universe'
+    assert list(response['errors']) == ['INVALID.RIC'], 'Bulk ESG request does not isolate the invalid RIC'
+    assert 'code' in response['errors']['INVALID.RIC']
+
+@pytest.mark.test_esg
+def test_request_esg_bulk_server_error(supply_test_config, supply_test_class, supply_test_mock_json, requests_mock):
+    """
+    Test that a 5xx batch is reported per RIC with one request per batch instead of being split
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    esg_mock = requests_mock.get(url= esg_endpoint, json = {'error': {'code': '503', 'message': 'Service Unavailable'}}, status_code = 503)
+
+    rics = [f'TEST{index}.RIC' for index in range(100)]
+    response = supply_test_class.rdp_request_esg_bulk(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], rics, batch_size = 50, max_workers = 1)
+
+    assert esg_mock.call_count == 2, 'Bulk ESG request splits batches on a server error'
+    assert sorted(response['errors']) == sorted(rics), 'Bulk ESG request does not report every RIC of the failed batches'
+    assert '503' in response['errors']['TEST0.RIC'], 'Bulk ESG request reports wrong error'
+
+@pytest.mark.test_esg
+def test_request_esg_bulk_token_expire(supply_test_config, supply_test_class, supply_test_mock_json, requests_mock):
+    """
+    Test that an expired token fails the whole bulk request instead of being reported per RIC
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    app = supply_test_class
+
+    requests_mock.get(url= esg_endpoint, json = supply_test_mock_json['token_expire_json'], status_code = 401)
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        app.rdp_request_esg_bulk(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], ['A.L', 'B.L', 'C.L'], batch_size = 2)
+
+    assert '401' in str(excinfo.value), 'Bulk ESG Access Token Expire returns wrong HTTP Status Code'
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+@pytest.mark.test_stream
+def test_request_esg_stream(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that it can stream ESG rows from the response
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    contents = (shared_datadir / 'test_esg_fixture.json').read_bytes()
+    mock_esg_data = json.loads(contents)
+    app = supply_test_class
+
+    requests_mock.get(url= esg_endpoint, content = contents, status_code = 200, headers = {'Content-Type':'application/json'})
+
+    with app.rdp_request_esg_stream(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC', read_size = 32) as esg_stream:
+        chunks = list(esg_stream.chunks(2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1], 'ESG stream returns wrong chunks'
+    assert [row for chunk in chunks for row in chunk] == mock_esg_data['data'], 'ESG stream returns wrong rows'
+    assert esg_stream.members['headers'] == mock_esg_data['headers'], 'ESG stream returns wrong headers'
+
+@pytest.mark.test_esg
+@pytest.mark.test_stream
+def test_request_esg_stream_token_expire(supply_test_config, supply_test_class, supply_test_mock_json, requests_mock):
+    """
+    Test that the ESG stream raises HTTPError before streaming when the token has expired
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    app = supply_test_class
+
+    requests_mock.get(url= esg_endpoint, json = supply_test_mock_json['token_expire_json'], status_code = 401)
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        app.rdp_request_esg_stream(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    assert '401' in str(excinfo.value), 'ESG stream Access Token Expire returns wrong HTTP Status Code'
+
+# Mock RDP Search Explore with total_hits generated hits, paged with Top/Skip
+def mock_search_pages(requests_mock, search_endpoint, total_hits):
+    def search_callback(request, context):
+        body = request.json()
+        context.status_code = 200
+        top, skip = body['Top'], body['Skip']
+        return {
+            'Total': total_hits,
+            'Hits': [{'RIC': f'TEST{index}.RIC', 'IssuerCommonName': f'Test {index}'} for index in range(skip, min(skip + top, total_hits))]
+        }
+    requests_mock.post(url= search_endpoint, json = search_callback)
+
+@pytest.mark.test_valid
+@pytest.mark.test_search
+def test_iter_search_explore(supply_test_config, supply_test_class, supply_test_mock_json, requests_mock):
+    """
+    Test that it can iterate over all pages of a Search Explore query in order
+    """
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    mock_search_pages(requests_mock, search_endpoint, 250)
+    app = supply_test_class
+    payload = {**supply_test_mock_json['search_explore_payload'], 'Filter': 'ExchangeCode eq \'TEST\''}
+
+    hits = list(app.rdp_iter_search_explore(search_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], payload, page_size = 40, prefetch = 3))
+
+    assert [hit['RIC'] for hit in hits] == [f'TEST{index}.RIC' for index in range(250)], 'Search Explore iterator returns wrong hits'
+    assert requests_mock.call_count == 7, 'Search Explore iterator requests wrong number of pages'
+    assert sorted(request.json()['Skip'] for request in requests_mock.request_history) == list(range(0, 250, 40))
+
+@pytest.mark.test_search
+def test_iter_search_explore_max_hits(supply_test_config, supply_test_class, supply_test_mock_json, requests_mock):
+    """
+    Test that the Search Explore iterator stops at max_hits
+    """
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    mock_search_pages(requests_mock, search_endpoint, 1000)
+    app = supply_test_class
+
+    hits = list(app.rdp_iter_search_explore(search_endpoint, supply_test_mock_json['valid_auth_json']['access_token'],
+        supply_test_mock_json['search_explore_payload'], page_size = 100, max_hits = 150))
+
+    assert len(hits) == 150, 'Search Explore iterator does not stop at max_hits'
+    assert requests_mock.call_count == 2
+
+@pytest.mark.test_search
+def test_chunk_ric_filters():
+    """
+    Test that RICs are packed into Search Explore filters within the RIC and length limits
+    """
+    assert rdp_http_controller.ric_filter(['A.L', "O'B.L"]) == "RIC eq 'A.L' or RIC eq 'O''B.L'", 'ric_filter() returns wrong filter'
+
+    rics = [f'TEST{index}.RIC' for index in range(10)]
+    assert [len(batch) for batch in rdp_http_controller.chunk_ric_filters(rics, 4, 4000)] == [4, 4, 2]
+    for batch in rdp_http_controller.chunk_ric_filters(rics, 100, 60):
+        assert len(rdp_http_controller.ric_filter(batch)) <= 60, 'Search Explore filter exceeds max_filter_length'
+
+@pytest.mark.test_valid
+@pytest.mark.test_search
+def test_resolve_rics(supply_test_config, supply_test_mock_json, requests_mock):
+    """
+    Test that it can resolve the metadata of many RICs with batched filters and serve repeats from the cache
+    """
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+
+    # Mock RDP Search Explore: every RIC of the filter is known except the UNKNOWN ones
+    def search_callback(request, context):
+        body = request.json()
+        assert 'RIC' in body['Select'].split(',')
+        rics = [clause.split("'")[1] for clause in body['Filter'].split(' or ')]
+        context.status_code = 200
+        hits = [{'RIC': ric, 'IssuerCommonName': f'{ric} Name', 'IssueISIN': f'ISIN{ric}'} for ric in rics if not ric.startswith('UNKNOWN')]
+        return {'Total': len(hits), 'Hits': hits}
+
+    requests_mock.post(url= search_endpoint, json = search_callback)
+    app = rdp_http_controller.RDPHTTPController()
+    rics = [f'TEST{index}.RIC' for index in range(120)] + ['UNKNOWN.RIC']
+
+    metadata = app.rdp_resolve_rics(search_endpoint, access_token, rics, 'IssuerCommonName,IssueISIN', batch_size = 50)
+    assert len(metadata) == 120, 'RIC resolver returns wrong number of RICs'
+    assert metadata['TEST7.RIC']['IssuerCommonName'] == 'TEST7.RIC Name'
+    assert 'UNKNOWN.RIC' not in metadata
+    assert requests_mock.call_count == 3, 'RIC resolver does not batch the RICs'
+
+    metadata = app.rdp_resolve_rics(search_endpoint, access_token, rics[:100], 'IssuerCommonName,IssueISIN')
+    assert len(metadata) == 100
+    assert requests_mock.call_count == 3, 'RIC resolver does not serve repeated lookups from the cache'
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+@pytest.mark.parametrize('supply_test_fake_server', [{'periods': 50, 'compress': True}], indirect = True)
+def test_request_esg_gzip(supply_test_mock_json, supply_test_fake_server):
+    """
+    Test that the controller negotiates gzip and decodes the compressed ESG response
+    """
+    server, base_url = supply_test_fake_server
+    with rdp_http_controller.RDPHTTPController(verbose = False) as app:
+        response = app.session.get(base_url + '/data/environmental-social-governance/v2/views/scores-full', params = {'universe': 'TEST.RIC'})
+        esg_data = app.rdp_request_esg(base_url + '/data/environmental-social-governance/v2/views/scores-full', supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    assert 'gzip' in response.request.headers['Accept-Encoding'], 'Controller session does not accept gzip'
+    assert response.headers.get('Content-Encoding') == 'gzip', 'Fake RDP server does not compress the response'
+    assert len(esg_data['data']) == 50, 'Compressed ESG response is decoded wrong'
+
+@pytest.mark.test_esg
+def test_request_esg_invalid_json(supply_test_config, supply_test_class, supply_test_mock_json, requests_mock):
+    """
+    Test that a malformed ESG response body raises requests' JSONDecodeError whatever the JSON backend
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    requests_mock.get(url= esg_endpoint, text = '{"data": [', status_code = 200)
+
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        supply_test_class.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+def test_request_esg_views(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that it can request several ESG views of one universe concurrently
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    views_url = esg_endpoint.rsplit('/', 1)[0]
+    for view in rdp_http_controller.ESG_VIEWS:
+        requests_mock.get(url= f'{views_url}/{view}', json = {**mock_esg_data, 'links': {'view': view}}, status_code = 200)
+
+    response = supply_test_class.rdp_request_esg_views(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    assert list(response) == list(rdp_http_controller.ESG_VIEWS), 'ESG views request returns wrong views'
+    assert all(esg_data['links']['view'] == view for view, esg_data in response.items()), 'ESG views request returns wrong view data'
+    assert requests_mock.call_count == 3
+    assert rdp_http_controller.esg_view_url(views_url, 'basic') == f'{views_url}/basic', 'ESG view URL is wrong for the views base URL'
+
+@pytest.mark.empty_case
+@pytest.mark.test_esg
+def test_request_esg_views_none_empty(supply_test_class):
+    """
+    Test that the ESG views request rejects empty arguments
+    """
+    with pytest.raises(TypeError) as excinfo:
+        supply_test_class.rdp_request_esg_views('https://esg/views/basic', 'token', 'TEST.RIC', views = [])
+
+    assert 'Received invalid (None or Empty) arguments' in str(excinfo.value), 'Empty ESG views call return wrong Exception description'
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+def test_request_esg_window(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the start/end/periods history window is sent as query parameters
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    requests_mock.get(url= esg_endpoint, json = json.loads((shared_datadir / 'test_esg_fixture.json').read_text()), status_code = 200)
+
+    supply_test_class.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC', start = -1, end = 0)
+    supply_test_class.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC', periods = 1)
+
+    assert requests_mock.request_history[0].qs == {'universe': ['test.ric'], 'start': ['-1'], 'end': ['0']}, 'ESG request sends wrong window'
+    assert requests_mock.request_history[1].qs == {'universe': ['test.ric'], 'periods': ['1']}, 'ESG request sends wrong periods'
+
+@pytest.mark.test_esg
+def test_request_esg_size_guards(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that responses over max_response_bytes or max_rows raise ResponseTooLargeError
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    contents = (shared_datadir / 'test_esg_fixture.json').read_bytes()
+    requests_mock.get(url= esg_endpoint, content = contents, status_code = 200)
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+
+    with pytest.raises(rdp_http_controller.ResponseTooLargeError) as excinfo:
+        rdp_http_controller.RDPHTTPController(max_response_bytes = len(contents) - 1).rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    assert 'max_response_bytes' in str(excinfo.value), 'Oversized ESG response returns wrong Exception description'
+
+    rows = len(json.loads(contents)['data'])
+    with pytest.raises(rdp_http_controller.ResponseTooLargeError) as excinfo:
+        rdp_http_controller.RDPHTTPController(max_rows = rows - 1).rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    assert 'max_rows' in str(excinfo.value), 'ESG response with too many rows returns wrong Exception description'
+
+    response = rdp_http_controller.RDPHTTPController(max_response_bytes = len(contents), max_rows = rows).rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    assert response == json.loads(contents), 'ESG response within the guards returns wrong data'
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+def test_request_esg_spill_to_file(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that a response over spill_bytes keeps its members and leaves its rows in a temporary file
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    mock_search_data = {'Total': 3, 'Hits': [{'RIC': f'TEST{index}.L'} for index in range(3)]}
+    requests_mock.get(url= esg_endpoint, json = mock_esg_data, status_code = 200)
+    requests_mock.post(url= search_endpoint, json = mock_search_data, status_code = 200)
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+
+    app = rdp_http_controller.RDPHTTPController(spill_bytes = 16, cache = RDPResponseCache())
+    response = app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    assert isinstance(response['data'], JSONArraySpill), 'Spilled ESG rows are decoded in memory'
+    assert len(response['data']) == len(mock_esg_data['data']) and list(response['data']) == mock_esg_data['data'], 'Spilled ESG response returns wrong rows'
+    assert {key: value for key, value in response.items() if key != 'data'} == {key: value for key, value in mock_esg_data.items() if key != 'data'}, 'Spilled ESG response returns wrong members'
+    assert [len(chunk) for chunk in response['data'].chunks(2)] == [2, 2, 1], 'Spilled ESG rows are not read in chunks'
+
+    app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    assert len(requests_mock.request_history) == 2, 'Spilled ESG response is cached'
+
+    typed = app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC', typed = True)
+    assert len(typed.rows) == len(mock_esg_data['data']), 'Spilled ESG response returns wrong typed rows'
+
+    response = app.rdp_request_search_explore(search_endpoint, access_token, {'View': 'Entities', 'Top': 3})
+    assert response['Total'] == 3 and list(response['Hits']) == mock_search_data['Hits'], 'Spilled Search Explore response returns wrong data'
+    assert app.rdp_request_search_explore(search_endpoint, access_token, {'View': 'Entities', 'Top': 3}, typed = True).hits[2].RIC == 'TEST2.L'
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+def test_request_esg_bulk_spill_to_file(supply_test_config, supply_test_mock_json, supply_test_app, shared_datadir, requests_mock):
+    """
+    Test that a bulk request over spill_bytes keeps the spilled batch rows in their files and still converts by chunks
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    def callback(request, context):
+        rics = request.qs['universe'][0].upper().split(',')
+        context.status_code = 200
+        return {**mock_esg_data, 'data': [[ric] + mock_esg_data['data'][0][1:] for ric in rics], 'universe': [{'Instrument': ric} for ric in rics]}
+
+    requests_mock.get(url= esg_endpoint, json = callback)
+    rics = [f'TEST{index}.RIC' for index in range(10)]
+    expected = [[ric] + mock_esg_data['data'][0][1:] for ric in rics]
+
+    app = rdp_http_controller.RDPHTTPController(spill_bytes = 1000)
+    response = app.rdp_request_esg_bulk(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], rics, batch_size = 3, max_workers = 2)
+    assert isinstance(response['data'], JSONArrayChain) and all(isinstance(part, JSONArraySpill) for part in response['data'].parts), 'Spilled bulk ESG rows are read into one list'
+    assert len(response['data']) == len(rics) and response['links']['count'] == len(rics), 'Spilled bulk ESG response returns wrong row count'
+    assert list(response['data']) == expected, 'Spilled bulk ESG response returns wrong rows'
+    assert [len(chunk) for chunk in response['data'].chunks(4)] == [4, 4, 2], 'Spilled bulk ESG rows are not read in chunks'
+
+    df = supply_test_app(response, memory_budget = 1000)
+    assert list(df['Instrument']) == rics, 'Spilled bulk ESG response converts to wrong DataFrame'
+    response['data'].close()
+
+@pytest.mark.test_valid
+@pytest.mark.test_esg
+def test_request_esg_raw(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock, tmp_path):
+    """
+    Test that the raw ESG request returns the undecoded body, or the path of its spool file over spill_bytes
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    contents = (shared_datadir / 'test_esg_fixture.json').read_bytes()
+    requests_mock.get(url= esg_endpoint, content = contents, status_code = 200)
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    spool = tmp_path / 'spool'
+    spool.mkdir()
+
+    assert rdp_http_controller.RDPHTTPController().rdp_request_esg_raw(esg_endpoint, access_token, 'TEST.RIC') == contents, 'Raw ESG request returns wrong body'
+
+    path = rdp_http_controller.RDPHTTPController(spill_bytes = 100).rdp_request_esg_raw(esg_endpoint, access_token, 'TEST.RIC', spill_dir = str(spool))
+    assert os.path.dirname(path) == str(spool) and open(path, 'rb').read() == contents, 'Raw ESG request does not spool a large body'
+
+    with pytest.raises(rdp_http_controller.ResponseTooLargeError):
+        rdp_http_controller.RDPHTTPController(max_response_bytes = 100, spill_bytes = 10).rdp_request_esg_raw(esg_endpoint, access_token, 'TEST.RIC', spill_dir = str(spool))
+    assert os.listdir(spool) == [os.path.basename(path)], 'Raw ESG request leaves the spool file of a rejected body'
+
+@pytest.mark.test_esg
+@pytest.mark.parametrize('supply_test_fake_server', [{'periods': 50, 'compress': True}], indirect = True)
+def test_request_esg_guard_decoded_size(supply_test_mock_json, supply_test_fake_server):
+    """
+    Test that max_response_bytes applies to the decoded body of a compressed response
+    """
+    server, base_url = supply_test_fake_server
+    esg_url = base_url + '/data/environmental-social-governance/v2/views/scores-full'
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    with rdp_http_controller.RDPHTTPController(verbose = False) as app:
+        size = len(app.session.get(esg_url, params = {'universe': 'TEST.RIC'}).content)
+        compressed = int(app.session.get(esg_url, params = {'universe': 'TEST.RIC'}, stream = True).headers['Content-Length'])
+    assert compressed < size, 'Fake RDP server does not compress the response'
+
+    with rdp_http_controller.RDPHTTPController(max_response_bytes = size, verbose = False) as app:
+        assert len(app.rdp_request_esg(esg_url, access_token, 'TEST.RIC')['data']) == 50
+    with rdp_http_controller.RDPHTTPController(max_response_bytes = (compressed + size) // 2, verbose = False) as app:
+        with pytest.raises(rdp_http_controller.ResponseTooLargeError):
+            app.rdp_request_esg(esg_url, access_token, 'TEST.RIC')
+
+@pytest.mark.test_esg
+def test_request_esg_bulk_max_rows(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the bulk ESG request splits batches whose responses exceed max_rows
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    valid_response = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    # Mock RDP ESG: two rows per requested RIC
+    def esg_callback(request, context):
+        context.status_code = 200
+        rics = request.qs['universe'][0].upper().split(',')
+        return {'headers': valid_response['headers'], 'data': [[ric] + valid_response['data'][0][1:] for ric in rics for _ in range(2)]}
+
+    requests_mock.get(url= esg_endpoint, json = esg_callback)
+
+    app = rdp_http_controller.RDPHTTPController(max_rows = 4, verbose = False)
+    rics = [f'TEST{index}.RIC' for index in range(6)]
+    response = app.rdp_request_esg_bulk(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], rics, batch_size = 6, max_workers = 1)
+
+    assert len(response['data']) == 12, 'Bulk ESG request with max_rows returns wrong data'
+    assert not response['errors'], 'Bulk ESG request with max_rows reports errors for splittable batches'
+    # 6 RICs -> 3 + 3 RICs (still 6 rows) -> 1 + 2 RICs for each half
+    assert len(requests_mock.request_history) == 7, 'Bulk ESG request does not split oversized batches'
+
 if __name__ == '__main__':
     print('This is the test_rdp_http_controller.py test file')
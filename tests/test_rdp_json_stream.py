@@ -0,0 +1,87 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import json
+import random
+
+from rdp_controller.rdp_json_stream import JSONArrayStream
+
+def split_chunks(raw, size):
+    return [raw[index:index + size] for index in range(0, len(raw), size)]
+
+@pytest.mark.test_stream
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1 << 20])
+def test_stream_esg_rows(shared_datadir, chunk_size):
+    """
+    Test that the ESG rows and members are parsed correctly whatever the chunk boundaries are
+    """
+    esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    esg_data['data'][0][10] = 'Escaped "quote" ] } [ { é'
+    raw = json.dumps(esg_data, ensure_ascii = False).encode('utf-8')
+
+    esg_stream = JSONArrayStream(split_chunks(raw, chunk_size), key = 'data', skip_keys = ('messages',))
+    rows = [row for chunk in esg_stream.chunks(2) for row in chunk]
+
+    assert rows == esg_data['data'], 'JSON stream returns wrong rows'
+    assert esg_stream.members['headers'] == esg_data['headers'], 'JSON stream returns wrong headers'
+    assert esg_stream.members['universe'] == esg_data['universe'], 'JSON stream returns wrong universe'
+    assert 'messages' not in esg_stream.members, 'JSON stream does not skip the messages block'
+
+@pytest.mark.test_stream
+def test_stream_split_numbers():
+    """
+    Test that numbers split across chunks are not truncated
+    """
+    esg_stream = JSONArrayStream([b'{"data": [1', b'23, 4', b'5.5e', b'1, tr', b'ue, nu', b'll]}'])
+    assert list(esg_stream) == [123, 455.0, True, None], 'JSON stream truncates split values'
+
+@pytest.mark.test_stream
+def test_stream_error_response(shared_datadir):
+    """
+    Test that an error response without 'data' yields no rows and exposes the error
+    """
+    raw = (shared_datadir / 'test_esg_invalid_fixture.json').read_bytes()
+    esg_stream = JSONArrayStream(split_chunks(raw, 16))
+
+    assert list(esg_stream) == []
+    assert 'error' in esg_stream.members, 'JSON stream does not expose the error member'
+
+@pytest.mark.test_stream
+def test_stream_invalid_json():
+    """
+    Test that a truncated stream raises an error
+    """
+    with pytest.raises(ValueError):
+        list(JSONArrayStream([b'{"data": [[1, 2], [3']))
+
+@pytest.mark.test_stream
+def test_stream_chunk_size_fuzz():
+    """
+    Test that random documents parse like json.loads() at every chunk size, including skipped members near the end
+    """
+    generator = random.Random(7)
+    values = [1, -2.5, 1e21, True, None, 'x' * 200, 'a\\"b\\\\', 'caf\u00e9 \u2713', [], {}]
+    for _ in range(50):
+        document = {
+            'headers': [{'name': 'value'}],
+            'data': [[generator.choice(values) for _ in range(generator.randint(1, 4))] for _ in range(generator.randint(0, 5))],
+            'messages': {'descriptions': [{'description': generator.choice(values)} for _ in range(generator.randint(0, 3))]}
+        }
+        raw = json.dumps(document, ensure_ascii = False).encode('utf-8')
+        for chunk_size in (1, 2, 3, 5, 16, 64, 257):
+            esg_stream = JSONArrayStream(split_chunks(raw, chunk_size), skip_keys = ('messages',))
+            assert list(esg_stream) == document['data'], f'JSON stream returns wrong rows with {chunk_size} bytes chunks'
+            assert esg_stream.members == {'headers': document['headers']}, f'JSON stream returns wrong members with {chunk_size} bytes chunks'
+
+if __name__ == '__main__':
+    print('This is the test_rdp_json_stream.py test file')
@@ -0,0 +1,123 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+import pytest
+import requests
+import json
+
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_metrics
+from rdp_controller import rdp_resilience
+from rdp_controller.rdp_response_cache import RDPResponseCache
+from benchmarks.stub_server import start_stub_server
+
+
+@pytest.mark.test_metrics
+def test_metrics_request_counters(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the status, retry and byte counters of the requests are collected and sent to the hooks
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    contents = (shared_datadir / 'test_esg_fixture.json').read_bytes()
+    requests_mock.get(url= esg_endpoint, response_list = [
+        {'text': 'Service Unavailable', 'status_code': 503},
+        {'exc': requests.exceptions.ConnectTimeout},
+        {'content': contents, 'status_code': 200, 'headers': {'Content-Length': str(len(contents))}}
+    ])
+
+    metrics = rdp_metrics.RDPMetrics()
+    events = []
+    metrics.add_hook(events.append)
+    app = rdp_http_controller.RDPHTTPController(metrics = metrics, retry_policy = rdp_resilience.RetryPolicy(max_attempts = 3, backoff_base = 0.01))
+    app.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    esg_stats = metrics.snapshot()['esg']
+    assert esg_stats['requests'] == {503: 1, 'ConnectTimeout': 1, 200: 1}, 'Metrics return wrong status counters'
+    assert esg_stats['counters'] == {'retry': 2}, 'Metrics return wrong retry counter'
+    assert esg_stats['bytes_received'] == len(contents) + len('Service Unavailable'), 'Metrics return wrong byte count'
+    assert esg_stats['timers']['total']['count'] == 3
+    assert sum(esg_stats['histogram']) == 3
+    assert [event['event'] for event in events] == ['request', 'retry', 'request', 'retry', 'request'], 'Metrics hooks receive wrong events'
+
+@pytest.mark.test_metrics
+def test_metrics_cache_counters(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the cache hits and misses are counted
+    """
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    requests_mock.post(url= search_endpoint, json = json.loads((shared_datadir / 'test_search_fixture.json').read_text()), status_code = 200)
+
+    metrics = rdp_metrics.RDPMetrics()
+    app = rdp_http_controller.RDPHTTPController(metrics = metrics, cache = RDPResponseCache())
+    for _ in range(3):
+        app.rdp_request_search_explore(search_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], {'View': 'Entities', 'Filter': "RIC eq 'LSEG.L'"})
+
+    search_stats = metrics.snapshot()['search']
+    assert search_stats['counters'] == {'cache_miss': 1, 'cache_hit': 2}, 'Metrics return wrong cache counters'
+    assert search_stats['requests'] == {200: 1}
+    assert search_stats['bytes_sent'] > 0, 'Metrics do not count the request body'
+
+@pytest.mark.test_metrics
+def test_metrics_connection_timings():
+    """
+    Test that the connect time is measured for a new connection and is zero for a reused keep-alive connection
+    """
+    server, base_url = start_stub_server()
+    metrics = rdp_metrics.RDPMetrics()
+    events = []
+    metrics.add_hook(events.append)
+    try:
+        with rdp_http_controller.RDPHTTPController(metrics = metrics, verbose = False) as app:
+            app.rdp_request_esg(base_url + '/esg', 'token', 'TEST.RIC')
+            app.rdp_request_esg(base_url + '/esg', 'token', 'TEST.RIC')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert events[0]['connect'] > 0, 'Metrics do not measure the connect time'
+    assert events[1]['connect'] == 0 and events[1]['tls'] == 0, 'Metrics measure a connect time for a reused connection'
+    assert all(0 < event['ttfb'] <= event['total'] for event in events), 'Metrics return wrong TTFB'
+
+@pytest.mark.test_metrics
+def test_metrics_prometheus():
+    """
+    Test that the metrics are rendered in the Prometheus text format
+    """
+    metrics = rdp_metrics.RDPMetrics(buckets = (0.1, 1.0))
+    metrics.record_request('esg', 'GET', 200, total = 0.5, bytes_received = 100)
+    metrics.record_request('esg', 'GET', 429, total = 0.05)
+    metrics.increment('esg', 'throttled')
+
+    text = metrics.to_prometheus()
+    assert 'rdp_requests_total{endpoint="esg",status="200"} 1' in text, 'Prometheus output returns wrong request counter'
+    assert 'rdp_request_duration_seconds_bucket{endpoint="esg",le="0.1"} 1' in text, 'Prometheus output returns wrong histogram'
+    assert 'rdp_request_duration_seconds_bucket{endpoint="esg",le="1.0"} 2' in text, 'Prometheus output returns wrong histogram'
+    assert 'rdp_request_duration_seconds_count{endpoint="esg"} 2' in text
+    assert 'rdp_bytes_total{endpoint="esg",direction="received"} 100' in text, 'Prometheus output returns wrong byte counter'
+    assert 'rdp_events_total{endpoint="esg",event="throttled"} 1' in text, 'Prometheus output returns wrong event counter'
+
+@pytest.mark.test_metrics
+def test_quiet_controller(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock, capsys):
+    """
+    Test that verbose = False switches the status prints off
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    requests_mock.get(url= esg_endpoint, json = json.loads((shared_datadir / 'test_esg_fixture.json').read_text()), status_code = 200)
+
+    app = rdp_http_controller.RDPHTTPController(verbose = False)
+    app.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    assert capsys.readouterr().out == '', 'Quiet controller prints status messages'
+
+if __name__ == '__main__':
+    print('This is the RDP metrics test file')
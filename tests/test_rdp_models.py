@@ -0,0 +1,99 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+import pytest
+import json
+
+from rdp_controller.rdp_models import AuthToken, EsgScores, EsgScoreRow, SearchResult, SearchHit
+
+
+@pytest.mark.test_models
+def test_esg_scores_model(shared_datadir):
+    """
+    Test that the ESG response is decoded into compact rows readable by attribute, title and position
+    """
+    esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    esg_scores = EsgScores.from_json(esg_data)
+
+    row = esg_scores.rows[0]
+    assert len(esg_scores) == len(esg_data['data']), 'ESG model returns wrong number of rows'
+    assert isinstance(row, EsgScoreRow) and not hasattr(row, '__dict__'), 'ESG rows are not slotted'
+    assert row.instrument == 'TEST.RIC' and row.period_end_date == '2021-12-31', 'ESG row returns wrong attributes'
+    assert row['ESG Score'] == row.esg_score == row[2] == esg_data['data'][0][2], 'ESG row returns wrong values'
+    assert list(row) == esg_data['data'][0]
+    assert type(esg_scores.rows[1]) is type(row), 'ESG row class is not shared by the rows of a view'
+
+@pytest.mark.test_models
+def test_esg_scores_model_invalid(shared_datadir):
+    """
+    Test that invalid ESG responses are rejected at decode time
+    """
+    invalid_data = json.loads((shared_datadir / 'test_esg_invalid_fixture.json').read_text())
+    with pytest.raises(ValueError) as excinfo:
+        EsgScores.from_json(invalid_data)
+    assert 'Unable to resolve all requested identifiers' in str(excinfo.value), 'ESG model returns wrong error'
+
+    esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    esg_data['data'][0] = esg_data['data'][0][:3]
+    with pytest.raises(ValueError):
+        EsgScores.from_json(esg_data)
+
+@pytest.mark.test_models
+def test_search_result_model(shared_datadir):
+    """
+    Test that Search Explore hits are decoded into compact hits with the union of the returned fields
+    """
+    search_data = json.loads((shared_datadir / 'test_search_fixture.json').read_text())
+    search_data['Hits'].append({'RIC': 'OTHER.RIC'})
+    result = SearchResult.from_json(search_data)
+
+    hit = result.hits[0]
+    assert result.total == search_data['Total'] and len(result) == 2, 'Search model returns wrong hits'
+    assert isinstance(hit, SearchHit) and not hasattr(hit, '__dict__'), 'Search hits are not slotted'
+    assert hit.IssuerCommonName == hit['IssuerCommonName'] == search_data['Hits'][0]['IssuerCommonName'], 'Search hit returns wrong attributes'
+    assert hit.to_dict() == search_data['Hits'][0], 'Search hit returns wrong dict'
+    assert result.hits[1].get('IssuerCommonName', 'n/a') == 'n/a' and result.hits[1]['RIC'] == 'OTHER.RIC', 'Search hit returns wrong missing field'
+
+@pytest.mark.test_models
+def test_auth_token_model(supply_test_mock_json):
+    """
+    Test that the Auth response is validated once and the tokens are not printed
+    """
+    token = AuthToken.from_json(supply_test_mock_json['valid_auth_json'])
+    assert token.expires_in == 600, 'Auth model does not convert expires_in'
+    assert supply_test_mock_json['valid_auth_json']['access_token'] not in repr(token), 'Auth model prints the Access Token'
+
+    with pytest.raises(ValueError) as excinfo:
+        AuthToken.from_json({'access_token': 'token', 'expires_in': '600'})
+    assert 'refresh_token' in str(excinfo.value), 'Auth model returns wrong error'
+
+@pytest.mark.test_models
+@pytest.mark.test_esg
+def test_request_esg_typed(supply_test_config, supply_test_class, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the controller returns the typed ESG and Search Explore models on request
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    requests_mock.get(url= esg_endpoint, json = json.loads((shared_datadir / 'test_esg_fixture.json').read_text()), status_code = 200)
+    requests_mock.post(url= search_endpoint, json = json.loads((shared_datadir / 'test_search_fixture.json').read_text()), status_code = 200)
+
+    esg_scores = supply_test_class.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC', typed = True)
+    search_result = supply_test_class.rdp_request_search_explore(search_endpoint, access_token, {'View': 'Entities'}, typed = True)
+
+    assert isinstance(esg_scores, EsgScores) and esg_scores.rows[0].instrument == 'TEST.RIC', 'Controller returns wrong ESG model'
+    assert isinstance(search_result, SearchResult) and search_result.hits[0].ExchangeCode == 'TEST', 'Controller returns wrong Search model'
+
+if __name__ == '__main__':
+    print('This is the RDP response models test file')
@@ -0,0 +1,102 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import requests
+import json
+import time
+
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_rate_limiter
+
+
+@pytest.mark.test_rate_limit
+def test_token_bucket_rate():
+    """
+    Test that the token bucket allows the burst and then the configured rate
+    """
+    bucket = rdp_rate_limiter.TokenBucket(rate = 50, capacity = 5)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.05, 'Token bucket does not allow the burst'
+
+    for _ in range(10):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.18, 'Token bucket exceeds the configured rate'
+
+@pytest.mark.test_rate_limit
+def test_retry_after_parsing():
+    """
+    Test that the Retry-After header is parsed in both seconds and HTTP date formats
+    """
+    assert rdp_rate_limiter.parse_retry_after('3') == 3.0
+    assert rdp_rate_limiter.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert rdp_rate_limiter.parse_retry_after(None) is None
+    assert rdp_rate_limiter.parse_retry_after('invalid') is None
+
+@pytest.mark.test_rate_limit
+def test_limiter_backoff_and_recovery():
+    """
+    Test that the endpoint rate is cut on HTTP 429 and recovers on success
+    """
+    limiter = rdp_rate_limiter.RDPRateLimiter(rates = {'esg': (10, 10)}, recovery_step = 1)
+    limiter.on_throttled('esg', '0')
+    assert limiter.rate('esg') == 5, 'Rate limiter does not back off on HTTP 429'
+    assert limiter.rate('search') == rdp_rate_limiter.DEFAULT_RATES['search'][0], 'HTTP 429 affects other endpoints'
+
+    for _ in range(10):
+        limiter.on_success('esg')
+    assert limiter.rate('esg') == 10, 'Rate limiter does not recover to the configured rate'
+
+@pytest.mark.test_rate_limit
+def test_controller_retries_throttled_request(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the controller waits for Retry-After and retries an HTTP 429 ESG request
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    requests_mock.get(url= esg_endpoint, response_list = [
+        {'json': {'error': {'code': '429', 'message': 'Too many requests'}}, 'status_code': 429, 'headers': {'Retry-After': '0.1'}},
+        {'json': mock_esg_data, 'status_code': 200}
+    ])
+
+    limiter = rdp_rate_limiter.RDPRateLimiter()
+    app = rdp_http_controller.RDPHTTPController(rate_limiter = limiter)
+
+    start = time.monotonic()
+    response = app.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    assert 'data' in response, 'Throttled ESG request is not retried'
+    assert requests_mock.call_count == 2
+    assert time.monotonic() - start >= 0.1, 'Controller does not honour Retry-After'
+    assert limiter.throttle_count == 1
+
+@pytest.mark.test_rate_limit
+def test_controller_throttled_retries_exhausted(supply_test_config, supply_test_mock_json, requests_mock):
+    """
+    Test that the controller raises HTTPError when the request is still throttled after the retries
+    """
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    requests_mock.post(url= search_endpoint, json = {'error': {'code': '429'}}, status_code = 429, headers = {'Retry-After': '0'})
+
+    app = rdp_http_controller.RDPHTTPController(rate_limiter = rdp_rate_limiter.RDPRateLimiter(), throttle_retries = 2)
+    payload = {**supply_test_mock_json['search_explore_payload'], 'Filter': 'RIC eq \'TEST.RIC\''}
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        app.rdp_request_search_explore(search_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], payload)
+
+    assert '429' in str(excinfo.value), 'Throttled Search Explore returns wrong HTTP Status Code'
+    assert requests_mock.call_count == 3
+
+if __name__ == '__main__':
+    print('This is the test_rdp_rate_limiter.py test file')
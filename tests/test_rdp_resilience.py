@@ -0,0 +1,107 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import requests
+import json
+import time
+
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_resilience
+
+
+@pytest.mark.test_resilience
+def test_retry_server_error(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that an ESG request is retried on HTTP 503 and connect/read errors
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+    requests_mock.get(url= esg_endpoint, response_list = [
+        {'text': 'Service Unavailable', 'status_code': 503},
+        {'exc': requests.exceptions.ConnectTimeout},
+        {'exc': requests.exceptions.ReadTimeout},
+        {'json': mock_esg_data, 'status_code': 200}
+    ])
+
+    app = rdp_http_controller.RDPHTTPController(retry_policy = rdp_resilience.RetryPolicy(max_attempts = 4, backoff_base = 0.01))
+    response = app.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    assert 'data' in response, 'ESG request is not retried'
+    assert requests_mock.call_count == 4
+
+@pytest.mark.test_resilience
+def test_no_retry_non_idempotent(supply_test_config, requests_mock):
+    """
+    Test that the Auth request is not retried once it may have reached the server
+    """
+    auth_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL']
+    requests_mock.post(url= auth_endpoint, exc = requests.exceptions.ReadTimeout)
+
+    app = rdp_http_controller.RDPHTTPController(retry_policy = rdp_resilience.RetryPolicy(backoff_base = 0.01))
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        app.rdp_authentication(auth_endpoint, supply_test_config['RDP_USERNAME'], supply_test_config['RDP_PASSWORD'], supply_test_config['RDP_CLIENTID'])
+
+    assert requests_mock.call_count == 1, 'Non idempotent Auth request is retried after a read timeout'
+
+@pytest.mark.test_resilience
+def test_request_exception_raised(supply_test_config, supply_test_class, supply_test_mock_json, requests_mock):
+    """
+    Test that a connection error is raised to the caller instead of returning None
+    """
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    requests_mock.post(url= search_endpoint, exc = requests.exceptions.ConnectionError)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        supply_test_class.rdp_request_search_explore(search_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], supply_test_mock_json['search_explore_payload'])
+
+@pytest.mark.test_resilience
+def test_circuit_breaker_fails_fast(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the circuit breaker opens after consecutive failures and closes after a successful trial request
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    requests_mock.get(url= esg_endpoint, text = 'Bad Gateway', status_code = 502)
+
+    breakers = rdp_resilience.CircuitBreakers(failure_threshold = 2, reset_timeout = 0.2)
+    app = rdp_http_controller.RDPHTTPController(circuit_breakers = breakers)
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.HTTPError):
+            app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    with pytest.raises(rdp_resilience.CircuitOpenError):
+        app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    assert requests_mock.call_count == 2, 'Open circuit breaker does not fail fast'
+    assert breakers.get('esg').state == 'open'
+    assert breakers.get('search').state == 'closed', 'Circuit breaker affects other endpoints'
+
+    time.sleep(0.25)
+    requests_mock.get(url= esg_endpoint, json = json.loads((shared_datadir / 'test_esg_fixture.json').read_text()), status_code = 200)
+    assert 'data' in app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+    assert breakers.get('esg').state == 'closed', 'Circuit breaker does not close after a successful trial request'
+
+@pytest.mark.test_resilience
+def test_request_timeouts(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that separate connect and read timeouts are sent with every request
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    requests_mock.get(url= esg_endpoint, json = json.loads((shared_datadir / 'test_esg_fixture.json').read_text()), status_code = 200)
+
+    app = rdp_http_controller.RDPHTTPController(timeout = (2, 15))
+    app.rdp_request_esg(esg_endpoint, supply_test_mock_json['valid_auth_json']['access_token'], 'TEST.RIC')
+
+    assert requests_mock.last_request.timeout == (2, 15), 'Request is sent without connect/read timeouts'
+
+if __name__ == '__main__':
+    print('This is the test_rdp_resilience.py test file')
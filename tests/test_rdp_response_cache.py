@@ -0,0 +1,95 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import json
+import time
+
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_response_cache
+
+
+@pytest.mark.test_cache
+def test_cache_lru_eviction():
+    """
+    Test that the memory tier evicts the least recently used response
+    """
+    cache = rdp_response_cache.RDPResponseCache(maxsize = 2)
+    cache.put('esg', 'A', {'data': 'A'})
+    cache.put('esg', 'B', {'data': 'B'})
+    assert cache.get('esg', 'A') == {'data': 'A'}
+    cache.put('esg', 'C', {'data': 'C'})
+
+    assert cache.get('esg', 'B') is None, 'Cache does not evict the least recently used response'
+    assert cache.get('esg', 'A') is not None
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1, 'Cache returns wrong hit/miss counters'
+
+@pytest.mark.test_cache
+def test_cache_ttl_and_headers(monkeypatch):
+    """
+    Test that cached responses expire with the endpoint TTL and follow the HTTP cache headers
+    """
+    now = time.time()
+    monkeypatch.setattr(rdp_response_cache.time, 'time', lambda: now)
+    cache = rdp_response_cache.RDPResponseCache(ttl = {'esg': 60})
+
+    cache.put('esg', 'ttl', {'data': 1})
+    cache.put('esg', 'no-store', {'data': 2}, {'Cache-Control': 'no-store'})
+    cache.put('esg', 'max-age', {'data': 3}, {'Cache-Control': 'private, max-age=600'})
+    assert cache.get('esg', 'no-store') is None, 'Cache stores a no-store response'
+
+    now += 120
+    assert cache.get('esg', 'ttl') is None, 'Cache returns an expired response'
+    assert cache.get('esg', 'max-age') == {'data': 3}, 'Cache does not follow Cache-Control max-age'
+
+@pytest.mark.test_cache
+def test_cache_sqlite_tier(tmp_path):
+    """
+    Test that the on-disk tier serves responses to a new cache instance
+    """
+    cache = rdp_response_cache.RDPResponseCache(sqlite_path = tmp_path / 'rdp_cache.db')
+    key = cache.make_key('https://api.refinitiv.com/esg', {'universe': 'TEST.RIC'})
+    cache.put('esg', key, {'data': [[1, 2]]})
+    cache.close()
+
+    cache = rdp_response_cache.RDPResponseCache(sqlite_path = tmp_path / 'rdp_cache.db')
+    assert cache.get('esg', key) == {'data': [[1, 2]]}, 'On-disk cache tier returns wrong response'
+    assert cache.stats()['disk_hits'] == 1
+    cache.close()
+
+@pytest.mark.test_cache
+def test_controller_cache(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that the controller serves repeated ESG and Search Explore requests from the cache
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    requests_mock.get(url= esg_endpoint, json = json.loads((shared_datadir / 'test_esg_fixture.json').read_text()), status_code = 200)
+    requests_mock.post(url= search_endpoint, json = json.loads((shared_datadir / 'test_search_fixture.json').read_text()), status_code = 200)
+
+    cache = rdp_response_cache.RDPResponseCache()
+    app = rdp_http_controller.RDPHTTPController(cache = cache)
+    payload = {**supply_test_mock_json['search_explore_payload'], 'Filter': 'RIC eq \'TEST.RIC\''}
+
+    for _ in range(3):
+        assert 'data' in app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC')
+        assert 'Hits' in app.rdp_request_search_explore(search_endpoint, access_token, payload)
+    app.rdp_request_esg(esg_endpoint, access_token, 'OTHER.RIC')
+
+    assert requests_mock.call_count == 3, 'Controller does not serve repeated requests from the cache'
+    assert cache.stats()['hits'] == 4
+    assert cache.stats()['misses'] == 3
+
+if __name__ == '__main__':
+    print('This is the test_rdp_response_cache.py test file')
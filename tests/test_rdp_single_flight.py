@@ -0,0 +1,133 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import requests
+import json
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_async_http_controller
+from rdp_controller.rdp_single_flight import AsyncSingleFlight
+
+
+@pytest.mark.test_coalesce
+def test_controller_coalesce_esg(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that concurrent identical ESG requests share one upstream call
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    def slow_esg_callback(request, context):
+        time.sleep(0.2)
+        context.status_code = 200
+        return mock_esg_data
+
+    requests_mock.get(url= esg_endpoint, json = slow_esg_callback)
+    app = rdp_http_controller.RDPHTTPController(coalesce = True)
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+
+    with ThreadPoolExecutor(max_workers = 8) as executor:
+        results = list(executor.map(lambda _: app.rdp_request_esg(esg_endpoint, access_token, 'TEST.RIC'), range(8)))
+
+    assert requests_mock.call_count == 1, 'Concurrent identical ESG requests are not coalesced'
+    assert all(result == mock_esg_data for result in results)
+    assert app.single_flight.coalesced == 7
+
+@pytest.mark.test_coalesce
+def test_controller_coalesce_search_error(supply_test_config, supply_test_mock_json, requests_mock):
+    """
+    Test that the callers of a coalesced Search Explore request all receive its exception
+    """
+    search_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_SEARCH_EXPLORE_URL']
+
+    def slow_expired_callback(request, context):
+        time.sleep(0.2)
+        context.status_code = 401
+        return supply_test_mock_json['token_expire_json']
+
+    requests_mock.post(url= search_endpoint, json = slow_expired_callback)
+    app = rdp_http_controller.RDPHTTPController(coalesce = True)
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+    payload = {**supply_test_mock_json['search_explore_payload'], 'Filter': 'RIC eq \'TEST.RIC\''}
+
+    def search():
+        try:
+            app.rdp_request_search_explore(search_endpoint, access_token, payload)
+        except requests.exceptions.HTTPError as exp:
+            return exp
+
+    with ThreadPoolExecutor(max_workers = 4) as executor:
+        errors = list(executor.map(lambda _: search(), range(4)))
+
+    assert requests_mock.call_count == 1, 'Concurrent identical Search Explore requests are not coalesced'
+    assert all(isinstance(error, requests.exceptions.HTTPError) and '401' in str(error) for error in errors), 'Coalesced callers do not receive the exception'
+
+@pytest.mark.test_coalesce
+@pytest.mark.test_async
+def test_async_controller_coalesce(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that concurrent identical coroutines share one upstream call
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    def slow_esg_callback(request, context):
+        time.sleep(0.1)
+        context.status_code = 200
+        return mock_esg_data
+
+    requests_mock.get(url= esg_endpoint, json = slow_esg_callback)
+    access_token = supply_test_mock_json['valid_auth_json']['access_token']
+
+    async def fan_out(app):
+        return await asyncio.gather(*[app.rdp_request_esg(esg_endpoint, access_token, ric) for ric in ['A.L'] * 50 + ['B.L'] * 50])
+
+    app = rdp_async_http_controller.AsyncRDPHTTPController(max_concurrency = 4, coalesce = True)
+    results = asyncio.run(fan_out(app))
+    app.close()
+
+    assert len(results) == 100
+    assert requests_mock.call_count == 2, 'Concurrent identical coroutines are not coalesced'
+
+@pytest.mark.test_coalesce
+@pytest.mark.test_async
+def test_async_single_flight_leader_cancelled():
+    """
+    Test that cancelling the first caller does not cancel the shared call of the other callers
+    """
+    calls = []
+
+    async def upstream():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'result'
+
+    async def run():
+        flight = AsyncSingleFlight()
+        leader = asyncio.ensure_future(flight.do('key', upstream))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do('key', upstream))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(leader, follower, return_exceptions = True)
+
+    leader_result, follower_result = asyncio.run(run())
+    assert isinstance(leader_result, asyncio.CancelledError), 'Cancelled caller is not cancelled'
+    assert follower_result == 'result', 'Cancelling the first caller cancels the other callers'
+    assert len(calls) == 1, 'Coalesced callers send more than one call'
+
+if __name__ == '__main__':
+    print('This is the test_rdp_single_flight.py test file')
@@ -0,0 +1,118 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+
+import pytest
+import requests
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from rdp_controller import rdp_http_controller
+from rdp_controller.rdp_metrics import RDPMetrics
+from rdp_controller.rdp_response_cache import RDPResponseCache
+from benchmarks.fake_rdp_server import AUTH_PATH, SEARCH_PATH
+
+ESG_PATH = '/data/environmental-social-governance/v2/views/scores-full'
+# fake RDP server of the stress tests (supply_test_fake_server)
+STRESS_SERVER_OPTIONS = {'latency': 0.001, 'periods': 2, 'search_total': 5000}
+
+@pytest.mark.test_concurrency
+def test_controller_config_read_only():
+    """
+    Test that the controller configuration cannot be changed once created
+    """
+    app = rdp_http_controller.RDPHTTPController(scope = 'trapi.data.esg', client_secret = 'secret')
+    assert app.get_scope() == 'trapi.data.esg' and app.client_secret == 'secret'
+
+    with pytest.raises(AttributeError):
+        app.scope = 'other'
+    with pytest.raises(AttributeError):
+        app.client_secret = 'other'
+
+@pytest.mark.test_concurrency
+def test_thread_sessions_share_pool():
+    """
+    Test that every thread gets its own session and all sessions share the controller connection pool
+    """
+    with rdp_http_controller.RDPHTTPController() as app:
+        with ThreadPoolExecutor(max_workers = 4) as executor:
+            sessions = list(executor.map(lambda _: app.session, range(4)))
+            sessions = set(executor.map(lambda _: app.session, range(8))) | set(sessions)
+
+        assert app.session is app.session, 'Thread session is not reused within a thread'
+        assert len(sessions) >= 2, 'Threads share one requests.Session'
+        assert {session.get_adapter('https://api.refinitiv.com') for session in sessions} == {app.session.get_adapter('https://api.refinitiv.com')}, 'Thread sessions do not share the pool'
+
+@pytest.mark.test_concurrency
+@pytest.mark.parametrize('supply_test_fake_server', [STRESS_SERVER_OPTIONS], indirect = True)
+def test_map_esg_stress(supply_test_fake_server):
+    """
+    Test that one shared controller returns the right data to 32 threads under contention
+    """
+    server, base_url = supply_test_fake_server
+    metrics = RDPMetrics()
+    rics = [f'RIC{index:04d}.L' for index in range(400)]
+
+    with rdp_http_controller.RDPHTTPController(pool_maxsize = 32, cache = RDPResponseCache(maxsize = 1000), coalesce = True, metrics = metrics, verbose = False) as app:
+        access_token, _, _ = app.rdp_authentication(base_url + AUTH_PATH, 'user', 'password', 'client_id')
+        # every RIC twice: the duplicates are coalesced or served from the cache
+        responses = app.map_esg(base_url + ESG_PATH, lambda: access_token, rics + rics, max_workers = 32)
+
+    assert len(responses) == 800
+    for ric, response in zip(rics + rics, responses):
+        assert [row[0] for row in response['data']] == [ric, ric], f'Shared controller returns wrong data for {ric}'
+    esg_stats = metrics.snapshot()['esg']
+    assert sum(esg_stats['requests'].values()) == esg_stats['requests'][200] == server.requests - 1, 'Metrics lose requests under contention'
+    assert server.requests - 1 <= 400 + 32, 'Duplicate RICs are not coalesced or cached'
+
+@pytest.mark.test_concurrency
+@pytest.mark.parametrize('supply_test_fake_server', [STRESS_SERVER_OPTIONS], indirect = True)
+def test_map_search_stress(supply_test_fake_server):
+    """
+    Test that map_search returns every page in payload order under contention
+    """
+    server, base_url = supply_test_fake_server
+    payloads = [{'View': 'Entities', 'Query': 'all', 'Top': 10, 'Skip': skip} for skip in range(0, 5000, 10)]
+
+    with rdp_http_controller.RDPHTTPController(pool_maxsize = 32, verbose = False) as app:
+        responses = app.map_search(base_url + SEARCH_PATH, 'token', payloads, max_workers = 32)
+
+    hits = [hit['RIC'] for response in responses for hit in response['Hits']]
+    assert hits == [f'RIC{index:06d}.L' for index in range(5000)], 'map_search returns wrong or unordered hits'
+
+@pytest.mark.test_concurrency
+def test_map_esg_return_exceptions(supply_test_config, supply_test_mock_json, shared_datadir, requests_mock):
+    """
+    Test that map_esg returns the failures in place when return_exceptions is set and raises them otherwise
+    """
+    esg_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_ESG_URL']
+    mock_esg_data = json.loads((shared_datadir / 'test_esg_fixture.json').read_text())
+
+    def esg_callback(request, context):
+        if request.qs['universe'][0] == 'expired.ric':
+            context.status_code = 401
+            return supply_test_mock_json['token_expire_json']
+        context.status_code = 200
+        return mock_esg_data
+
+    requests_mock.get(url= esg_endpoint, json = esg_callback)
+    app = rdp_http_controller.RDPHTTPController(verbose = False)
+
+    responses = app.map_esg(esg_endpoint, 'token', ['A.L', 'EXPIRED.RIC', 'B.L'], return_exceptions = True)
+    assert 'data' in responses[0] and 'data' in responses[2]
+    assert isinstance(responses[1], requests.exceptions.HTTPError), 'map_esg does not return the failure in place'
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        app.map_esg(esg_endpoint, 'token', ['A.L', 'EXPIRED.RIC'])
+
+if __name__ == '__main__':
+    print('This is the RDP controller thread safety test file')
@@ -0,0 +1,122 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import time
+import threading
+from urllib.parse import parse_qs
+
+from rdp_controller import rdp_token_manager
+
+# Mock RDP Auth Service that issues numbered tokens and records the grant type of every request
+def mock_auth_service(requests_mock, auth_endpoint, expires_in = '600', refresh_expires_in = None, reject_refresh = False, delay = 0):
+    grants = []
+
+    def auth_callback(request, context):
+        time.sleep(delay)
+        grant_type = parse_qs(request.text)['grant_type'][0]
+        grants.append(grant_type)
+        if grant_type == 'refresh_token' and reject_refresh:
+            context.status_code = 400
+            return {'error': 'invalid_grant', 'error_description': 'Invalid refresh token.'}
+        context.status_code = 200
+        return {
+            'access_token': f'access_token_{len(grants)}',
+            'refresh_token': f'refresh_token_{len(grants)}',
+            'expires_in': refresh_expires_in if grant_type == 'refresh_token' and refresh_expires_in else expires_in,
+            'token_type': 'Bearer'
+        }
+
+    requests_mock.post(url= auth_endpoint, json = auth_callback)
+    return grants
+
+def create_token_manager(supply_test_config, controller, **kwargs):
+    auth_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL']
+    return rdp_token_manager.RDPTokenManager(
+        controller, auth_endpoint, supply_test_config['RDP_USERNAME'], supply_test_config['RDP_PASSWORD'],
+        supply_test_config['RDP_CLIENTID'], **kwargs)
+
+@pytest.mark.test_valid
+@pytest.mark.test_token
+def test_token_manager_caches_token(supply_test_config, supply_test_class, requests_mock):
+    """
+    Test that the token manager logs in once and serves the cached token afterwards
+    """
+    grants = mock_auth_service(requests_mock, supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL'])
+
+    with create_token_manager(supply_test_config, supply_test_class) as token_manager:
+        tokens = {token_manager.get_access_token() for _ in range(10)}
+        assert tokens == {'access_token_1'}, 'Token manager does not cache the Access Token'
+        assert grants == ['password'], 'Token manager logs in more than once'
+        assert 0 < token_manager.expires_in() <= 600
+
+@pytest.mark.test_valid
+@pytest.mark.test_token
+def test_token_manager_background_refresh(supply_test_config, supply_test_class, requests_mock):
+    """
+    Test that the token manager renews the token with the Refresh Token grant before it expires
+    """
+    grants = mock_auth_service(requests_mock, supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL'], expires_in = '1')
+
+    with create_token_manager(supply_test_config, supply_test_class, refresh_margin = 0.5) as token_manager:
+        assert token_manager.get_access_token() == 'access_token_1'
+        time.sleep(0.7)
+        assert token_manager.get_access_token() == 'access_token_2', 'Token manager does not refresh the token in the background'
+        assert grants[:2] == ['password', 'refresh_token'], 'Background refresh does not use the Refresh Token grant'
+
+@pytest.mark.test_token
+def test_token_manager_refresh_rejected(supply_test_config, supply_test_class, requests_mock):
+    """
+    Test that the token manager falls back to the Password grant when the Refresh Token is rejected
+    """
+    grants = mock_auth_service(requests_mock, supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL'], reject_refresh = True)
+
+    with create_token_manager(supply_test_config, supply_test_class, auto_refresh = False) as token_manager:
+        token_manager.invalidate(token_manager.get_access_token())
+        assert token_manager.get_access_token() == 'access_token_3', 'Token manager does not fall back to the Password grant'
+        assert grants == ['password', 'refresh_token', 'password']
+
+@pytest.mark.test_token
+def test_token_manager_single_refresh(supply_test_config, supply_test_class, requests_mock):
+    """
+    Test that concurrent callers with an expired token share a single refresh
+    """
+    grants = mock_auth_service(requests_mock, supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL'], expires_in = '0', refresh_expires_in = '600', delay = 0.1)
+
+    with create_token_manager(supply_test_config, supply_test_class, auto_refresh = False) as token_manager:
+        # The first token expires immediately, every caller needs a refresh
+        tokens = []
+        def worker():
+            tokens.append(token_manager.get_access_token())
+        threads = [threading.Thread(target = worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(tokens) == 10
+    assert set(tokens) == {'access_token_2'}, 'Concurrent callers receive different tokens'
+    assert grants == ['password', 'refresh_token'], 'Concurrent callers do not share the token refresh'
+
+@pytest.mark.empty_case
+@pytest.mark.test_token
+def test_token_manager_none_empty(supply_test_class):
+    """
+    Test that the token manager can handle none/empty input
+    """
+    with pytest.raises(TypeError) as excinfo:
+        rdp_token_manager.RDPTokenManager(supply_test_class, None, '', 'password', 'client_id')
+
+    assert 'Received invalid (None or Empty) arguments' in str(excinfo.value), 'Empty token manager returns wrong Exception description'
+
+if __name__ == '__main__':
+    print('This is the test_rdp_token_manager.py test file')
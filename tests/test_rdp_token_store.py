@@ -0,0 +1,76 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import pytest
+import time
+from urllib.parse import parse_qs
+
+from rdp_controller import rdp_token_manager
+from rdp_controller import rdp_token_store
+
+
+@pytest.mark.test_token
+def test_file_token_store_save_load(tmp_path):
+    """
+    Test that the file token store can save and load a token
+    """
+    store = rdp_token_store.FileTokenStore(tmp_path / 'rdp_token.json')
+    assert store.load() is None, 'Empty file token store returns a token'
+
+    token = {'access_token': 'access_token_1', 'refresh_token': 'refresh_token_1', 'expires_at': time.time() + 600}
+    with store.lock():
+        store.save(token)
+
+    assert rdp_token_store.FileTokenStore(tmp_path / 'rdp_token.json').load() == token, 'File token store returns wrong token'
+    assert (tmp_path / 'rdp_token.json').stat().st_mode & 0o077 == 0, 'File token store is readable by other users'
+
+    store.clear()
+    assert store.load() is None
+
+@pytest.mark.test_token
+def test_token_managers_share_file_store(supply_test_config, supply_test_class, tmp_path, requests_mock):
+    """
+    Test that token managers sharing a file token store log in only once and reuse each other's refresh
+    """
+    auth_endpoint = supply_test_config['RDP_BASE_URL'] + supply_test_config['RDP_AUTH_URL']
+    grants = []
+
+    def auth_callback(request, context):
+        grants.append(parse_qs(request.text)['grant_type'][0])
+        context.status_code = 200
+        return {'access_token': f'access_token_{len(grants)}', 'refresh_token': f'refresh_token_{len(grants)}', 'expires_in': '600'}
+
+    requests_mock.post(url= auth_endpoint, json = auth_callback)
+
+    # Each manager plays the role of one worker process with its own store instance on the same file
+    managers = [
+        rdp_token_manager.RDPTokenManager(
+            supply_test_class, auth_endpoint, supply_test_config['RDP_USERNAME'], supply_test_config['RDP_PASSWORD'],
+            supply_test_config['RDP_CLIENTID'], auto_refresh = False, store = rdp_token_store.FileTokenStore(tmp_path / 'rdp_token.json'))
+        for _ in range(3)
+    ]
+    tokens = {manager.start().get_access_token() for manager in managers}
+    assert tokens == {'access_token_1'}, 'Token managers do not share the token'
+    assert grants == ['password'], 'Every token manager logs in'
+
+    # One worker gets a 401 and renews the token, the other workers adopt the renewed token
+    managers[0].invalidate('access_token_1')
+    for manager in managers[1:]:
+        manager.invalidate('access_token_1')
+    assert {manager.get_access_token() for manager in managers} == {'access_token_2'}, 'Token managers do not share the refreshed token'
+    assert grants == ['password', 'refresh_token'], 'Token managers refresh more than once'
+
+    for manager in managers:
+        manager.stop()
+
+if __name__ == '__main__':
+    print('This is the test_rdp_token_store.py test file')